@@ -0,0 +1,108 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+"""Synthetic scenes with a realistic structure for the benchmarks."""
+
+from __future__ import annotations
+
+import random
+from decimal import Decimal
+from pathlib import Path
+from uuid import UUID
+
+from raillabel import Scene
+from raillabel.format import (
+    Camera,
+    Cuboid,
+    Frame,
+    IntrinsicsPinhole,
+    Lidar,
+    Metadata,
+    Object,
+    Point2d,
+    Point3d,
+    Poly2d,
+    Quaternion,
+    SensorReference,
+    Size3d,
+    Transform,
+)
+
+CAMERAS = ["rgb_center", "rgb_left", "rgb_right", "ir_center", "ir_left", "ir_right"]
+
+
+def build_scene(frame_count: int, track_count: int = 3, person_count: int = 10) -> Scene:
+    """Build a scene with rails in every camera and cuboids in the lidar for every frame."""
+    rng = random.Random(0)
+
+    sensors: dict = {
+        camera_id: Camera(
+            intrinsics=IntrinsicsPinhole(
+                camera_matrix=(4600, 0, 1200, 0, 0, 4600, 800, 0, 0, 0, 1, 0),
+                distortion=(0, 0, 0, 0, 0),
+                width_px=2464,
+                height_px=1600,
+            ),
+            extrinsics=Transform(pos=Point3d(0, -0.1 * i, 3), quat=Quaternion(0, 0, 0, 1)),
+            uri=f"/{camera_id}",
+        )
+        for i, camera_id in enumerate(CAMERAS)
+    }
+    sensors["lidar"] = Lidar(
+        extrinsics=Transform(pos=Point3d(0, 0, 0), quat=Quaternion(0, 0, 0, 1)), uri="/lidar"
+    )
+
+    tracks = {_uuid(rng): Object(name=f"track_{i:04}", type="track") for i in range(track_count)}
+    persons = {_uuid(rng): Object(name=f"person_{i:04}", type="person") for i in range(person_count)}
+
+    frames = {}
+    for frame_id in range(frame_count):
+        annotations: dict = {}
+        for camera_id in CAMERAS:
+            for track_index, track_id in enumerate(tracks):
+                for rail_side, offset in [("leftRail", 0), ("rightRail", 150)]:
+                    annotations[_uuid(rng)] = Poly2d(
+                        object_id=track_id,
+                        sensor_id=camera_id,
+                        points=[
+                            Point2d(300 + 500 * track_index + offset * (1 - k / 90), 1600 - 10 * k)
+                            for k in range(60)
+                        ],
+                        closed=False,
+                        attributes={"railSide": rail_side, "trackID": track_index},
+                    )
+        for person_id in persons:
+            annotations[_uuid(rng)] = Cuboid(
+                object_id=person_id,
+                sensor_id="lidar",
+                pos=Point3d(10, 1, 0),
+                quat=Quaternion(0, 0, 0, 1),
+                size=Size3d(0.5, 0.6, 1.8),
+                attributes={"age": "adult", "pose": "upright"},
+            )
+
+        frames[frame_id] = Frame(
+            timestamp=Decimal(frame_id),
+            sensors={
+                camera_id: SensorReference(
+                    timestamp=Decimal(frame_id), uri=f"/{camera_id}/{frame_id}.png"
+                )
+                for camera_id in CAMERAS
+            },
+            annotations=annotations,
+        )
+
+    return Scene(
+        metadata=Metadata(schema_version="1.0.0"),
+        sensors=sensors,
+        objects={**tracks, **persons},
+        frames=frames,
+    )
+
+
+def write_scene(path: Path, frame_count: int) -> None:
+    """Write a synthetic scene with the given number of frames to a file."""
+    path.write_text(build_scene(frame_count).to_json().model_dump_json(exclude_none=True))
+
+
+def _uuid(rng: random.Random) -> UUID:
+    return UUID(int=rng.getrandbits(128), version=4)
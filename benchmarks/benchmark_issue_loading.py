@@ -0,0 +1,58 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+"""Compare the ways a stored issues report can be loaded.
+
+Usage:
+    python benchmarks/benchmark_issue_loading.py [--issues N]
+
+The default number of issues is small, because Issue.deserialize() takes several milliseconds
+per issue.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from benchmark_issue_serialization import create_issues
+
+from raillabel_providerkit.validation import Issue, load_issues
+
+
+def deserialize_one_by_one(path: Path) -> list[Issue]:
+    with path.open() as file:
+        return [Issue.deserialize(serialized_issue) for serialized_issue in json.load(file)]
+
+
+def load_and_validate(path: Path) -> list[Issue]:
+    return load_issues(path)
+
+
+def load_trusted(path: Path) -> list[Issue]:
+    return load_issues(path, trusted=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--issues", type=int, default=5_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "scene.issues.json"
+        path.write_text(json.dumps([issue.serialize() for issue in create_issues(args.issues)]))
+
+        for name, load_function in [
+            ("Issue.deserialize per issue", deserialize_one_by_one),
+            ("load_issues", load_and_validate),
+            ("load_issues(trusted=True)", load_trusted),
+        ]:
+            start = time.perf_counter()
+            load_function(path)
+            print(f"{name:28} {time.perf_counter() - start:6.2f} s for {args.issues} issues")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+"""Compare the memory used by many issues with and without slots and interned strings.
+
+Usage:
+    python benchmarks/benchmark_issue_memory.py [--issues N]
+
+The issues are created like the ontology check creates them for a large scene: every annotation
+has its own copies of the sensor id and attribute names, as they are parsed from the scene file.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import tracemalloc
+from dataclasses import dataclass
+from uuid import UUID
+
+from raillabel_providerkit.validation import Issue, IssueIdentifiers, IssueType
+
+
+@dataclass
+class DictIssueIdentifiers:
+    """IssueIdentifiers like they were before, with a per-instance __dict__."""
+
+    annotation: UUID | None = None
+    annotation_type: str | None = None
+    attribute: str | None = None
+    frame: int | None = None
+    object: UUID | None = None
+    object_type: str | None = None
+    sensor: str | None = None
+
+
+@dataclass
+class DictIssue:
+    """Issue like it was before, with a per-instance __dict__."""
+
+    type: IssueType
+    identifiers: DictIssueIdentifiers | list[str | int]
+    reason: str | None = None
+
+
+def parsed_annotations(count: int) -> list[dict]:
+    """Return annotation data whose strings are separate objects, like after parsing a file."""
+    sensors = ["rgb_center", "rgb_left", "rgb_right", "ir_center", "lidar"]
+    return json.loads(
+        json.dumps(
+            [
+                {"sensor": sensors[i % len(sensors)], "attribute": "occlusion", "frame": i // 100}
+                for i in range(count)
+            ]
+        )
+    )
+
+
+def create_issues(issue_class: type, identifiers_class: type, annotations: list[dict]) -> list:
+    object_id = UUID(int=0)
+    return [
+        issue_class(
+            type=IssueType.ATTRIBUTE_MISSING,
+            identifiers=identifiers_class(
+                annotation=UUID(int=i + 1),
+                annotation_type="Bbox",
+                attribute=annotation["attribute"],
+                frame=annotation["frame"],
+                object=object_id,
+                object_type="person",
+                sensor=annotation["sensor"],
+            ),
+        )
+        for i, annotation in enumerate(annotations)
+    ]
+
+
+def measure(issue_class: type, identifiers_class: type, count: int) -> tuple[float, float]:
+    annotations = parsed_annotations(count)
+    start = time.perf_counter()
+    create_issues(issue_class, identifiers_class, annotations)
+    duration = time.perf_counter() - start
+
+    annotations = parsed_annotations(count)
+    tracemalloc.start()
+    issues = create_issues(issue_class, identifiers_class, annotations)
+    del annotations  # only the strings that are still referenced by the issues are counted
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del issues
+    return duration, memory
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--issues", type=int, default=500_000)
+    args = parser.parse_args()
+
+    for name, issue_class, identifiers_class in [
+        ("dataclass with __dict__", DictIssue, DictIssueIdentifiers),
+        ("slots + interned strings", Issue, IssueIdentifiers),
+    ]:
+        duration, memory = measure(issue_class, identifiers_class, args.issues)
+        print(
+            f"{name:26} {duration:6.2f} s   {memory / 1e6:8.1f} MB"
+            f" ({memory / args.issues:.0f} bytes per issue)"
+        )
+
+
+if __name__ == "__main__":
+    main()
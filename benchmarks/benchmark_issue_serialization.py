@@ -0,0 +1,95 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+"""Compare the runtime of Issue.serialize() with the previous implementation.
+
+Usage:
+    python benchmarks/benchmark_issue_serialization.py [--issues N] [--repeat N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from uuid import UUID
+
+from raillabel_providerkit.validation import Issue, IssueIdentifiers, IssueType
+
+
+def serialize_previously(issue: Issue) -> dict:
+    """Serialize the issue like Issue.serialize() did before, by removing the empty fields."""
+    identifiers = issue.identifiers
+    return _clean_dict(
+        {
+            "type": str(issue.type.value),
+            "identifiers": (
+                _clean_dict(
+                    {
+                        "annotation": str(identifiers.annotation),
+                        "annotation_type": identifiers.annotation_type,
+                        "attribute": identifiers.attribute,
+                        "frame": identifiers.frame,
+                        "object": str(identifiers.object),
+                        "object_type": identifiers.object_type,
+                        "sensor": identifiers.sensor,
+                    }
+                )
+                if isinstance(identifiers, IssueIdentifiers)
+                else identifiers
+            ),
+            "reason": issue.reason,
+        }
+    )
+
+
+def _clean_dict(d: dict) -> dict:
+    return {k: v for k, v in d.items() if str(v) != "None"}
+
+
+def serialize(issue: Issue) -> dict:
+    return issue.serialize()
+
+
+def create_issues(count: int) -> list[Issue]:
+    """Create a mix of issues like a validation run of a large scene produces."""
+    issues = []
+    for i in range(count):
+        if i % 4 == 0:
+            identifiers = IssueIdentifiers(frame=i // 100, sensor="rgb_center")
+            reason = None
+        else:
+            identifiers = IssueIdentifiers(
+                annotation=UUID(int=i),
+                annotation_type="Bbox",
+                attribute="occlusion",
+                frame=i // 100,
+                object=UUID(int=i // 100),
+                object_type="person",
+                sensor="rgb_center",
+            )
+            reason = "The attribute is missing."
+        issues.append(Issue(IssueType.ATTRIBUTE_MISSING, identifiers, reason))
+    return issues
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--issues", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    issues = create_issues(args.issues)
+    for name, serialize_function in [
+        ("previous implementation", serialize_previously),
+        ("Issue.serialize", serialize),
+    ]:
+        durations = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            for issue in issues:
+                serialize_function(issue)
+            durations.append(time.perf_counter() - start)
+        print(f"{name:24} {min(durations):6.2f} s for {args.issues} issues")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+"""Compare the runtime and peak memory of the ways a scene file can be parsed.
+
+Usage:
+    python benchmarks/benchmark_scene_loading.py [SCENE_PATH] [--frames N] [--repeat N]
+
+If no scene is provided, a synthetic scene with the given number of frames is generated.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from _synthetic_scene import write_scene
+from raillabel.json_format import JSONScene
+
+from raillabel_providerkit.validation.validate_schema.validate_schema import (
+    _parse_json,
+    _parse_scene,
+)
+
+
+def parse_with_json_module(path: Path) -> JSONScene | None:
+    """Parse the scene like validate() did before, via an intermediate dict."""
+    with path.open() as scene_file:
+        scene_dict = json.load(scene_file)
+    return _parse_scene(scene_dict)[0]
+
+
+def parse_with_pydantic(path: Path) -> JSONScene | None:
+    """Parse the scene from its raw bytes with pydantic-core."""
+    return _parse_json(path.read_bytes(), JSONScene)[0]
+
+
+def measure(parse_function, path: Path, repeat: int) -> tuple[float, float]:
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse_function(path)
+        durations.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    parse_function(path)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return min(durations), peak_memory
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("scene_path", type=Path, nargs="?", default=None)
+    parser.add_argument("--frames", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        scene_path = args.scene_path
+        if scene_path is None:
+            scene_path = Path(temp_dir) / "scene.json"
+            write_scene(scene_path, args.frames)
+
+        file_size = scene_path.stat().st_size
+        print(f"{scene_path.name}: {file_size / 1e6:.1f} MB")
+
+        for name, parse_function in [
+            ("json.load + JSONScene(**dict)", parse_with_json_module),
+            ("JSONScene.model_validate_json", parse_with_pydantic),
+        ]:
+            duration, peak_memory = measure(parse_function, scene_path, args.repeat)
+            print(
+                f"{name:32} {duration:8.3f} s   peak memory {peak_memory / 1e6:8.1f} MB"
+                f" ({peak_memory / file_size:.1f}x file size)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -7,7 +7,10 @@ from importlib import metadata
 from . import format
 from .convert import loader_classes
 from .convert.convert import convert
-from .validation.validate import validate
+from .validation.issue import load_issues
+from .validation.metrics import ValidationMetrics
+from .validation.validate import iter_issues, validate, validate_incremental
+from .validation.validate_ontology.validate_ontology import load_ontology
 
 try:
     __version__ = metadata.version("raillabel-providerkit")
@@ -19,5 +22,10 @@ __all__ = [
     "format",
     "loader_classes",
     "convert",
+    "ValidationMetrics",
+    "iter_issues",
+    "load_issues",
+    "load_ontology",
     "validate",
+    "validate_incremental",
 ]
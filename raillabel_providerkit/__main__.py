@@ -1,53 +1,158 @@
 # Copyright DB InfraGO AG and contributors
 # SPDX-License-Identifier: Apache-2.0
 
+from __future__ import annotations
+
 import csv
+import gzip
+import importlib.util
+import io
 import json
+import os
+import sys
+import typing as t
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import ExitStack, contextmanager
+from functools import lru_cache
 from pathlib import Path
 
 import click
 import jsonschema
 from tqdm import tqdm
 
-from raillabel_providerkit import validate
-from raillabel_providerkit.validation.issue import ISSUES_SCHEMA, Issue
+from raillabel_providerkit import __version__, iter_issues, load_ontology
+from raillabel_providerkit._util._result_cache import ResultCache
+from raillabel_providerkit.validation._checks import CHECK_NAMES, _select_checks
+from raillabel_providerkit.validation.issue import ISSUES_SCHEMA, Issue, IssueIdentifiers
+from raillabel_providerkit.validation.metrics import ValidationMetrics, _measure
+from raillabel_providerkit.validation.validate_ontology._ontology_classes import _Ontology
+
+if t.TYPE_CHECKING:
+    import pyarrow as pa
+
+_worker_ontology: _Ontology | None = None
+_worker_result_cache: ResultCache | None = None
+
+# The columns of the Arrow table and whether they are dictionary-encoded. Except for the
+# annotation uuids and the frame numbers, the values repeat a lot across the issues of a delivery.
+_ARROW_COLUMNS = {
+    "type": True,
+    "frame": False,
+    "sensor": True,
+    "object": True,
+    "object_type": True,
+    "annotation": False,
+    "attribute": True,
+    "schema_path": True,
+    "reason": True,
+    "scene": True,
+}
+
+# Large enough that the output of a scene is written in a few sequential chunks
+_OUTPUT_BUFFER_SIZE = 1024 * 1024
 
 
-def store_issues_to_json(issues: list[Issue], filepath: Path) -> None:
+def store_issues_to_json(issues: Iterable[Issue], filepath: Path) -> None:
     """Store the given issues in a .json file under the given filepath.
 
+    The issues are written one after another while they are iterated over, so they can be
+    provided by a generator like iter_issues().
+
     Parameters
     ----------
-    issues : list[Issue]
+    issues : Iterable[Issue]
         The issues to store
     filepath : Path
         The path to the .json file to store the issues in
     """
-    issues_serialized = [issue.serialize() for issue in issues]
-    if not _adheres_to_issues_schema(issues_serialized):
-        raise AssertionError
-    issues_json = json.dumps(issues_serialized, indent=2)
     with Path.open(filepath, "w") as file:
-        file.write(issues_json)
+        separator = "[\n  "
+        for issue in issues:
+            issue_serialized = issue.serialize()
+
+            # Same layout as json.dumps() of the whole list with indent=2
+            file.write(separator + json.dumps(issue_serialized, indent=2).replace("\n", "\n  "))
+            separator = ",\n  "
+
+        file.write("[]" if separator == "[\n  " else "\n]")
+
+
+def store_issues_to_jsonl(
+    issues: Iterable[Issue],
+    filepath: Path,
+    compression: t.Literal["gzip", "zstd"] | None = None,
+) -> None:
+    """Store the given issues in a JSON Lines file under the given filepath.
+
+    Every issue is written as compact JSON on its own line. The output is buffered, so that it
+    is written in a few large chunks even for a large number of issues.
+
+    Parameters
+    ----------
+    issues : Iterable[Issue]
+        The issues to store
+    filepath : Path
+        The path to the .jsonl file to store the issues in
+    compression : t.Literal["gzip", "zstd"] | None, optional
+        The compression of the file, by default the file is not compressed. zstd requires the
+        zstandard package.
+    """
+    with _open_jsonl_file(filepath, compression) as file:
+        _write_issues_as_jsonl(issues, file)
+
 
+def _write_issues_as_jsonl(
+    issues: Iterable[Issue], file: t.TextIO, scene: str | None = None
+) -> None:
+    for issue in issues:
+        issue_serialized = issue.serialize()
+        if scene is not None:
+            issue_serialized["scene"] = scene
+        file.write(json.dumps(issue_serialized, separators=(",", ":")))
+        file.write("\n")
+
+
+@contextmanager
+def _open_jsonl_file(
+    filepath: Path, compression: t.Literal["gzip", "zstd"] | None
+) -> Iterator[t.TextIO]:
+    with ExitStack() as exit_stack:
+        output_file = exit_stack.enter_context(
+            Path.open(filepath, "wb", buffering=_OUTPUT_BUFFER_SIZE)
+        )
+        binary_file: t.BinaryIO | gzip.GzipFile = output_file
+        if compression == "gzip":
+            binary_file = exit_stack.enter_context(gzip.GzipFile(fileobj=output_file, mode="wb"))
+        elif compression == "zstd":
+            import zstandard
+
+            binary_file = exit_stack.enter_context(
+                zstandard.ZstdCompressor().stream_writer(output_file, closefd=False)
+            )
 
-def _adheres_to_issues_schema(
-    data: list[dict[str, str | dict[str, str | int] | list[str | int]]],
-) -> bool:
-    try:
-        jsonschema.validate(data, ISSUES_SCHEMA)
-    except jsonschema.ValidationError:
-        return False
+        # The text wrapper must not close the file itself, which is done by the exit stack
+        text_file = io.TextIOWrapper(binary_file, encoding="utf-8", newline="\n")
+        try:
+            yield text_file
+        finally:
+            text_file.flush()
+            text_file.detach()
 
-    return True
 
+def _suffix(compression: t.Literal["gzip", "zstd"] | None) -> str:
+    return {None: "", "gzip": ".gz", "zstd": ".zst"}[compression]
 
-def store_issues_to_csv(issues: list[Issue], filepath: Path) -> None:
+
+def store_issues_to_csv(issues: Iterable[Issue], filepath: Path) -> None:
     """Store the given issues in a .csv file under the given filepath.
 
+    The issues are written one after another while they are iterated over, so they can be
+    provided by a generator like iter_issues().
+
     Parameters
     ----------
-    issues : list[Issue]
+    issues : Iterable[Issue]
         The issues to store
     filepath : Path
         The path to the .csv file to store the issues in
@@ -57,7 +162,7 @@ def store_issues_to_csv(issues: list[Issue], filepath: Path) -> None:
     TypeError
         If the issues are malformed after serialization
     """
-    issues_serialized = [issue.serialize() for issue in issues]
+    issues_serialized = (issue.serialize() for issue in issues)
 
     file = Path.open(filepath, "w")
 
@@ -104,6 +209,84 @@ def store_issues_to_csv(issues: list[Issue], filepath: Path) -> None:
     file.close()
 
 
+def store_issues_to_parquet(
+    issues: Iterable[Issue], filepath: Path, scene: str | None = None
+) -> None:
+    """Store the given issues in a .parquet file under the given filepath.
+
+    The columns are described in issues_to_arrow_table(). Requires the pyarrow package.
+
+    Parameters
+    ----------
+    issues : Iterable[Issue]
+        The issues to store
+    filepath : Path
+        The path to the .parquet file to store the issues in
+    scene : str | None, optional
+        The path of the scene the issues belong to, which is stored in the scene column. By
+        default the column is empty.
+    """
+    import pyarrow.parquet as pq
+
+    pq.write_table(issues_to_arrow_table(issues, scene), filepath)
+
+
+def issues_to_arrow_table(issues: Iterable[Issue], scene: str | None = None) -> pa.Table:
+    """Convert the given issues into a pyarrow table with one row per issue.
+
+    The table has the columns type, frame, sensor, object, object_type, annotation, attribute,
+    schema_path, reason and scene. Identifiers that are not set are null. schema_path is only set
+    for schema issues and contains their identifiers in the same format as the .csv output. All
+    string columns except annotation are dictionary-encoded. Requires the pyarrow package.
+
+    Parameters
+    ----------
+    issues : Iterable[Issue]
+        The issues to convert
+    scene : str | None, optional
+        The path of the scene the issues belong to, which is stored in the scene column. By
+        default the column is empty.
+
+    Returns
+    -------
+    pa.Table
+        The issues as a columnar table
+    """
+    import pyarrow as pa
+
+    columns: dict[str, list[str | int | None]] = {name: [] for name in _ARROW_COLUMNS}
+    for issue in issues:
+        identifiers = issue.identifiers
+        if not isinstance(identifiers, IssueIdentifiers):
+            # It's a schema issue, so there are no standard identifiers
+            schema_path = str(identifiers)
+            identifiers = IssueIdentifiers()
+        else:
+            schema_path = None
+
+        columns["type"].append(issue.type.value)
+        columns["frame"].append(identifiers.frame)
+        columns["sensor"].append(identifiers.sensor)
+        columns["object"].append(_str_or_none(identifiers.object))
+        columns["object_type"].append(identifiers.object_type)
+        columns["annotation"].append(_str_or_none(identifiers.annotation))
+        columns["attribute"].append(identifiers.attribute)
+        columns["schema_path"].append(schema_path)
+        columns["reason"].append(issue.reason)
+        columns["scene"].append(scene)
+
+    arrays = []
+    for name, is_dictionary_encoded in _ARROW_COLUMNS.items():
+        array = pa.array(columns[name], type=pa.int64() if name == "frame" else pa.string())
+        arrays.append(array.dictionary_encode() if is_dictionary_encoded else array)
+
+    return pa.Table.from_arrays(arrays, names=list(_ARROW_COLUMNS))
+
+
+def _str_or_none(value: object) -> str | None:
+    return str(value) if value is not None else None
+
+
 @click.command()
 @click.argument(
     "annotations_folder",
@@ -128,6 +311,98 @@ def store_issues_to_csv(issues: list[Issue], filepath: Path) -> None:
     help="Create human-readable .csv files containing the issues",
 )
 @click.option("--use-json/--no-json", default=True, help="Create .json files containing the issues")
+@click.option(
+    "--use-jsonl/--no-jsonl",
+    default=False,
+    help="Create .jsonl files containing one issue per line",
+)
+@click.option(
+    "--use-parquet/--no-parquet",
+    default=False,
+    help="Create .parquet files containing the issues for loading them into dataframes",
+)
+@click.option(
+    "--compression",
+    type=click.Choice(["gzip", "zstd"]),
+    default=None,
+    help="Compress the .jsonl files, by default they are not compressed",
+)
+@click.option(
+    "--single-output",
+    is_flag=True,
+    help=(
+        "Write the issues of all scenes into a single issues.jsonl file, where every issue is"
+        " tagged with the path of its scene. Requires --use-jsonl"
+    ),
+)
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=1,
+    help="The number of scenes to validate in parallel (one process per job), by default 1",
+)
+@click.option(
+    "--stream-frames",
+    is_flag=True,
+    help=(
+        "Parse and validate the frames of every scene one at a time, so that very large scenes do"
+        " not need to fit into memory at once"
+    ),
+)
+@click.option(
+    "--only",
+    type=click.Choice(CHECK_NAMES),
+    multiple=True,
+    help="Only run this check, can be given multiple times. By default all checks are run",
+)
+@click.option(
+    "--skip",
+    type=click.Choice(CHECK_NAMES),
+    multiple=True,
+    help="Do not run this check, can be given multiple times",
+)
+@click.option(
+    "--metrics",
+    "metrics_path",
+    type=click.Path(file_okay=True, dir_okay=False, path_type=Path),
+    default=None,
+    help=(
+        "Write the wall and CPU time of every validation stage, the number of frames and"
+        " annotations and the number of issues per type of every scene into this .jsonl file"
+    ),
+)
+@click.option(
+    "--verify-output",
+    is_flag=True,
+    help=(
+        "Check every issue against the issues JSON schema before it is stored. This is only"
+        " needed for debugging, as it slows down writing the output considerably"
+    ),
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help=(
+        "Validate every scene again instead of reusing the stored issues of scenes that have"
+        " already been validated with the same ontology, version and options"
+    ),
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False, dir_okay=True, path_type=Path),
+    default=None,
+    help=(
+        "The directory in which the issues of validated scenes are cached, by default"
+        " $XDG_CACHE_HOME/raillabel_providerkit or ~/.cache/raillabel_providerkit"
+    ),
+)
+@click.option(
+    "--cache-size",
+    type=click.IntRange(min=0),
+    default=1024,
+    help="The size in MB above which the least recently used cache entries are removed",
+)
 @click.option("-q", "--quiet", is_flag=True, help="Disable progress bars")
 def run_raillabel_providerkit(  # noqa: PLR0913
     annotations_folder: Path,
@@ -135,32 +410,344 @@ def run_raillabel_providerkit(  # noqa: PLR0913
     ontology: Path | None,
     use_csv: bool,
     use_json: bool,
+    use_jsonl: bool,
+    use_parquet: bool,
+    compression: t.Literal["gzip", "zstd"] | None,
+    single_output: bool,
+    jobs: int,
+    stream_frames: bool,
+    only: tuple[str, ...],
+    skip: tuple[str, ...],
+    metrics_path: Path | None,
+    verify_output: bool,
+    no_cache: bool,
+    cache_dir: Path | None,
+    cache_size: int,
     quiet: bool,
 ) -> None:
     """Check a raillabel scene's annotations for errors."""
     # Stop early if there is nothing to output
-    if not use_csv and not use_json:
+    if not use_csv and not use_json and not use_jsonl and not use_parquet:
         return
 
+    _check_option_usage(ontology, use_jsonl, use_parquet, compression, single_output, only)
+
+    checks = tuple(
+        check.name
+        for check in _select_checks({"ontology": ontology is not None}, only or None, skip)
+    )
+    if "ontology" not in checks:
+        ontology = None  # the ontology does not need to be loaded
+
     # Ensure output folder exists
     output_folder.mkdir(parents=True, exist_ok=True)
 
     # Get all scenes (.json files) in the folder and subfolders but ignore hidden folders
-    scene_files = list(
+    scene_files = sorted(
         set(annotations_folder.glob("**/*.json")) - set(annotations_folder.glob(".*/**/*"))
     )
 
-    for scene_path in tqdm(scene_files, desc="Validating files", disable=quiet):
-        issues = validate(
-            scene_path,
+    result_cache = None
+    if not no_cache:
+        result_cache = ResultCache(
+            cache_dir if cache_dir is not None else _default_cache_dir(),
             ontology,
+            {"version": __version__, "stream_frames": stream_frames, "checks": checks},
+        )
+
+    with ExitStack() as exit_stack:
+        single_output_file = None
+        if single_output:
+            single_output_file = exit_stack.enter_context(
+                _open_jsonl_file(
+                    output_folder / ("issues.jsonl" + _suffix(compression)), compression
+                )
+            )
+
+        metrics_file = None
+        if metrics_path is not None:
+            metrics_file = exit_stack.enter_context(metrics_path.open("w"))
+
+        issue_store = _IssueStore(
+            annotations_folder,
+            output_folder,
+            use_csv=use_csv,
+            use_json=use_json,
+            use_jsonl=use_jsonl,
+            use_parquet=use_parquet,
+            compression=compression,
+            single_output_file=single_output_file,
+            verify_output=verify_output,
+        )
+
+        try:
+            if jobs > 1:
+                _validate_in_process_pool(
+                    scene_files,
+                    issue_store,
+                    ontology,
+                    result_cache,
+                    jobs,
+                    stream_frames,
+                    checks,
+                    metrics_file,
+                    quiet,
+                )
+            else:
+                compiled_ontology = load_ontology(ontology) if ontology is not None else None
+                for scene_path in tqdm(scene_files, desc="Validating files", disable=quiet):
+                    metrics = (
+                        issue_store.create_metrics(scene_path) if metrics_file is not None else None
+                    )
+                    issues = _validate_scene(
+                        scene_path, compiled_ontology, stream_frames, checks, result_cache, metrics
+                    )
+                    _store_scene(issue_store, issues, scene_path, metrics, metrics_file)
+        finally:
+            if result_cache is not None:
+                result_cache.evict(cache_size * 1_000_000)
+
+
+def _check_option_usage(  # noqa: PLR0913
+    ontology: Path | None,
+    use_jsonl: bool,
+    use_parquet: bool,
+    compression: t.Literal["gzip", "zstd"] | None,
+    single_output: bool,
+    only: tuple[str, ...],
+) -> None:
+    """Raise a click.UsageError if options are combined that can not be used together."""
+    if single_output and not use_jsonl:
+        msg = "--single-output can only be used together with --use-jsonl."
+        raise click.UsageError(msg)
+    if compression == "zstd" and importlib.util.find_spec("zstandard") is None:
+        msg = (
+            "--compression zstd requires the zstandard package. It can be installed with"
+            " 'pip install raillabel-providerkit[zstd]'."
+        )
+        raise click.UsageError(msg)
+    if use_parquet and importlib.util.find_spec("pyarrow") is None:
+        msg = (
+            "--use-parquet requires the pyarrow package. It can be installed with"
+            " 'pip install raillabel-providerkit[parquet]'."
+        )
+        raise click.UsageError(msg)
+    if "ontology" in only and ontology is None:
+        msg = "--only ontology requires an ontology to be provided with --ontology."
+        raise click.UsageError(msg)
+
+
+def _validate_in_process_pool(  # noqa: PLR0913
+    scene_files: list[Path],
+    issue_store: _IssueStore,
+    ontology: Path | None,
+    result_cache: ResultCache | None,
+    jobs: int,
+    stream_frames: bool,
+    checks: tuple[str, ...],
+    metrics_file: t.TextIO | None,
+    quiet: bool,
+) -> None:
+    failed_scenes = []
+
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker, initargs=(ontology, result_cache)
+    ) as executor:
+        futures = {
+            executor.submit(
+                _validate_in_worker,
+                scene_path,
+                stream_frames,
+                checks,
+                issue_store.create_metrics(scene_path) if metrics_file is not None else None,
+            ): scene_path
+            for scene_path in scene_files
+        }
+
+        for future in tqdm(
+            as_completed(futures), total=len(futures), desc="Validating files", disable=quiet
+        ):
+            scene_path = futures[future]
+            try:
+                issues, metrics = future.result()
+            except Exception as error:  # noqa: BLE001
+                failed_scenes.append(scene_path)
+                tqdm.write(f"Could not validate {scene_path}: {error!r}", file=sys.stderr)
+                continue
+
+            _store_scene(issue_store, issues, scene_path, metrics, metrics_file)
+
+    if len(failed_scenes) > 0:
+        msg = f"{len(failed_scenes)} scene(s) could not be validated."
+        raise click.ClickException(msg)
+
+
+def _init_worker(ontology: Path | None, result_cache: ResultCache | None) -> None:
+    """Load the ontology once per worker process instead of once per scene."""
+    global _worker_ontology, _worker_result_cache  # noqa: PLW0603
+    _worker_ontology = load_ontology(ontology) if ontology is not None else None
+    _worker_result_cache = result_cache
+
+
+def _validate_in_worker(
+    scene_path: Path,
+    stream_frames: bool,
+    checks: tuple[str, ...],
+    metrics: ValidationMetrics | None,
+) -> tuple[list[Issue], ValidationMetrics | None]:
+    # The issues are returned in the same order in which iter_issues() yields them, so that the
+    # output does not depend on the number of jobs
+    issues = list(
+        _validate_scene(
+            scene_path, _worker_ontology, stream_frames, checks, _worker_result_cache, metrics
         )
+    )
+    return issues, metrics
+
+
+def _validate_scene(  # noqa: PLR0913
+    scene_path: Path,
+    ontology: _Ontology | None,
+    stream_frames: bool,
+    checks: tuple[str, ...],
+    result_cache: ResultCache | None,
+    metrics: ValidationMetrics | None = None,
+) -> Iterable[Issue]:
+    """Validate the scene or load its issues from the cache, if it has been validated before."""
+    if result_cache is None:
+        return iter_issues(
+            scene_path, ontology, stream_frames=stream_frames, only=checks, metrics=metrics
+        )
+
+    with _measure(metrics, "read_cache"):
+        key = result_cache.key(scene_path)
+        issues = result_cache.get(key)
+
+    if issues is None:
+        # The entry is written while the issues are stored, so they are still streamed
+        return result_cache.put_while_iterating(
+            key,
+            iter_issues(
+                scene_path, ontology, stream_frames=stream_frames, only=checks, metrics=metrics
+            ),
+        )
+
+    if metrics is not None:
+        for issue in issues:
+            metrics.count_issue(issue)
+    return issues
+
+
+def _store_scene(
+    issue_store: _IssueStore,
+    issues: Iterable[Issue],
+    scene_path: Path,
+    metrics: ValidationMetrics | None,
+    metrics_file: t.TextIO | None,
+) -> None:
+    """Store the issues of the scene and append its metrics to the metrics file."""
+    if metrics is None or metrics_file is None:
+        issue_store.store(issues, scene_path)
+        return
+
+    # The issues are collected first, so that validating the scene is not measured as part of
+    # the serialization
+    issues = list(issues)
+    with metrics.measure("serialization"):
+        issue_store.store(issues, scene_path)
+
+    metrics_file.write(json.dumps(metrics.serialize(), separators=(",", ":")))
+    metrics_file.write("\n")
+
+
+def _default_cache_dir() -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    return (Path(cache_home) if cache_home else Path.home() / ".cache") / "raillabel_providerkit"
+
+
+class _IssueStore:
+    """Stores the issues of every scene in the output formats selected in the CLI.
+
+    If a single output file is provided, the .jsonl output of all scenes is appended to it
+    instead of creating one small file per scene. Every issue is then tagged with the path of
+    its scene relative to the annotations folder.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        annotations_folder: Path,
+        output_folder: Path,
+        use_csv: bool,
+        use_json: bool,
+        use_jsonl: bool,
+        use_parquet: bool,
+        compression: t.Literal["gzip", "zstd"] | None,
+        single_output_file: t.TextIO | None,
+        verify_output: bool,
+    ) -> None:
+        self.annotations_folder = annotations_folder
+        self.output_folder = output_folder
+        self.use_csv = use_csv
+        self.use_json = use_json
+        self.use_jsonl = use_jsonl
+        self.use_parquet = use_parquet
+        self.compression = compression
+        self.single_output_file = single_output_file
+        self.verify_output = verify_output
+
+    def create_metrics(self, scene_path: Path) -> ValidationMetrics:
+        """Create the metrics of a scene, tagged with its path like the single output."""
+        return ValidationMetrics(scene=scene_path.relative_to(self.annotations_folder).as_posix())
+
+    def store(self, issues: Iterable[Issue], scene_path: Path) -> None:
+        """Store the issues of a scene in all selected output formats."""
+        if self.verify_output:
+            issues = _verify_issues(issues, scene_path)
+        if self.use_json + self.use_csv + self.use_jsonl + self.use_parquet > 1:
+            # All files are written from the same issues, so they need to be collected first
+            issues = list(issues)
 
         scene_name = scene_path.name
-        if use_json:
-            store_issues_to_json(issues, output_folder / scene_name.replace(".json", ".issues.json"))
-        if use_csv:
-            store_issues_to_csv(issues, output_folder / scene_name.replace(".json", ".issues.csv"))
+        scene = scene_path.relative_to(self.annotations_folder).as_posix()
+        if self.use_json:
+            store_issues_to_json(
+                issues, self.output_folder / scene_name.replace(".json", ".issues.json")
+            )
+        if self.use_csv:
+            store_issues_to_csv(
+                issues, self.output_folder / scene_name.replace(".json", ".issues.csv")
+            )
+        if self.use_parquet:
+            store_issues_to_parquet(
+                issues, self.output_folder / scene_name.replace(".json", ".issues.parquet"), scene
+            )
+        if self.use_jsonl and self.single_output_file is not None:
+            _write_issues_as_jsonl(issues, self.single_output_file, scene)
+        elif self.use_jsonl:
+            jsonl_name = scene_name.replace(".json", ".issues.jsonl") + _suffix(self.compression)
+            store_issues_to_jsonl(issues, self.output_folder / jsonl_name, self.compression)
+
+
+def _verify_issues(issues: Iterable[Issue], scene_path: Path) -> Iterator[Issue]:
+    """Yield the issues after checking that they adhere to the issues JSON schema."""
+    validator = _get_issues_schema_validator()
+    for issue in issues:
+        error = jsonschema.exceptions.best_match(validator.iter_errors(issue.serialize()))
+        if error is not None:
+            msg = (
+                f"An issue of {scene_path} does not adhere to the issues schema:"
+                f" ${error.json_path[1:]}: {error.message}"
+            )
+            raise click.ClickException(msg)
+        yield issue
+
+
+@lru_cache(maxsize=1)
+def _get_issues_schema_validator() -> jsonschema.Draft7Validator:
+    # Single issues are checked, so that they can be verified while they are written
+    return jsonschema.Draft7Validator(
+        schema={"definitions": ISSUES_SCHEMA["definitions"], "$ref": "#/definitions/issue"}
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,121 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from raillabel_providerkit.validation.issue import Issue, load_issues
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+class ResultCache:
+    """On-disk cache of the issues of already validated scenes.
+
+    Every entry is stored under a hash of the scene file, the ontology file and the options of
+    the validation, so a changed scene, ontology, version or option never returns a stale result.
+    The entries are compact .json files, which are loaded without validating them again.
+
+    Parameters
+    ----------
+    directory : Path
+        The directory in which the entries are stored. It is created with the first entry.
+    ontology : Path | None
+        The ontology file the scenes are validated against.
+    options : dict[str, object]
+        Everything else that influences the issues, like the version of raillabel_providerkit
+        and the options of the validation. Must be serializable to JSON.
+    """
+
+    def __init__(self, directory: Path, ontology: Path | None, options: dict[str, object]) -> None:
+        self.directory = directory
+        self._options_key = json.dumps(
+            {
+                "ontology": _hash_file(ontology) if ontology is not None else None,
+                "options": options,
+            },
+            sort_keys=True,
+        )
+
+    def key(self, scene_path: Path) -> str:
+        """Return the key under which the issues of the scene file are stored."""
+        return _hash_file(scene_path, self._options_key.encode())
+
+    def get(self, key: str) -> list[Issue] | None:
+        """Return the stored issues or None if there is no usable entry for the key.
+
+        Entries that can not be loaded (for example because they have been modified or written
+        by an incompatible version) are treated like missing entries and overwritten by put().
+        """
+        entry_path = self._entry_path(key)
+        try:
+            issues = load_issues(entry_path, trusted=True)
+        except (FileNotFoundError, ValueError, KeyError, TypeError, AttributeError):
+            return None
+
+        # The modification time marks the entry as recently used for evict()
+        entry_path.touch()
+        return issues
+
+    def put(self, key: str, issues: Iterable[Issue]) -> None:
+        """Store the issues under the key."""
+        for _ in self.put_while_iterating(key, issues):
+            pass
+
+    def put_while_iterating(self, key: str, issues: Iterable[Issue]) -> Iterator[Issue]:
+        """Yield the issues and store them under the key one after another while doing so.
+
+        This way the issues never need to be held in memory at once. The entry is only stored
+        once the last issue has been yielded, so if the iteration is stopped early (for example
+        because the validation failed), no entry is stored.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # Entries are replaced atomically, so that parallel processes never read partial entries
+        entry_path = self._entry_path(key)
+        temporary_path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.tmp")
+        try:
+            with temporary_path.open("w") as entry_file:
+                separator = "["
+                for issue in issues:
+                    entry_file.write(separator + json.dumps(issue.serialize()))
+                    separator = ","
+                    yield issue
+                entry_file.write("[]" if separator == "[" else "]")
+            temporary_path.replace(entry_path)
+        finally:
+            temporary_path.unlink(missing_ok=True)
+
+    def evict(self, max_size: int) -> None:
+        """Remove the least recently used entries until the cache is at most max_size bytes."""
+        if not self.directory.exists():
+            return
+
+        entries = []
+        for entry_path in self.directory.glob("*.json"):
+            stat = entry_path.stat()
+            entries.append((stat.st_mtime_ns, stat.st_size, entry_path))
+        entries.sort()
+
+        size = sum(entry_size for _, entry_size, _ in entries)
+        for _, entry_size, entry_path in entries:
+            if size <= max_size:
+                break
+            entry_path.unlink(missing_ok=True)
+            size -= entry_size
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+
+def _hash_file(path: Path, prefix: bytes = b"") -> str:
+    digest = hashlib.sha256(prefix)
+    with path.open("rb") as file:
+        while chunk := file.read(_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -2,12 +2,13 @@
 # SPDX-License-Identifier: Apache-2.0
 """Package for validating raillabel data regarding the format requirements."""
 
-from .issue import Issue, IssueIdentifiers, IssueType
+from .issue import Issue, IssueIdentifiers, IssueType, load_issues
+from .metrics import StageMetrics, ValidationMetrics
 from .validate_dimensions.validate_dimensions import validate_dimensions
 from .validate_empty_frames.validate_empty_frames import validate_empty_frames
 from .validate_horizon.validate_horizon import validate_horizon
 from .validate_missing_ego_track.validate_missing_ego_track import validate_missing_ego_track
-from .validate_ontology.validate_ontology import validate_ontology
+from .validate_ontology.validate_ontology import load_ontology, validate_ontology
 from .validate_rail_side.validate_rail_side import validate_rail_side
 from .validate_schema.validate_schema import validate_schema
 from .validate_sensors.validate_sensors import validate_sensors
@@ -17,6 +18,10 @@ __all__ = [
     "Issue",
     "IssueIdentifiers",
     "IssueType",
+    "StageMetrics",
+    "ValidationMetrics",
+    "load_issues",
+    "load_ontology",
     "validate_dimensions",
     "validate_empty_frames",
     "validate_horizon",
@@ -0,0 +1,157 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import typing as t
+from dataclasses import dataclass
+from enum import Enum
+
+from raillabel import Scene
+
+from ._scene_traversal import _SceneVisitor
+from .validate_dimensions.validate_dimensions import _DimensionsVisitor
+from .validate_empty_frames.validate_empty_frames import _EmptyFramesVisitor
+from .validate_horizon.validate_horizon import _HorizonVisitor
+from .validate_missing_ego_track.validate_missing_ego_track import _MissingEgoTrackVisitor
+from .validate_ontology._ontology_classes._ontology import _Ontology, _OntologyVisitor
+from .validate_rail_side.validate_rail_side import _RailSideVisitor
+from .validate_sensors.validate_sensors import _SensorsVisitor
+from .validate_uris.validate_uris import _UrisVisitor
+
+
+class _Data(Enum):
+    """The parts of a scene (and the ontology) a check reads."""
+
+    FRAMES = "frames"
+    SENSORS = "sensors"
+    OBJECTS = "objects"
+    ONTOLOGY = "ontology"
+
+
+class _Cost(Enum):
+    """How the runtime of a check grows with the size of the scene."""
+
+    SCENE = "scene"
+    """Only depends on the parts of the scene outside of the frames."""
+
+    ANNOTATIONS = "annotations"
+    """Grows with the number of frames and annotations and runs in pure Python."""
+
+    NUMERIC = "numeric"
+    """Grows with the number of annotations and spends most of its time in numpy."""
+
+
+@dataclass(frozen=True)
+class _Check:
+    """A check that can be run by validate().
+
+    Parameters
+    ----------
+    name : str
+        The name under which the check can be selected or skipped.
+    visitor_class : type[_SceneVisitor]
+        The visitor that implements the check. If the check needs the ontology, the visitor is
+        created with the ontology as second argument.
+    needs : frozenset[_Data]
+        The data the check reads. Data that no selected check needs is not prepared at all.
+    cost : _Cost
+        How expensive the check is.
+    """
+
+    name: str
+    visitor_class: type[_SceneVisitor]
+    needs: frozenset[_Data]
+    cost: _Cost
+
+    def create_visitor(self, scene: Scene, ontology: _Ontology | None) -> _SceneVisitor:
+        if _Data.ONTOLOGY in self.needs:
+            return self.visitor_class(scene, ontology)
+        return self.visitor_class(scene)
+
+
+# All checks in the order in which their issues are returned. A new check only needs to be added
+# here to be run by validate() and to be selectable in the command line interface.
+_CHECKS = (
+    _Check(
+        "ontology",
+        _OntologyVisitor,
+        frozenset({_Data.FRAMES, _Data.OBJECTS, _Data.ONTOLOGY}),
+        _Cost.ANNOTATIONS,
+    ),
+    _Check("empty_frames", _EmptyFramesVisitor, frozenset({_Data.FRAMES}), _Cost.ANNOTATIONS),
+    _Check(
+        "rail_side_order",
+        _RailSideVisitor,
+        frozenset({_Data.FRAMES, _Data.SENSORS, _Data.OBJECTS}),
+        _Cost.NUMERIC,
+    ),
+    _Check(
+        "missing_ego_track",
+        _MissingEgoTrackVisitor,
+        frozenset({_Data.FRAMES, _Data.SENSORS}),
+        _Cost.ANNOTATIONS,
+    ),
+    _Check("sensors", _SensorsVisitor, frozenset({_Data.SENSORS}), _Cost.SCENE),
+    _Check("uris", _UrisVisitor, frozenset({_Data.FRAMES}), _Cost.ANNOTATIONS),
+    _Check(
+        "dimensions",
+        _DimensionsVisitor,
+        frozenset({_Data.FRAMES, _Data.OBJECTS}),
+        _Cost.ANNOTATIONS,
+    ),
+    _Check(
+        "horizon",
+        _HorizonVisitor,
+        frozenset({_Data.FRAMES, _Data.SENSORS, _Data.OBJECTS}),
+        _Cost.NUMERIC,
+    ),
+)
+
+CHECK_NAMES = tuple(check.name for check in _CHECKS)
+
+
+def _select_checks(
+    enabled: dict[str, bool],
+    only: t.Iterable[str] | None = None,
+    skip: t.Iterable[str] = (),
+) -> list[_Check]:
+    """Return the checks that should be run in the order of _CHECKS.
+
+    Parameters
+    ----------
+    enabled : dict[str, bool]
+        Whether a check is enabled by its validate_for_* argument. Checks that are not contained
+        are enabled.
+    only : Iterable[str] | None, optional
+        If not None, only the checks with these names are run.
+    skip : Iterable[str], optional
+        The names of the checks that are not run.
+
+    Raises
+    ------
+    ValueError
+        If only or skip contain names of checks that do not exist.
+    """
+    only = set(only) if only is not None else None
+    skip = set(skip)
+
+    unknown_names = ((only or set()) | skip) - set(CHECK_NAMES)
+    if len(unknown_names) > 0:
+        msg = (
+            f"Unknown checks: {', '.join(sorted(unknown_names))}."
+            f" Available checks are: {', '.join(CHECK_NAMES)}."
+        )
+        raise ValueError(msg)
+
+    return [
+        check
+        for check in _CHECKS
+        if enabled.get(check.name, True)
+        and (only is None or check.name in only)
+        and check.name not in skip
+    ]
+
+
+def _checks_need(checks: list[_Check], data: _Data) -> bool:
+    return any(data in check.needs for check in checks)
@@ -0,0 +1,158 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import typing as t
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from uuid import UUID
+
+from raillabel import Scene
+
+from raillabel_providerkit.validation import Issue, IssueIdentifiers, IssueType
+
+from ._checks import _Check, _Cost
+from ._scene_traversal import traverse_scene
+from .validate_ontology._ontology_classes._ontology import _Ontology
+
+# The type, identifiers and reason of an issue, see _issue_to_tuple()
+_IssueTuple = tuple[str, tuple | list[str | int], str | None]
+
+# The scene and ontology are inherited by the forked processes instead of being pickled
+_forked_scene: Scene | None = None
+_forked_ontology: _Ontology | None = None
+
+
+def _run_checks_concurrently(
+    scene: Scene, ontology: _Ontology | None, checks: list[_Check]
+) -> list[Issue]:
+    """Run every check in its own traversal of the scene at the same time.
+
+    Checks that spend most of their time in numpy run in threads. Pure Python checks run in forked
+    processes, as they would otherwise wait for each other to release the GIL. Checks that only
+    look at the scene outside of the frames are too cheap for either and run directly. With a
+    single CPU, running the checks at the same time would only add overhead, so the scene is
+    traversed once for all checks instead.
+
+    Returns
+    -------
+    list[Issue]
+        The issues of all checks in the order of the checks, like a single traversal returns them.
+    """
+    process_checks = [check for check in checks if check.cost == _Cost.ANNOTATIONS]
+    thread_checks = [check for check in checks if check.cost == _Cost.NUMERIC]
+    if "fork" not in multiprocessing.get_all_start_methods():
+        thread_checks = process_checks + thread_checks
+        process_checks = []
+
+    cpu_count = _available_cpu_count()
+    if len(process_checks) + len(thread_checks) <= 1 or cpu_count <= 1:
+        return _run_checks(scene, ontology, checks)
+
+    process_check_names = {check.name for check in process_checks}
+    futures: dict[str, Future] = {}
+    with ExitStack() as exit_stack:
+        if len(process_checks) > 0:
+            process_pool = exit_stack.enter_context(
+                _fork_process_pool(scene, ontology, min(len(process_checks), cpu_count))
+            )
+            # The processes are forked when the first check is submitted, which needs to happen
+            # before any thread of the thread pool is started
+            for check in process_checks:
+                futures[check.name] = process_pool.submit(_run_check_in_forked_process, check)
+
+        thread_pool = exit_stack.enter_context(
+            ThreadPoolExecutor(max_workers=max(len(thread_checks), 1))
+        )
+        for check in thread_checks:
+            futures[check.name] = thread_pool.submit(_run_checks, scene, ontology, [check])
+
+        issues_per_check = {
+            check.name: _run_checks(scene, ontology, [check])
+            for check in checks
+            if check.name not in futures
+        }
+        for name, future in futures.items():
+            result = future.result()
+            issues_per_check[name] = (
+                [_issue_from_tuple(issue_tuple) for issue_tuple in result]
+                if name in process_check_names
+                else result
+            )
+
+    return [issue for check in checks for issue in issues_per_check[check.name]]
+
+
+def _run_checks(scene: Scene, ontology: _Ontology | None, checks: list[_Check]) -> list[Issue]:
+    visitors = [check.create_visitor(scene, ontology) for check in checks]
+    traverse_scene(scene, visitors)
+    return [issue for visitor in visitors for issue in visitor.issues]
+
+
+def _available_cpu_count() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+@contextmanager
+def _fork_process_pool(
+    scene: Scene, ontology: _Ontology | None, max_workers: int
+) -> t.Iterator[ProcessPoolExecutor]:
+    global _forked_scene, _forked_ontology
+    _forked_scene, _forked_ontology = scene, ontology
+    try:
+        with ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context("fork")
+        ) as process_pool:
+            yield process_pool
+    finally:
+        _forked_scene, _forked_ontology = None, None
+
+
+def _run_check_in_forked_process(check: _Check) -> list[_IssueTuple]:
+    if _forked_scene is None:
+        msg = "The check can only be run in a process forked by _fork_process_pool()."
+        raise RuntimeError(msg)
+
+    issues = _run_checks(_forked_scene, _forked_ontology, [check])
+    return [_issue_to_tuple(issue) for issue in issues]
+
+
+def _issue_to_tuple(issue: Issue) -> _IssueTuple:
+    """Convert the issue into builtin types, which are pickled much faster than Issue and UUID."""
+    identifiers = issue.identifiers
+    if not isinstance(identifiers, IssueIdentifiers):
+        return (issue.type.value, identifiers, issue.reason)
+
+    identifiers_tuple = (
+        identifiers.annotation.bytes if identifiers.annotation is not None else None,
+        identifiers.annotation_type,
+        identifiers.attribute,
+        identifiers.frame,
+        identifiers.object.bytes if identifiers.object is not None else None,
+        identifiers.object_type,
+        identifiers.sensor,
+    )
+    return (issue.type.value, identifiers_tuple, issue.reason)
+
+
+def _issue_from_tuple(issue_tuple: _IssueTuple) -> Issue:
+    issue_type, identifiers_tuple, reason = issue_tuple
+    if not isinstance(identifiers_tuple, tuple):
+        return Issue(IssueType(issue_type), identifiers_tuple, reason)
+
+    annotation, annotation_type, attribute, frame, object_id, object_type, sensor = identifiers_tuple
+    identifiers = IssueIdentifiers(
+        annotation=UUID(bytes=annotation) if annotation is not None else None,
+        annotation_type=annotation_type,
+        attribute=attribute,
+        frame=frame,
+        object=UUID(bytes=object_id) if object_id is not None else None,
+        object_type=object_type,
+        sensor=sensor,
+    )
+    return Issue(IssueType(issue_type), identifiers, reason)
@@ -0,0 +1,177 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import json
+import os
+import typing as t
+from dataclasses import dataclass
+from pathlib import Path
+
+from ._scene_stream import _SceneStream
+from ._scene_traversal import _SceneVisitor, traverse_frames
+from .issue import _issue_from_verified
+from .validate_ontology._ontology_classes._ontology import _Ontology
+
+# Increased whenever the layout of the state file changes, which invalidates all stored results
+_STATE_FORMAT = 1
+
+
+@dataclass
+class _FrameResult:
+    """What the visitors found in a single frame, together with the fingerprint of the frame.
+
+    issues and states contain one entry per visitor, in the order of the visitors.
+    """
+
+    fingerprint: str
+    issues: list[list[dict]]
+    states: list[object]
+
+
+def _state_key(
+    scene_stream: _SceneStream, visitors: list[_SceneVisitor], ontology: _Ontology | None
+) -> str | None:
+    """Return a key that changes whenever anything besides the frames could change the results.
+
+    If the key can not be determined, None is returned and no stored results should be used.
+    """
+    if ontology is not None and ontology.fingerprint is None:
+        return None
+
+    import raillabel_providerkit
+
+    return json.dumps(
+        {
+            "format": _STATE_FORMAT,
+            "version": raillabel_providerkit.__version__,
+            "checks": [type(visitor).__name__ for visitor in visitors],
+            "ontology": ontology.fingerprint if ontology is not None else None,
+            "scene": scene_stream.scene_fingerprint,
+        },
+        sort_keys=True,
+    )
+
+
+def _load_frame_results(state_path: Path, key: str | None) -> dict[str, _FrameResult]:
+    """Load the results stored for the key or return no results if there are none."""
+    if key is None:
+        return {}
+
+    try:
+        with state_path.open("rb") as state_file:
+            state = json.load(state_file)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+    if not isinstance(state, dict) or state.get("key") != key:
+        return {}
+
+    # A broken state only means that all frames are checked again
+    try:
+        return {
+            frame_key: _FrameResult(*frame_result)
+            for frame_key, frame_result in state["frames"].items()
+        }
+    except (KeyError, TypeError, AttributeError):
+        return {}
+
+
+def _save_frame_results(
+    state_path: Path, key: str | None, frame_results: dict[str, _FrameResult]
+) -> None:
+    if key is None:
+        state_path.unlink(missing_ok=True)
+        return
+
+    state = {
+        "key": key,
+        "frames": {
+            frame_key: [frame_result.fingerprint, frame_result.issues, frame_result.states]
+            for frame_key, frame_result in frame_results.items()
+        },
+    }
+
+    # The state is replaced atomically, so that an interrupted run does not leave a broken file
+    temporary_path = state_path.with_name(f"{state_path.name}.{os.getpid()}.tmp")
+    temporary_path.write_text(json.dumps(state, separators=(",", ":")))
+    temporary_path.replace(state_path)
+
+
+def _traverse_incrementally(
+    scene_stream: _SceneStream,
+    visitors: list[_SceneVisitor],
+    previous_results: dict[str, _FrameResult],
+) -> dict[str, _FrameResult]:
+    """Traverse the frames of the scene stream, but replay the unchanged frames from the results.
+
+    Returns
+    -------
+    dict[str, _FrameResult]
+        The results of all frames of the scene, which can be used for the next traversal.
+    """
+    for visitor in visitors:
+        visitor.start_recording_frame_states()
+
+    frame_results: dict[str, _FrameResult] = {}
+    frames = _iter_changed_frames(scene_stream, visitors, previous_results, frame_results)
+    traverse_frames(frames, visitors)
+
+    # Frames that have not been needed by any check still need to be checked for schema errors
+    for _ in frames:
+        pass
+
+    return frame_results
+
+
+def _iter_changed_frames(
+    scene_stream: _SceneStream,
+    visitors: list[_SceneVisitor],
+    previous_results: dict[str, _FrameResult],
+    frame_results: dict[str, _FrameResult],
+) -> t.Iterator[tuple[int, t.Any]]:
+    """Yield the frames that changed and replay the other ones in between.
+
+    The traversal requests the next frame only after the previous one has been left, so the
+    result of a yielded frame is complete when the generator is resumed.
+    """
+    scene = scene_stream.scene
+    if scene is None:
+        return
+
+    for frame_span in scene_stream.frame_spans:
+        fingerprint = scene_stream.frame_fingerprint(frame_span)
+        previous_result = previous_results.get(frame_span.key)
+
+        if previous_result is not None and previous_result.fingerprint == fingerprint:
+            frame_results[frame_span.key] = previous_result
+            if len(scene_stream.schema_errors) == 0:
+                _replay_frame(int(frame_span.key), visitors, previous_result)
+            continue
+
+        frame_id, frame = scene_stream.parse_frame(frame_span)
+        if frame is None or len(scene_stream.schema_errors) > 0:
+            continue
+
+        issue_counts = [len(visitor.issues) for visitor in visitors]
+        scene.frames[frame_id] = frame
+        yield frame_id, frame
+        del scene.frames[frame_id]
+
+        frame_results[frame_span.key] = _FrameResult(
+            fingerprint,
+            [
+                [issue.serialize() for issue in visitor.issues[issue_count:]]
+                for visitor, issue_count in zip(visitors, issue_counts, strict=True)
+            ],
+            [visitor.save_frame_state(frame_id) for visitor in visitors],
+        )
+
+
+def _replay_frame(frame_id: int, visitors: list[_SceneVisitor], frame_result: _FrameResult) -> None:
+    for visitor, serialized_issues, state in zip(
+        visitors, frame_result.issues, frame_result.states, strict=True
+    ):
+        issues = [_issue_from_verified(serialized_issue) for serialized_issue in serialized_issues]
+        visitor.replay_frame(frame_id, issues, state)
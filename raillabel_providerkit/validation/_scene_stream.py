@@ -0,0 +1,240 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import re
+import typing as t
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from raillabel import Scene
+from raillabel.format import Frame
+from raillabel.json_format import JSONFrame, JSONScene
+
+from raillabel_providerkit.validation import Issue, IssueType
+
+from .metrics import ValidationMetrics, _measure
+from .validate_schema.validate_schema import _parse_json
+
+# Strings (which may contain brackets) and brackets are the only tokens needed to find the frames
+_TOKEN = re.compile(rb'"(?:[^"\\]|\\.)*"|[{}\[\]]')
+_COLON = re.compile(rb"\s*:")
+
+_OPENLABEL_PATH = [None, b'"openlabel"']
+_FRAMES_PATH = [None, b'"openlabel"', b'"frames"']
+
+
+@dataclass
+class _FrameSpan:
+    key: str
+    start: int
+    end: int
+
+
+class _SceneStream:
+    """A scene file whose frames are parsed one at a time while they are iterated over.
+
+    Only the part of the file outside of openlabel.frames (metadata, sensors, objects, ...) is
+    parsed upfront into the scene attribute. Each frame is added to scene.frames while it is
+    visited and removed afterwards, so that only a single frame is held in memory at once.
+    """
+
+    def __init__(self, data: bytes | mmap.mmap, metrics: ValidationMetrics | None = None) -> None:
+        self._data = data
+        self._metrics = metrics
+
+        with _measure(metrics, "open_scene_stream"):
+            frames_span, self.frame_spans = _find_frames(data)
+
+            scene_without_frames = (
+                data[:]
+                if frames_span is None
+                else b"".join([data[: frames_span[0]], b"{}", data[frames_span[1] :]])
+            )
+            self.scene_fingerprint = _fingerprint(scene_without_frames)
+            json_scene, self.schema_errors = _parse_json(scene_without_frames, JSONScene)
+            self.scene = Scene.from_json(json_scene) if json_scene is not None else None
+
+        if metrics is not None:
+            metrics.frame_count = len(self.frame_spans)
+
+    def iter_frames(self) -> t.Iterator[tuple[int, Frame]]:
+        """Parse and yield the frames one after another.
+
+        If a frame does not adhere to the schema, its schema errors are added to schema_errors
+        and the frame is skipped. After the first schema error, the remaining frames are only
+        checked for schema errors, but not yielded anymore. If the scene outside of the frames does
+        not adhere to the schema, no frame is yielded, but all frames are checked.
+        """
+        if self.scene is None:
+            self.check_frames()
+            return
+
+        for frame_span in self.frame_spans:
+            frame_id, frame = self.parse_frame(frame_span)
+            if frame is None or len(self.schema_errors) > 0:
+                continue
+
+            self.scene.frames[frame_id] = frame
+            yield frame_id, frame
+            del self.scene.frames[frame_id]
+
+    def check_frames(self) -> None:
+        """Check all frames for schema errors without converting them into raillabel frames.
+
+        This is enough if no check needs the frames, because only the schema errors are kept.
+        """
+        with _measure(self._metrics, "parse_frames"):
+            for frame_span in self.frame_spans:
+                self._parse_json_frame(frame_span)
+
+    def frame_fingerprint(self, frame_span: _FrameSpan) -> str:
+        """Return a hash of the raw data of the frame, which changes if the frame is modified."""
+        return _fingerprint(self._data[frame_span.start : frame_span.end])
+
+    def parse_frame(self, frame_span: _FrameSpan) -> tuple[int, Frame | None]:
+        """Parse a single frame and add its schema errors to schema_errors.
+
+        The frame is None if it does not adhere to the schema.
+        """
+        with _measure(self._metrics, "parse_frames"):
+            frame_id, json_frame = self._parse_json_frame(frame_span)
+            frame = Frame.from_json(json_frame) if json_frame is not None else None
+
+        if self._metrics is not None and frame is not None:
+            self._metrics.annotation_count = (self._metrics.annotation_count or 0) + len(
+                frame.annotations
+            )
+        return frame_id, frame
+
+    def _parse_json_frame(self, frame_span: _FrameSpan) -> tuple[int, JSONFrame | None]:
+        try:
+            frame_id = int(frame_span.key)
+        except ValueError:
+            self.schema_errors.append(
+                Issue(
+                    type=IssueType.SCHEMA,
+                    identifiers=["openlabel", "frames"],
+                    reason=f"Value '{frame_span.key}' could not be interpreted as int.",
+                )
+            )
+            return -1, None
+
+        json_frame, frame_schema_errors = _parse_json(
+            self._data[frame_span.start : frame_span.end],
+            JSONFrame,
+            ("openlabel", "frames", frame_span.key),
+        )
+        self.schema_errors.extend(frame_schema_errors)
+        return frame_id, json_frame
+
+
+@contextmanager
+def _open_scene_stream(
+    path: Path, metrics: ValidationMetrics | None = None
+) -> t.Iterator[_SceneStream]:
+    """Open a scene file as a _SceneStream backed by a memory map of the file."""
+    with path.open("rb") as scene_file:
+        if path.stat().st_size == 0:
+            yield _SceneStream(b"", metrics)
+            return
+
+        with mmap.mmap(scene_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield _SceneStream(data, metrics)
+
+
+def _fingerprint(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _find_frames(
+    data: bytes | mmap.mmap,
+) -> tuple[tuple[int, int] | None, list[_FrameSpan]]:
+    """Find the byte range of openlabel.frames and of every single frame in the JSON data.
+
+    The data is only tokenized as far as needed to track the nesting of objects and arrays. It is
+    not validated, which is done when the parts of the data are parsed.
+    """
+    finder = _FramesFinder(data)
+
+    for match in _TOKEN.finditer(data):
+        token = match.group()
+
+        if token[:1] == b'"':
+            finder.handle_string(match)
+        elif token in (b"{", b"["):
+            finder.handle_opening_bracket(match)
+        elif not finder.handle_closing_bracket(match):
+            break  # invalid JSON, which is reported when the data is parsed
+
+    return finder.frames_span, finder.frame_spans
+
+
+class _FramesFinder:
+    def __init__(self, data: bytes | mmap.mmap) -> None:
+        self.data = data
+        self.frames_span: tuple[int, int] | None = None
+        self.frame_spans: list[_FrameSpan] = []
+
+        # The key of every currently open object or array (None for array elements and the root)
+        self._open_keys: list[bytes | None] = []
+        self._pending_key: bytes | None = None
+        self._pending_value_start = 0
+        self._frames_start: int | None = None
+        self._frame_start = 0
+
+    def handle_string(self, match: re.Match) -> None:
+        colon_match = _COLON.match(self.data, match.end())
+        if colon_match is None:
+            return  # the string is a value and not a key
+
+        if self._open_keys == _FRAMES_PATH and self._pending_key is not None:
+            # The previous frame is neither an object nor an array
+            value_end = self.data.rfind(b",", self._pending_value_start, match.start())
+            self._add_frame_span(self._pending_key, self._pending_value_start, value_end)
+
+        self._pending_key = match.group()
+        self._pending_value_start = colon_match.end()
+
+    def handle_opening_bracket(self, match: re.Match) -> None:
+        if self._open_keys == _FRAMES_PATH:
+            self._frame_start = match.start()
+        elif (
+            self._open_keys == _OPENLABEL_PATH
+            and self._pending_key == b'"frames"'
+            and match.group() == b"{"
+        ):
+            self._frames_start = match.start()
+
+        self._open_keys.append(self._pending_key)
+        self._pending_key = None
+
+    def handle_closing_bracket(self, match: re.Match) -> bool:
+        if len(self._open_keys) == 0:
+            return False
+
+        if self._open_keys == _FRAMES_PATH and self._pending_key is not None:
+            # The last frame is neither an object nor an array
+            self._add_frame_span(self._pending_key, self._pending_value_start, match.start())
+
+        closed_key = self._open_keys.pop()
+        self._pending_key = None
+
+        if self._open_keys == _FRAMES_PATH and closed_key is not None:
+            self._add_frame_span(closed_key, self._frame_start, match.end())
+        elif (
+            self._open_keys == _OPENLABEL_PATH
+            and closed_key == b'"frames"'
+            and self._frames_start is not None
+        ):
+            self.frames_span = (self._frames_start, match.end())
+
+        return True
+
+    def _add_frame_span(self, key: bytes, start: int, end: int) -> None:
+        self.frame_spans.append(_FrameSpan(json.loads(key), start, end))
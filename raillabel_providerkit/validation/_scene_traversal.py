@@ -0,0 +1,232 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import typing as t
+from uuid import UUID
+
+import raillabel
+from raillabel.format import Bbox, Cuboid, Frame, Poly2d, Poly3d, Seg3d
+
+from raillabel_providerkit.validation import Issue
+from raillabel_providerkit.validation._scene_views import _AnnotationFilter
+
+
+class _FrameIndex:
+    """Lookup tables for the annotations of a single frame.
+
+    The index is filled by traverse_scene() while the annotations of a frame are visited, so that
+    checks can look up annotations without scanning the frame again. It is only built if at least
+    one visitor overrides visit_frame_index. The rails are only grouped when they are first
+    accessed, so checks that do not need them do not pay for it.
+    """
+
+    def __init__(self) -> None:
+        self.annotations_per_sensor: dict[str, list[Bbox | Cuboid | Poly2d | Poly3d | Seg3d]] = {}
+        self._rails: dict[str, dict[UUID, dict[str | None, list[Poly2d]]]] | None = None
+
+    @property
+    def rails(self) -> dict[str, dict[UUID, dict[str | None, list[Poly2d]]]]:
+        """The poly2ds of the frame grouped by sensor id, object id and rail side."""
+        if self._rails is None:
+            self._rails = {}
+            for annotations in self.annotations_per_sensor.values():
+                for annotation in annotations:
+                    if isinstance(annotation, Poly2d):
+                        self._add_rail(self._rails, annotation)
+        return self._rails
+
+    def add(self, annotation: Bbox | Cuboid | Poly2d | Poly3d | Seg3d) -> None:
+        """Add an annotation of the frame to the index."""
+        if annotation.sensor_id not in self.annotations_per_sensor:
+            self.annotations_per_sensor[annotation.sensor_id] = []
+        self.annotations_per_sensor[annotation.sensor_id].append(annotation)
+
+        if self._rails is not None and isinstance(annotation, Poly2d):
+            self._add_rail(self._rails, annotation)
+
+    @staticmethod
+    def _add_rail(
+        rails: dict[str, dict[UUID, dict[str | None, list[Poly2d]]]], poly2d: Poly2d
+    ) -> None:
+        rail_side = poly2d.attributes.get("railSide")
+        if not isinstance(rail_side, str):
+            rail_side = None
+
+        if poly2d.sensor_id not in rails:
+            rails[poly2d.sensor_id] = {}
+        rails_of_sensor = rails[poly2d.sensor_id]
+
+        if poly2d.object_id not in rails_of_sensor:
+            rails_of_sensor[poly2d.object_id] = {}
+        rails_of_object = rails_of_sensor[poly2d.object_id]
+
+        if rail_side not in rails_of_object:
+            rails_of_object[rail_side] = []
+        rails_of_object[rail_side].append(poly2d)
+
+
+class _SceneVisitor:
+    """Base class of all checks that are run during a single traversal of a scene.
+
+    A visitor only overrides the hooks it needs. The hooks are called by traverse_scene() in the
+    order visit_frame -> visit_annotation (for every annotation of the frame) -> visit_frame_index
+    -> leave_frame for every frame and finish once after the last frame. All issues found by the
+    visitor are collected in the issues attribute.
+
+    If annotation_filter is set, visit_annotation is only called for the annotations matching it.
+
+    Visitors that keep state across frames besides their issues need to override save_frame_state
+    and replay_frame, so that validate_incremental() can skip frames that have not changed.
+    """
+
+    annotation_filter: _AnnotationFilter | None = None
+    records_frame_states: bool = False
+
+    def __init__(self, scene: raillabel.Scene) -> None:
+        self.scene = scene
+        self.issues: list[Issue] = []
+
+    def visit_frame(self, frame_id: int, frame: Frame) -> None:
+        """Handle a frame before its annotations are visited."""
+
+    def visit_annotation(
+        self,
+        frame_id: int,
+        annotation_id: UUID,
+        annotation: Bbox | Cuboid | Poly2d | Poly3d | Seg3d,
+    ) -> None:
+        """Handle a single annotation of the current frame."""
+
+    def visit_frame_index(self, frame_id: int, frame_index: _FrameIndex) -> None:
+        """Handle the index of a frame after all of its annotations have been indexed."""
+
+    def leave_frame(self, frame_id: int, frame: Frame) -> None:
+        """Handle a frame after all of its annotations have been visited."""
+
+    def finish(self) -> None:
+        """Handle the end of the traversal, after the last frame has been left."""
+
+    def start_recording_frame_states(self) -> None:
+        """Prepare the visitor for save_frame_state() being called after every frame."""
+        self.records_frame_states = True
+
+    def save_frame_state(self, frame_id: int) -> object:  # noqa: ARG002
+        """Return the JSON-compatible state the visitor collected in the last frame.
+
+        This is only called after start_recording_frame_states(). The issues of the frame are
+        stored separately and do not need to be part of the state.
+        """
+        return None
+
+    def replay_frame(self, frame_id: int, issues: list[Issue], state: object) -> None:  # noqa: ARG002
+        """Restore the result of a frame from a previous traversal instead of visiting it.
+
+        This is called instead of all other frame hooks with the issues found in the frame and the
+        state returned by save_frame_state() during the previous traversal.
+        """
+        self.issues.extend(issues)
+
+
+def traverse_scene(scene: raillabel.Scene, visitors: list[_SceneVisitor]) -> None:
+    """Visit every frame and annotation of the scene exactly once and dispatch it to the visitors.
+
+    Parameters
+    ----------
+    scene : raillabel.Scene
+        The scene to traverse.
+    visitors : list[_SceneVisitor]
+        The visitors that should be called. Hooks are only dispatched to the visitors that
+        override them.
+    """
+    traverse_frames(scene.frames.items(), visitors)
+
+
+def traverse_frames(frames: t.Iterable[tuple[int, Frame]], visitors: list[_SceneVisitor]) -> None:
+    """Visit the frames one after another and dispatch them to the visitors.
+
+    Unlike traverse_scene(), the frames do not need to be loaded at once, so they can be parsed
+    lazily while they are iterated over.
+
+    Parameters
+    ----------
+    frames : Iterable[tuple[int, Frame]]
+        The frame ids and frames in the order in which they should be visited.
+    visitors : list[_SceneVisitor]
+        The visitors that should be called. Hooks are only dispatched to the visitors that
+        override them.
+    """
+    for _ in iter_traversal_steps(frames, visitors):
+        pass
+
+
+def iter_traversal_steps(
+    frames: t.Iterable[tuple[int, Frame]], visitors: list[_SceneVisitor]
+) -> t.Iterator[None]:
+    """Traverse the frames like traverse_frames(), but pause after every frame and at the end.
+
+    This allows to collect the issues the visitors found so far while the traversal is running.
+    """
+    frame_visitors = _visitors_overriding(visitors, "visit_frame")
+    annotation_visitors = _visitors_overriding(visitors, "visit_annotation")
+    frame_index_visitors = _visitors_overriding(visitors, "visit_frame_index")
+    leave_frame_visitors = _visitors_overriding(visitors, "leave_frame")
+
+    frame_hooks_exist = (
+        len(frame_visitors)
+        + len(annotation_visitors)
+        + len(frame_index_visitors)
+        + len(leave_frame_visitors)
+    ) > 0
+    if frame_hooks_exist:
+        for frame_id, frame in frames:
+            for visitor in frame_visitors:
+                visitor.visit_frame(frame_id, frame)
+
+            _traverse_annotations(frame_id, frame, annotation_visitors, frame_index_visitors)
+
+            for visitor in leave_frame_visitors:
+                visitor.leave_frame(frame_id, frame)
+
+            yield
+
+    for visitor in visitors:
+        visitor.finish()
+
+    yield
+
+
+def _traverse_annotations(
+    frame_id: int,
+    frame: Frame,
+    annotation_visitors: list[_SceneVisitor],
+    frame_index_visitors: list[_SceneVisitor],
+) -> None:
+    if len(annotation_visitors) == 0 and len(frame_index_visitors) == 0:
+        return
+
+    frame_index = _FrameIndex() if len(frame_index_visitors) > 0 else None
+    for annotation_id, annotation in frame.annotations.items():
+        for visitor in annotation_visitors:
+            if visitor.annotation_filter is None or visitor.annotation_filter.matches(
+                visitor.scene, annotation
+            ):
+                visitor.visit_annotation(frame_id, annotation_id, annotation)
+
+        if frame_index is not None:
+            frame_index.add(annotation)
+
+    if frame_index is None:
+        return
+
+    for visitor in frame_index_visitors:
+        visitor.visit_frame_index(frame_id, frame_index)
+
+
+def _visitors_overriding(visitors: list[_SceneVisitor], hook: str) -> list[_SceneVisitor]:
+    return [
+        visitor
+        for visitor in visitors
+        if getattr(type(visitor), hook) is not getattr(_SceneVisitor, hook)
+    ]
@@ -0,0 +1,49 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import raillabel
+from raillabel.format import Bbox, Cuboid, Poly2d, Poly3d, Seg3d
+
+
+@dataclass(frozen=True)
+class _AnnotationFilter:
+    """Predicates that select a subset of the annotations of a scene.
+
+    Unlike raillabel.Scene.filter(), the predicates are applied lazily to the annotations of the
+    original scene, so no copy of the scene is created. A predicate that is None matches all
+    annotations.
+
+    Parameters
+    ----------
+    annotation_types : tuple[type, ...] | None
+        Annotation classes (like Poly2d) that should be included.
+    sensor_types : tuple[type, ...] | None
+        Sensor classes (like Camera) whose annotations should be included.
+    object_types : frozenset[str] | None
+        Object types (like "track") whose annotations should be included.
+    """
+
+    annotation_types: tuple[type, ...] | None = None
+    sensor_types: tuple[type, ...] | None = None
+    object_types: frozenset[str] | None = None
+
+    def matches(
+        self, scene: raillabel.Scene, annotation: Bbox | Cuboid | Poly2d | Poly3d | Seg3d
+    ) -> bool:
+        """Return whether the annotation of the scene fulfills all predicates."""
+        if self.annotation_types is not None and not isinstance(annotation, self.annotation_types):
+            return False
+
+        if self.sensor_types is not None and not isinstance(
+            scene.sensors[annotation.sensor_id], self.sensor_types
+        ):
+            return False
+
+        return (
+            self.object_types is None
+            or scene.objects[annotation.object_id].type in self.object_types
+        )
@@ -1,11 +1,20 @@
 # Copyright DB InfraGO AG and contributors
 # SPDX-License-Identifier: Apache-2.0
 
+import gzip
+import io
+import json
+import sys
+import typing as t
+from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+from pathlib import Path
 from typing import Literal
 from uuid import UUID
 
+import fastjsonschema
 import jsonschema
 
 
@@ -35,9 +44,15 @@ class IssueType(Enum):
         return [type_.value for type_ in cls]
 
 
-@dataclass
+@dataclass(slots=True)
 class IssueIdentifiers:
-    """Information for locating an issue."""
+    """Information for locating an issue.
+
+    A scene can produce hundreds of thousands of issues, so the class has no per-instance __dict__
+    and the strings that repeat across issues (sensor, object type and attribute) are interned.
+    Checks may share one instance between all issues of the same context, so it should not be
+    modified after an issue has been created with it.
+    """
 
     annotation: UUID | None = None
     annotation_type: Literal["Bbox", "Cuboid", "Num", "Poly2d", "Poly3d", "Seg3d"] | None = None
@@ -47,6 +62,15 @@ class IssueIdentifiers:
     object_type: str | None = None
     sensor: str | None = None
 
+    def __post_init__(self) -> None:
+        """Intern the strings that repeat across issues, so that they are only stored once."""
+        if isinstance(self.attribute, str):
+            self.attribute = sys.intern(self.attribute)
+        if isinstance(self.object_type, str):
+            self.object_type = sys.intern(self.object_type)
+        if isinstance(self.sensor, str):
+            self.sensor = sys.intern(self.sensor)
+
     def serialize(self) -> dict[str, str | int]:
         """Serialize the IssueIdentifiers into a JSON-compatible dictionary.
 
@@ -55,17 +79,24 @@ class IssueIdentifiers:
         dict[str, str | int]
             The serialized IssueIdentifiers as a JSON-compatible dictionary
         """
-        return _clean_dict(
-            {
-                "annotation": str(self.annotation),
-                "annotation_type": self.annotation_type,
-                "attribute": self.attribute,
-                "frame": self.frame,
-                "object": str(self.object),
-                "object_type": self.object_type,
-                "sensor": self.sensor,
-            }
-        )
+        # The fields are checked one by one instead of creating a dict with all fields and removing
+        # the empty ones afterwards, as this is called for every issue that is stored
+        serialized: dict[str, str | int] = {}
+        if self.annotation is not None:
+            serialized["annotation"] = str(self.annotation)
+        if self.annotation_type is not None:
+            serialized["annotation_type"] = self.annotation_type
+        if self.attribute is not None:
+            serialized["attribute"] = self.attribute
+        if self.frame is not None:
+            serialized["frame"] = self.frame
+        if self.object is not None:
+            serialized["object"] = str(self.object)
+        if self.object_type is not None:
+            serialized["object_type"] = self.object_type
+        if self.sensor is not None:
+            serialized["sensor"] = self.sensor
+        return serialized
 
     @classmethod
     def deserialize(cls, serialized_identifiers: dict[str, str | int]) -> "IssueIdentifiers":
@@ -87,22 +118,10 @@ class IssueIdentifiers:
             If any of the fields have an unexpected type
         """
         _verify_identifiers_schema(serialized_identifiers)
-        return IssueIdentifiers(
-            annotation=UUID(serialized_identifiers.get("annotation"))
-            if serialized_identifiers.get("annotation") is not None
-            else None,
-            annotation_type=serialized_identifiers.get("annotation_type"),
-            attribute=serialized_identifiers.get("attribute"),
-            frame=serialized_identifiers.get("frame"),
-            object=UUID(serialized_identifiers.get("object"))
-            if serialized_identifiers.get("object") is not None
-            else None,
-            object_type=serialized_identifiers.get("object_type"),
-            sensor=serialized_identifiers.get("sensor"),
-        )
-
-
-@dataclass
+        return _identifiers_from_verified(serialized_identifiers)
+
+
+@dataclass(slots=True)
 class Issue:
     """An error that was found inside the scene."""
 
@@ -118,17 +137,17 @@ class Issue:
         dict[str, str | dict[str, str | int] | list[str | int]]
             The serialized Issue as a JSON-compatible dictionary
         """
-        return _clean_dict(
-            {
-                "type": str(self.type.value),
-                "identifiers": (
-                    self.identifiers.serialize()
-                    if isinstance(self.identifiers, IssueIdentifiers)
-                    else self.identifiers
-                ),
-                "reason": self.reason,
-            }
-        )
+        serialized: dict[str, str | dict[str, str | int] | list[str | int]] = {
+            "type": self.type.value,
+            "identifiers": (
+                self.identifiers.serialize()
+                if isinstance(self.identifiers, IssueIdentifiers)
+                else self.identifiers
+            ),
+        }
+        if self.reason is not None:
+            serialized["reason"] = self.reason
+        return serialized
 
     @classmethod
     def deserialize(
@@ -152,18 +171,87 @@ class Issue:
             If the serialized data does not match the Issue JSONSchema.
         """
         _verify_issue_schema(serialized_issue)
-        return Issue(
-            type=IssueType(serialized_issue["type"]),
-            identifiers=IssueIdentifiers.deserialize(serialized_issue["identifiers"])
-            if not isinstance(serialized_issue["identifiers"], list)
-            else serialized_issue["identifiers"],
-            reason=serialized_issue.get("reason"),
-        )
-
-
-def _clean_dict(d: dict) -> dict:
-    """Remove all fields in a dict that are None or 'None'."""
-    return {k: v for k, v in d.items() if str(v) != "None"}
+        return _issue_from_verified(serialized_issue)
+
+
+def load_issues(path: Path, trusted: bool = False) -> list[Issue]:
+    """Load all issues from a .json or .jsonl file, like the ones written by the CLI.
+
+    Unlike calling Issue.deserialize() for every issue, the whole file is checked against the
+    issues JSON schema at once with a compiled validator, which is much faster for large reports.
+
+    Parameters
+    ----------
+    path : Path
+        The path to a .json file containing a list of issues or a .jsonl file containing one issue
+        per line, optionally compressed with gzip (.gz) or zstd (.zst). Additional fields of the
+        issues (like the scene in a single output .jsonl file) are ignored.
+    trusted : bool, optional
+        If True, the file is not checked against the schema, only that it contains a list. This
+        should only be used for files that have been written by raillabel_providerkit itself. By
+        default False.
+
+    Returns
+    -------
+    list[Issue]
+        The issues in the order in which they are stored in the file.
+
+    Raises
+    ------
+    jsonschema.exceptions.ValidationError
+        If the file does not match the issues JSONSchema.
+    ValueError
+        If the file is trusted, but does not contain a list.
+    ModuleNotFoundError
+        If the file is compressed with zstd, but the zstandard package is not installed.
+    """
+    is_compressed = path.suffix in (".gz", ".zst")
+    format_suffix = path.with_suffix("").suffix if is_compressed else path.suffix
+
+    serialized_issues: t.Any
+    with _open_issues_file(path) as file:
+        if format_suffix == ".jsonl":
+            serialized_issues = [json.loads(line) for line in file if not line.isspace()]
+        else:
+            serialized_issues = json.load(file)
+
+    if trusted and not isinstance(serialized_issues, list):
+        msg = f"{path} does not contain a list of issues."
+        raise ValueError(msg)
+
+    if not trusted:
+        try:
+            _get_compiled_issues_schema_validator()(serialized_issues)
+        except fastjsonschema.JsonSchemaValueException as error:
+            raise jsonschema.exceptions.ValidationError(error.message) from error
+
+    return [_issue_from_verified(serialized_issue) for serialized_issue in serialized_issues]
+
+
+@contextmanager
+def _open_issues_file(path: Path) -> t.Iterator[t.BinaryIO | gzip.GzipFile | io.BufferedReader]:
+    """Open the file for reading in binary mode and decompress it, if it is a .gz or .zst file."""
+    with path.open("rb") as file:
+        if path.suffix == ".gz":
+            with gzip.GzipFile(fileobj=file, mode="rb") as gzip_file:
+                yield gzip_file
+
+        elif path.suffix == ".zst":
+            try:
+                import zstandard
+            except ModuleNotFoundError as error:
+                msg = (
+                    f"Loading {path} requires the zstandard package. It can be installed with"
+                    " 'pip install raillabel-providerkit[zstd]'."
+                )
+                raise ModuleNotFoundError(msg) from error
+
+            # The reader of zstandard can not be iterated line by line, which the buffer adds
+            with zstandard.ZstdDecompressor().stream_reader(file) as zstd_file:
+                yield io.BufferedReader(zstd_file)
+
+        else:
+            yield file
 
 
 ISSUES_SCHEMA = {
@@ -207,6 +295,41 @@ ISSUES_SCHEMA = {
 }
 
 
+def _issue_from_verified(
+    serialized_issue: dict[str, str | dict[str, str | int] | list[str | int]],
+) -> Issue:
+    """Deserialize an issue that has already been checked against the schema."""
+    identifiers = serialized_issue["identifiers"]
+    return Issue(
+        type=IssueType(serialized_issue["type"]),
+        identifiers=_identifiers_from_verified(identifiers)
+        if isinstance(identifiers, dict)
+        # The schema only allows a list besides a dict
+        else t.cast(list[str | int], identifiers),
+        reason=serialized_issue.get("reason"),
+    )
+
+
+def _identifiers_from_verified(serialized_identifiers: dict[str, str | int]) -> IssueIdentifiers:
+    """Deserialize identifiers that have already been checked against the schema."""
+    annotation = serialized_identifiers.get("annotation")
+    object_ = serialized_identifiers.get("object")
+    return IssueIdentifiers(
+        annotation=UUID(annotation) if annotation is not None else None,
+        annotation_type=serialized_identifiers.get("annotation_type"),
+        attribute=serialized_identifiers.get("attribute"),
+        frame=serialized_identifiers.get("frame"),
+        object=UUID(object_) if object_ is not None else None,
+        object_type=serialized_identifiers.get("object_type"),
+        sensor=serialized_identifiers.get("sensor"),
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_compiled_issues_schema_validator() -> t.Callable[[object], object]:
+    return fastjsonschema.compile(ISSUES_SCHEMA)
+
+
 def _verify_issue_schema(d: dict) -> None:
     jsonschema.validate(d, ISSUES_SCHEMA["definitions"]["issue"])
 
@@ -0,0 +1,82 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import time
+import typing as t
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+
+from .issue import Issue
+
+
+@dataclass
+class StageMetrics:
+    """The time spent in a stage of the validation, in seconds."""
+
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+
+
+@dataclass
+class ValidationMetrics:
+    """Timings and counters collected while a single scene is validated.
+
+    Pass an instance to validate() or iter_issues() to fill it. The stages are named read_file,
+    schema and scene_from_json (or open_scene_stream and parse_frames if the frames are streamed)
+    and check:<name> for every check. The time of a check only covers its own hooks, not the
+    traversal of the scene shared by all checks. Other stages (like the serialization of the
+    issues) can be added with measure().
+
+    frame_count and annotation_count are None if they have not been counted, for example because
+    no check needed the frames.
+    """
+
+    scene: str | None = None
+    stages: dict[str, StageMetrics] = field(default_factory=dict)
+    frame_count: int | None = None
+    annotation_count: int | None = None
+    issues_per_type: dict[str, int] = field(default_factory=dict)
+
+    @contextmanager
+    def measure(self, stage: str) -> t.Iterator[None]:
+        """Add the wall and CPU time spent in the with block to the stage."""
+        stage_metrics = self.stage(stage)
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            stage_metrics.wall_time += time.perf_counter() - wall_start
+            stage_metrics.cpu_time += time.process_time() - cpu_start
+
+    def stage(self, stage: str) -> StageMetrics:
+        """Return the metrics of the stage, which are created if they do not exist yet."""
+        if stage not in self.stages:
+            self.stages[stage] = StageMetrics()
+        return self.stages[stage]
+
+    def count_issue(self, issue: Issue) -> None:
+        """Add the issue to issues_per_type."""
+        issue_type = issue.type.value
+        self.issues_per_type[issue_type] = self.issues_per_type.get(issue_type, 0) + 1
+
+    def serialize(self) -> dict[str, t.Any]:
+        """Serialize the metrics into a JSON-compatible dictionary."""
+        return {
+            "scene": self.scene,
+            "stages": {
+                stage: {"wall_time": stage_metrics.wall_time, "cpu_time": stage_metrics.cpu_time}
+                for stage, stage_metrics in self.stages.items()
+            },
+            "frame_count": self.frame_count,
+            "annotation_count": self.annotation_count,
+            "issues_per_type": self.issues_per_type,
+        }
+
+
+def _measure(metrics: ValidationMetrics | None, stage: str) -> t.ContextManager[None]:
+    """Measure the stage like ValidationMetrics.measure() or do nothing if metrics is None."""
+    if metrics is None:
+        return nullcontext()
+    return metrics.measure(stage)
@@ -3,30 +3,40 @@
 
 from __future__ import annotations
 
-import json
+import time
+import typing as t
 from pathlib import Path
 
 from raillabel import Scene
+from raillabel.format import Frame
 from raillabel.json_format import JSONScene
 
 from raillabel_providerkit.validation import Issue
 
-from . import (
-    validate_dimensions,
-    validate_empty_frames,
-    validate_horizon,
-    validate_missing_ego_track,
-    validate_ontology,
-    validate_rail_side,
-    validate_schema,
-    validate_sensors,
-    validate_uris,
+from ._checks import _Check, _checks_need, _Data, _select_checks
+from ._concurrent_checks import _run_checks_concurrently
+from ._incremental import (
+    _load_frame_results,
+    _save_frame_results,
+    _state_key,
+    _traverse_incrementally,
 )
+from ._scene_stream import _open_scene_stream, _SceneStream
+from ._scene_traversal import (
+    _SceneVisitor,
+    iter_traversal_steps,
+    traverse_frames,
+    traverse_scene,
+)
+from .metrics import StageMetrics, ValidationMetrics, _measure
+from .validate_ontology._ontology_classes._ontology import _Ontology
+from .validate_ontology.validate_ontology import _build_ontology
+from .validate_schema.validate_schema import _parse_json, _parse_scene
 
 
-def validate(  # noqa: C901, PLR0913
+def validate(  # noqa: PLR0913
     scene_source: dict | Path,
-    ontology_source: dict | Path | None = None,
+    ontology_source: dict | Path | _Ontology | None = None,
     validate_for_empty_frames: bool = True,
     validate_for_rail_side_order: bool = True,
     validate_for_missing_ego_track: bool = True,
@@ -34,14 +44,19 @@ def validate(  # noqa: C901, PLR0913
     validate_for_uris: bool = True,
     validate_for_dimensions: bool = True,
     validate_for_horizon: bool = True,
+    stream_frames: bool = False,
+    only: t.Iterable[str] | None = None,
+    skip: t.Iterable[str] = (),
+    concurrent_checks: bool = False,
+    metrics: ValidationMetrics | None = None,
 ) -> list[Issue]:
     """Validate a scene based on the Deutsche Bahn Requirements.
 
     Args:
         scene_source: The scene either as a dictionary or as a Path to the scene source file.
-        ontology_source: The dataset ontology as a dictionary or as a Path to the ontology YAML
-            file. If not None, issues are returned if the scene contains annotations with invalid
-            attributes or object types. Default is None.
+        ontology_source: The dataset ontology as a dictionary, as a Path to the ontology YAML
+            file or as returned by load_ontology(). If not None, issues are returned if the scene
+            contains annotations with invalid attributes or object types. Default is None.
         validate_for_empty_frames (optional): If True, issues are returned if the scene contains
             frames without annotations. Default is True.
         validate_for_rail_side_order: If True, issues are returned if the scene contains track with
@@ -56,44 +71,433 @@ def validate(  # noqa: C901, PLR0913
         validate_for_dimensions: If True, issues are returned if the dimensions of cuboids are
             outside the expected values range.
         validate_for_horizon: If True, issues are returned if annotations cross the horizon.
+        stream_frames: If True and scene_source is a Path, the frames of the scene are parsed and
+            validated one at a time, so that the memory usage does not grow with the number of
+            frames. Use this for very large scene files. Default is False.
+        only: The names of the checks to run, all other checks are skipped. The checks are
+            ontology, empty_frames, rail_side_order, missing_ego_track, sensors, uris, dimensions
+            and horizon. Parts of the scene that none of the checks needs (like the frames for the
+            sensors check) are only validated against the schema. Default is None, which runs all
+            enabled checks.
+        skip: The names of the checks to skip. Default is none.
+        concurrent_checks: If True, the checks are run at the same time instead of one after
+            another, which reduces the time needed for a single large scene. Checks using numpy
+            run in threads and pure Python checks in forked processes (if the platform supports
+            forking). The issues are the same and in the same order. Can not be combined with
+            stream_frames. Default is False.
+        metrics: If not None, the wall and CPU time of every stage of the validation (reading,
+            schema validation and conversion of the scene as well as every check), the number of
+            frames and annotations and the number of issues per type are added to it. Measuring
+            the checks adds a small overhead. Can not be combined with concurrent_checks. Default
+            is None.
 
     Returns:
         List of all requirement errors in the scene. If an empty list is returned, then there are no
         errors present and the scene is valid.
+
+    Raises:
+        ValueError: If only or skip contain names of checks that do not exist or if
+            concurrent_checks is combined with stream_frames or metrics.
+    """
+    if concurrent_checks and stream_frames:
+        msg = "concurrent_checks can not be combined with stream_frames."
+        raise ValueError(msg)
+    if concurrent_checks and metrics is not None:
+        msg = "concurrent_checks can not be combined with metrics."
+        raise ValueError(msg)
+
+    checks, ontology = _prepare_checks(
+        ontology_source,
+        validate_for_empty_frames,
+        validate_for_rail_side_order,
+        validate_for_missing_ego_track,
+        validate_for_sensors,
+        validate_for_uris,
+        validate_for_dimensions,
+        validate_for_horizon,
+        only,
+        skip,
+        metrics,
+    )
+
+    if isinstance(scene_source, Path) and stream_frames:
+        issues = _validate_scene_stream(scene_source, ontology, checks, metrics)
+    else:
+        issues = _validate_scene_source(scene_source, ontology, checks, concurrent_checks, metrics)
+
+    if metrics is not None:
+        for issue in issues:
+            metrics.count_issue(issue)
+    return issues
+
+
+def iter_issues(  # noqa: PLR0913
+    scene_source: dict | Path,
+    ontology_source: dict | Path | _Ontology | None = None,
+    validate_for_empty_frames: bool = True,
+    validate_for_rail_side_order: bool = True,
+    validate_for_missing_ego_track: bool = True,
+    validate_for_sensors: bool = True,
+    validate_for_uris: bool = True,
+    validate_for_dimensions: bool = True,
+    validate_for_horizon: bool = True,
+    stream_frames: bool = False,
+    only: t.Iterable[str] | None = None,
+    skip: t.Iterable[str] = (),
+    metrics: ValidationMetrics | None = None,
+) -> t.Iterator[Issue]:
+    """Validate a scene like validate(), but yield the issues while the scene is validated.
+
+    The issues of all checks are yielded after every frame, so that they can be processed (for
+    example written to a file) before the whole scene has been validated. The issues are the same
+    as the ones returned by validate(), but issues of different checks are interleaved.
+
+    Args:
+        scene_source: The scene either as a dictionary or as a Path to the scene source file.
+        ontology_source: The dataset ontology as a dictionary, as a Path to the ontology YAML
+            file or as returned by load_ontology(). Default is None.
+        validate_for_empty_frames: Whether to check for empty frames. Default is True.
+        validate_for_rail_side_order: Whether to check the rail side order. Default is True.
+        validate_for_missing_ego_track: Whether to check for missing ego tracks. Default is True.
+        validate_for_sensors: Whether to check the sensors. Default is True.
+        validate_for_uris: Whether to check the uri fields. Default is True.
+        validate_for_dimensions: Whether to check the dimensions of cuboids. Default is True.
+        validate_for_horizon: Whether to check for annotations crossing the horizon. Default is
+            True.
+        stream_frames: Whether to parse and validate the frames of a scene file one at a time.
+            Default is False.
+        only: The names of the checks to run like in validate(). Default is None.
+        skip: The names of the checks to skip. Default is none.
+        metrics: Collects the timings and counters like in validate(). The issues are counted
+            while they are yielded. Default is None.
+
+    Yields:
+        All requirement errors in the scene. If the scene does not adhere to the schema, only the
+        schema errors are yielded. With stream_frames, schema errors in a frame are only found
+        when the frame is reached, so issues of the preceding frames may already have been yielded.
+    """
+    checks, ontology = _prepare_checks(
+        ontology_source,
+        validate_for_empty_frames,
+        validate_for_rail_side_order,
+        validate_for_missing_ego_track,
+        validate_for_sensors,
+        validate_for_uris,
+        validate_for_dimensions,
+        validate_for_horizon,
+        only,
+        skip,
+        metrics,
+    )
+
+    if isinstance(scene_source, Path) and stream_frames:
+        issues = _iter_issues_of_scene_stream(scene_source, ontology, checks, metrics)
+    else:
+        issues = _iter_issues_of_scene_source(scene_source, ontology, checks, metrics)
+
+    if metrics is None:
+        yield from issues
+        return
+
+    for issue in issues:
+        metrics.count_issue(issue)
+        yield issue
+
+
+def validate_incremental(  # noqa: PLR0913
+    scene_path: Path,
+    state_path: Path,
+    ontology_source: dict | Path | _Ontology | None = None,
+    validate_for_empty_frames: bool = True,
+    validate_for_rail_side_order: bool = True,
+    validate_for_missing_ego_track: bool = True,
+    validate_for_sensors: bool = True,
+    validate_for_uris: bool = True,
+    validate_for_dimensions: bool = True,
+    validate_for_horizon: bool = True,
+    only: t.Iterable[str] | None = None,
+    skip: t.Iterable[str] = (),
+) -> list[Issue]:
+    """Validate a scene file like validate(), but only check the frames that changed since before.
+
+    The fingerprint of every frame and the issues found in it are stored in a state file. When the
+    scene is validated again with the same state file, only the frames whose content changed are
+    parsed and checked, while the results of the other frames are taken from the state file.
+    Checks across frames (like the scope of attributes) are still done for the whole scene. If
+    anything besides the frames changed (like the sensors or objects of the scene, the ontology,
+    the enabled checks or the version of raillabel_providerkit), all frames are checked again.
+
+    Args:
+        scene_path: The path to the scene file.
+        state_path: The path to the state file. It is created if it does not exist yet and updated
+            with the results of the scene afterwards. It is not updated if the scene does not
+            adhere to the schema.
+        ontology_source: The dataset ontology as a dictionary, as a Path to the ontology YAML
+            file or as returned by load_ontology(). Default is None.
+        validate_for_empty_frames: Whether to check for empty frames. Default is True.
+        validate_for_rail_side_order: Whether to check the rail side order. Default is True.
+        validate_for_missing_ego_track: Whether to check for missing ego tracks. Default is True.
+        validate_for_sensors: Whether to check the sensors. Default is True.
+        validate_for_uris: Whether to check the uri fields. Default is True.
+        validate_for_dimensions: Whether to check the dimensions of cuboids. Default is True.
+        validate_for_horizon: Whether to check for annotations crossing the horizon. Default is
+            True.
+        only: The names of the checks to run like in validate(). Default is None.
+        skip: The names of the checks to skip. Default is none.
+
+    Returns:
+        The same issues as validate() with stream_frames=True returns for the scene.
     """
-    if isinstance(scene_source, Path):
-        with scene_source.open() as scene_file:
-            scene_source = json.load(scene_file)
+    checks, ontology = _prepare_checks(
+        ontology_source,
+        validate_for_empty_frames,
+        validate_for_rail_side_order,
+        validate_for_missing_ego_track,
+        validate_for_sensors,
+        validate_for_uris,
+        validate_for_dimensions,
+        validate_for_horizon,
+        only,
+        skip,
+    )
 
-    schema_errors = validate_schema(scene_source)
-    if schema_errors != []:
+    with _open_scene_stream(scene_path) as scene_stream:
+        if scene_stream.scene is None:
+            # The frames are still checked, so that their schema errors are not dropped
+            scene_stream.check_frames()
+            return scene_stream.schema_errors
+
+        visitors = _create_visitors(scene_stream.scene, ontology, checks)
+        key = _state_key(scene_stream, visitors, ontology)
+        frame_results = _traverse_incrementally(
+            scene_stream, visitors, _load_frame_results(state_path, key)
+        )
+
+        if len(scene_stream.schema_errors) > 0:
+            return scene_stream.schema_errors
+
+    _save_frame_results(state_path, key, frame_results)
+    return [issue for visitor in visitors for issue in visitor.issues]
+
+
+def _validate_scene_source(
+    scene_source: dict | Path,
+    ontology: _Ontology | None,
+    checks: list[_Check],
+    concurrent_checks: bool,
+    metrics: ValidationMetrics | None,
+) -> list[Issue]:
+    json_scene, schema_errors = _parse_scene_source(scene_source, metrics)
+    if json_scene is None:
         return schema_errors
 
-    scene = Scene.from_json(JSONScene(**scene_source))
-    errors = []
+    scene = _scene_from_json(json_scene, checks, metrics)
+    if concurrent_checks:
+        return _run_checks_concurrently(scene, ontology, checks)
+
+    # All checks are collected first so that the scene is only traversed once
+    visitors = _create_visitors(scene, ontology, checks, metrics)
+    traverse_scene(scene, visitors)
+
+    return [issue for visitor in visitors for issue in visitor.issues]
+
+
+def _iter_issues_of_scene_source(
+    scene_source: dict | Path,
+    ontology: _Ontology | None,
+    checks: list[_Check],
+    metrics: ValidationMetrics | None,
+) -> t.Iterator[Issue]:
+    json_scene, schema_errors = _parse_scene_source(scene_source, metrics)
+    if json_scene is None:
+        yield from schema_errors
+        return
+
+    scene = _scene_from_json(json_scene, checks, metrics)
+    visitors = _create_visitors(scene, ontology, checks, metrics)
+    for _ in iter_traversal_steps(scene.frames.items(), visitors):
+        yield from _take_issues(visitors)
+
+
+def _iter_issues_of_scene_stream(
+    scene_path: Path,
+    ontology: _Ontology | None,
+    checks: list[_Check],
+    metrics: ValidationMetrics | None,
+) -> t.Iterator[Issue]:
+    with _open_scene_stream(scene_path, metrics) as scene_stream:
+        if scene_stream.scene is None:
+            scene_stream.check_frames()
+            yield from scene_stream.schema_errors
+            return
+
+        visitors = _create_visitors(scene_stream.scene, ontology, checks, metrics)
+        frames = _iter_stream_frames(scene_stream, checks)
+        for _ in iter_traversal_steps(frames, visitors):
+            if len(scene_stream.schema_errors) > 0:
+                break
+            yield from _take_issues(visitors)
+
+        # Frames that have not been needed by any check still need to be checked for schema errors
+        for _ in frames:
+            pass
+
+        if len(scene_stream.schema_errors) > 0:
+            yield from scene_stream.schema_errors
+
+
+def _take_issues(visitors: list[_SceneVisitor]) -> t.Iterator[Issue]:
+    """Yield the issues the visitors found so far and remove them from the visitors."""
+    for visitor in visitors:
+        issues, visitor.issues = visitor.issues, []
+        yield from issues
+
+
+def _validate_scene_stream(
+    scene_path: Path,
+    ontology: _Ontology | None,
+    checks: list[_Check],
+    metrics: ValidationMetrics | None,
+) -> list[Issue]:
+    with _open_scene_stream(scene_path, metrics) as scene_stream:
+        if scene_stream.scene is None:
+            scene_stream.check_frames()
+            return scene_stream.schema_errors
+
+        visitors = _create_visitors(scene_stream.scene, ontology, checks, metrics)
+        frames = _iter_stream_frames(scene_stream, checks)
+        traverse_frames(frames, visitors)
+
+        # Frames that have not been needed by any check still need to be checked for schema errors
+        for _ in frames:
+            pass
+
+        if len(scene_stream.schema_errors) > 0:
+            return scene_stream.schema_errors
+
+    return [issue for visitor in visitors for issue in visitor.issues]
+
+
+def _create_visitors(
+    scene: Scene,
+    ontology: _Ontology | None,
+    checks: list[_Check],
+    metrics: ValidationMetrics | None = None,
+) -> list[_SceneVisitor]:
+    visitors = [check.create_visitor(scene, ontology) for check in checks]
+
+    if metrics is not None:
+        for check, visitor in zip(checks, visitors, strict=True):
+            _measure_hooks(visitor, metrics.stage(f"check:{check.name}"))
+
+    return visitors
+
+
+def _measure_hooks(visitor: _SceneVisitor, stage_metrics: StageMetrics) -> None:
+    """Add the time spent in the hooks the visitor overrides to the stage metrics."""
+    for hook_name in (
+        "visit_frame",
+        "visit_annotation",
+        "visit_frame_index",
+        "leave_frame",
+        "finish",
+    ):
+        if getattr(type(visitor), hook_name) is getattr(_SceneVisitor, hook_name):
+            continue  # the traversal only calls hooks that are overridden by the class
+
+        # The measured hook shadows the method of the class for this visitor only
+        setattr(visitor, hook_name, _measured(getattr(visitor, hook_name), stage_metrics))
+
+
+def _measured(hook: t.Callable[..., None], stage_metrics: StageMetrics) -> t.Callable[..., None]:
+    def measured_hook(*args: t.Any) -> None:  # noqa: ANN401
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        try:
+            hook(*args)
+        finally:
+            stage_metrics.wall_time += time.perf_counter() - wall_start
+            stage_metrics.cpu_time += time.process_time() - cpu_start
+
+    return measured_hook
+
+
+def _prepare_checks(  # noqa: PLR0913
+    ontology_source: dict | Path | _Ontology | None,
+    validate_for_empty_frames: bool,
+    validate_for_rail_side_order: bool,
+    validate_for_missing_ego_track: bool,
+    validate_for_sensors: bool,
+    validate_for_uris: bool,
+    validate_for_dimensions: bool,
+    validate_for_horizon: bool,
+    only: t.Iterable[str] | None,
+    skip: t.Iterable[str],
+    metrics: ValidationMetrics | None = None,
+) -> tuple[list[_Check], _Ontology | None]:
+    """Select the checks to run and build the ontology if any of them needs it."""
+    checks = _select_checks(
+        {
+            "ontology": ontology_source is not None,
+            "empty_frames": validate_for_empty_frames,
+            "rail_side_order": validate_for_rail_side_order,
+            "missing_ego_track": validate_for_missing_ego_track,
+            "sensors": validate_for_sensors,
+            "uris": validate_for_uris,
+            "dimensions": validate_for_dimensions,
+            "horizon": validate_for_horizon,
+        },
+        only,
+        skip,
+    )
+
+    ontology = None
+    if ontology_source is not None and _checks_need(checks, _Data.ONTOLOGY):
+        with _measure(metrics, "load_ontology"):
+            ontology = _build_ontology(ontology_source)
+    return checks, ontology
+
+
+def _parse_scene_source(
+    scene_source: dict | Path, metrics: ValidationMetrics | None
+) -> tuple[JSONScene | None, list[Issue]]:
+    if not isinstance(scene_source, Path):
+        with _measure(metrics, "schema"):
+            return _parse_scene(scene_source)
 
-    if ontology_source is not None:
-        errors.extend(validate_ontology(scene, ontology_source))
+    # The file is parsed directly from its raw bytes, which is faster than loading it as a dict
+    with _measure(metrics, "read_file"):
+        data = scene_source.read_bytes()
+    with _measure(metrics, "schema"):
+        return _parse_json(data, JSONScene)
 
-    if validate_for_empty_frames:
-        errors.extend(validate_empty_frames(scene))
 
-    if validate_for_rail_side_order:
-        errors.extend(validate_rail_side(scene))
+def _scene_from_json(
+    json_scene: JSONScene, checks: list[_Check], metrics: ValidationMetrics | None = None
+) -> Scene:
+    frames_are_needed = _checks_need(checks, _Data.FRAMES)
+    if metrics is not None:
+        metrics.frame_count = len(json_scene.openlabel.frames or {})
 
-    if validate_for_missing_ego_track:
-        errors.extend(validate_missing_ego_track(scene))
+    if not frames_are_needed:
+        # The frames have already been validated against the schema and are not needed anymore,
+        # which saves converting them
+        json_scene.openlabel.frames = None
 
-    if validate_for_sensors:
-        errors.extend(validate_sensors(scene))
+    with _measure(metrics, "scene_from_json"):
+        scene = Scene.from_json(json_scene)
 
-    if validate_for_uris:
-        errors.extend(validate_uris(scene))
+    if metrics is not None and frames_are_needed:
+        metrics.annotation_count = sum(len(frame.annotations) for frame in scene.frames.values())
+    return scene
 
-    if validate_for_dimensions:
-        errors.extend(validate_dimensions(scene))
 
-    if validate_for_horizon:
-        errors.extend(validate_horizon(scene))
+def _iter_stream_frames(
+    scene_stream: _SceneStream, checks: list[_Check]
+) -> t.Iterator[tuple[int, Frame]]:
+    if _checks_need(checks, _Data.FRAMES):
+        return scene_stream.iter_frames()
 
-    return errors
+    # The frames only need to be validated against the schema, which is done before any check
+    # runs, so that no issues are found for a scene with schema errors
+    scene_stream.check_frames()
+    return iter(())
@@ -1,9 +1,13 @@
 # Copyright DB InfraGO AG and contributors
 # SPDX-License-Identifier: Apache-2.0
 
+from uuid import UUID
+
 from raillabel.format import Cuboid, Scene
 
 from raillabel_providerkit.validation import Issue, IssueIdentifiers, IssueType
+from raillabel_providerkit.validation._scene_traversal import _SceneVisitor, traverse_scene
+from raillabel_providerkit.validation._scene_views import _AnnotationFilter
 
 from ._dimensions import DIMENSIONS, _TypeDimensions
 
@@ -22,39 +26,34 @@ def validate_dimensions(scene: Scene) -> list[Issue]:
         List of all dimension errors in the scene. If an empty list is returned, then there
         are no errors present.
     """
-    issues = []
-    for annotation, identifiers in _get_annotations_with_identifiers(scene):
+    visitor = _DimensionsVisitor(scene)
+    traverse_scene(scene, [visitor])
+    return visitor.issues
+
+
+class _DimensionsVisitor(_SceneVisitor):
+    annotation_filter = _AnnotationFilter(annotation_types=(Cuboid,))
+
+    def visit_annotation(
+        self,
+        frame_id: int,
+        annotation_id: UUID,
+        annotation: Cuboid,
+    ) -> None:
+        identifiers = IssueIdentifiers(
+            annotation=annotation_id,
+            annotation_type=annotation.__class__.__name__,
+            frame=frame_id,
+            object=annotation.object_id,
+            object_type=self.scene.objects[annotation.object_id].type,
+        )
+
         type_dimensions = _identify_applicable_type_dimension(annotation, identifiers)
         if type_dimensions is None:
-            continue
-
-        issues.extend(_validate_height(annotation, identifiers, type_dimensions))
-        issues.extend(_validate_width(annotation, identifiers, type_dimensions))
-
-    return issues
-
-
-def _get_annotations_with_identifiers(scene: Scene) -> list[tuple[Cuboid, IssueIdentifiers]]:
-    annotations_with_identfiers = []
-    for frame_id, frame in scene.frames.items():
-        for annotation_id, annotation in frame.annotations.items():
-            if not isinstance(annotation, Cuboid):
-                continue
-
-            annotations_with_identfiers.append(
-                (
-                    annotation,
-                    IssueIdentifiers(
-                        annotation=annotation_id,
-                        annotation_type=annotation.__class__.__name__,
-                        frame=frame_id,
-                        object=annotation.object_id,
-                        object_type=scene.objects[annotation.object_id].type,
-                    ),
-                )
-            )
+            return
 
-    return annotations_with_identfiers
+        self.issues.extend(_validate_height(annotation, identifiers, type_dimensions))
+        self.issues.extend(_validate_width(annotation, identifiers, type_dimensions))
 
 
 def _identify_applicable_type_dimension(
@@ -6,6 +6,7 @@ from __future__ import annotations
 import raillabel
 
 from raillabel_providerkit.validation import Issue, IssueIdentifiers, IssueType
+from raillabel_providerkit.validation._scene_traversal import _SceneVisitor, traverse_scene
 
 
 def validate_empty_frames(scene: raillabel.Scene) -> list[Issue]:
@@ -22,19 +23,21 @@ def validate_empty_frames(scene: raillabel.Scene) -> list[Issue]:
         List of all empty frame errors in the scene. If an empty list is returned, then there
         are no errors present.
     """
-    errors = []
+    visitor = _EmptyFramesVisitor(scene)
+    traverse_scene(scene, [visitor])
+    return visitor.issues
 
-    for frame_uid, frame in scene.frames.items():
+
+class _EmptyFramesVisitor(_SceneVisitor):
+    def visit_frame(self, frame_id: int, frame: raillabel.format.Frame) -> None:
         if _is_frame_empty(frame):
-            errors.append(
+            self.issues.append(
                 Issue(
                     type=IssueType.EMPTY_FRAMES,
-                    identifiers=IssueIdentifiers(frame=frame_uid),
+                    identifiers=IssueIdentifiers(frame=frame_id),
                 )
             )
 
-    return errors
-
 
 def _is_frame_empty(frame: raillabel.format.Frame) -> bool:
     return len(frame.annotations) == 0
@@ -1,16 +1,27 @@
 # Copyright DB InfraGO AG and contributors
 # SPDX-License-Identifier: Apache-2.0
 
-import typing as t
+from dataclasses import dataclass
 
 import numpy as np
 import raillabel
 from scipy.spatial.transform import Rotation
 
 
+@dataclass(frozen=True)
+class _LineFunction:
+    """Line y = f(x) = mx + n, that exposes its coefficients for vectorized calculations."""
+
+    m: float
+    n: float
+
+    def __call__(self, x: float) -> float:
+        return float(self.m * x + self.n)
+
+
 def _generate_line_function(
     p1: raillabel.format.Point2d, p2: raillabel.format.Point2d
-) -> t.Callable[[float], float]:
+) -> _LineFunction:
     """Generate a callable line function from two given points in 2D space.
 
     Parameters
@@ -22,7 +33,7 @@ def _generate_line_function(
 
     Returns
     -------
-    t.Callable[[float], float]
+    _LineFunction
         A callable line function f(x: float) -> float that returns the y for a given x.
         The calculated line is the line that connects p1 and p2 so that y = f(x) = mx + n.
     """
@@ -33,10 +44,7 @@ def _generate_line_function(
     m: float = (p2.y - p1.y) / (p2.x - p1.x)
     n: float = p1.y - m * p1.x
 
-    def f(x: float) -> float:
-        return float(m * x + n)
-
-    return f
+    return _LineFunction(m, n)
 
 
 class _HorizonCalculator:
@@ -235,7 +243,7 @@ class _HorizonCalculator:
         center_distance: float,
         side_distance: float,
         inclination: float = 0.0,
-    ) -> t.Callable[[float], float]:
+    ) -> _LineFunction:
         # Select points in the distance (within world, aka lidar coordinate system)
 
         # Calculate a center point of the horizon that is far away (10km)
@@ -306,6 +314,6 @@ class _HorizonCalculator:
         )
 
         # Calculate line function between selected points in the image coordinate system
-        horizon_line: t.Callable[[float], float] = _generate_line_function(p1_image, p2_image)
+        horizon_line: _LineFunction = _generate_line_function(p1_image, p2_image)
 
         return horizon_line
@@ -1,20 +1,23 @@
 # Copyright DB InfraGO AG and contributors
 # SPDX-License-Identifier: Apache-2.0
 
+import threading
+from uuid import UUID
+
+import numpy as np
 import raillabel
-from raillabel.filter import (
-    IncludeAnnotationTypeFilter,
-    IncludeObjectTypeFilter,
-    IncludeSensorTypeFilter,
-)
-from raillabel.format import (
-    Camera,
-    Poly2d,
-)
+from raillabel.format import Camera, IntrinsicsPinhole, Point2d, Poly2d
 
 from raillabel_providerkit.validation import Issue, IssueIdentifiers, IssueType
+from raillabel_providerkit.validation._scene_traversal import _SceneVisitor, traverse_scene
+from raillabel_providerkit.validation._scene_views import _AnnotationFilter
+
+from ._horizon_calculator import _HorizonCalculator, _LineFunction
 
-from ._horizon_calculator import _HorizonCalculator
+_HORIZON_LINE_CACHE_SIZE = 256
+_HORIZON_LINE_CACHE: dict[tuple, _LineFunction] = {}
+# Scenes may be validated in several threads at once, which all share the cache
+_HORIZON_LINE_CACHE_LOCK = threading.Lock()
 
 
 def validate_horizon(scene: raillabel.Scene) -> list[Issue]:
@@ -31,57 +34,178 @@ def validate_horizon(scene: raillabel.Scene) -> list[Issue]:
         List of all horizon crossing errors in the scene. If an empty list is returned, then there
         are no errors present.
     """
-    issues = []
-
-    filtered_scene = scene.filter(
-        [
-            IncludeObjectTypeFilter(["track", "transition"]),
-            IncludeSensorTypeFilter(["camera"]),
-            IncludeAnnotationTypeFilter(["poly2d"]),
-        ]
+    visitor = _HorizonVisitor(scene)
+    traverse_scene(scene, [visitor])
+    return visitor.issues
+
+
+class _HorizonVisitor(_SceneVisitor):
+    annotation_filter = _AnnotationFilter(
+        annotation_types=(Poly2d,),
+        sensor_types=(Camera,),
+        object_types=frozenset({"track", "transition"}),
     )
 
-    for frame_uid, frame in filtered_scene.frames.items():
-        for annotation_uid, annotation in frame.annotations.items():
-            if not isinstance(annotation, Poly2d):
-                raise AssertionError  # noqa: TRY004
-
-            identifiers = IssueIdentifiers(
-                annotation=annotation_uid,
-                frame=frame_uid,
-                object=annotation.object_id,
-                object_type=filtered_scene.objects[annotation.object_id].type,
-                sensor=annotation.sensor_id,
-            )
+    def __init__(self, scene: raillabel.Scene) -> None:
+        super().__init__(scene)
+        self._batches: dict[str, _HorizonBatch] = {}
+        self._annotation_count = 0
+
+    def visit_annotation(
+        self,
+        frame_id: int,
+        annotation_id: UUID,
+        annotation: Poly2d,
+    ) -> None:
+        camera = self.scene.sensors[annotation.sensor_id]
+        object_type = self.scene.objects[annotation.object_id].type
+
+        identifiers = IssueIdentifiers(
+            annotation=annotation_id,
+            frame=frame_id,
+            object=annotation.object_id,
+            object_type=object_type,
+            sensor=annotation.sensor_id,
+        )
+
+        if annotation.sensor_id not in self._batches:
+            self._batches[annotation.sensor_id] = _HorizonBatch(_get_horizon_line(camera))
+
+        self._batches[annotation.sensor_id].add(self._annotation_count, annotation, identifiers)
+        self._annotation_count += 1
+
+    def leave_frame(self, frame_id: int, frame: raillabel.format.Frame) -> None:  # noqa: ARG002
+        # validate_incremental() needs to know which issues belong to which frame
+        if self.records_frame_states:
+            self._check_batches()
+
+    def finish(self) -> None:
+        self._check_batches()
+
+    def _check_batches(self) -> None:
+        issues_with_position: list[tuple[int, Issue]] = []
+        for batch in self._batches.values():
+            issues_with_position.extend(batch.check())
+        self._batches = {}
+
+        # Restore the order in which the annotations have been visited
+        issues_with_position.sort(key=lambda issue_with_position: issue_with_position[0])
+        self.issues.extend(issue for _, issue in issues_with_position)
+
+
+class _HorizonBatch:
+    """All track/transition points of a single camera, which are checked at once.
+
+    Only the points of the annotations are kept, so that the batch can be filled across the whole
+    scene without holding on to the annotations of frames that have already been visited.
+    """
 
-            issues.extend(
-                _validate_annotation_for_horizon(
-                    annotation, filtered_scene.sensors[annotation.sensor_id], identifiers
+    def __init__(self, horizon_line: _LineFunction) -> None:
+        self.horizon_line = horizon_line
+        self.positions: list[int] = []
+        self.points: list[list[Point2d]] = []
+        self.identifiers: list[IssueIdentifiers] = []
+
+    def add(self, position: int, annotation: Poly2d, identifiers: IssueIdentifiers) -> None:
+        self.positions.append(position)
+        self.points.append(annotation.points)
+        self.identifiers.append(identifiers)
+
+    def check(self) -> list[tuple[int, Issue]]:
+        """Return the issues of all annotations with a point above the horizon.
+
+        Every issue is returned together with the position under which its annotation has been
+        added. Only the first point above the horizon is reported for each annotation.
+        """
+        point_counts = np.fromiter(
+            (len(points) for points in self.points),
+            dtype=np.intp,
+            count=len(self.points),
+        )
+        points = np.fromiter(
+            (
+                coordinate
+                for points in self.points
+                for point in points
+                for coordinate in (point.x, point.y)
+            ),
+            dtype=np.float64,
+            count=2 * int(point_counts.sum()),
+        ).reshape(-1, 2)
+
+        rows_above_horizon = np.flatnonzero(
+            points[:, 1] < self.horizon_line.m * points[:, 0] + self.horizon_line.n
+        )
+        if len(rows_above_horizon) == 0:
+            return []
+
+        annotation_index_of_row = np.repeat(np.arange(len(self.points)), point_counts)
+        first_point_offsets = np.cumsum(point_counts) - point_counts
+        annotation_indices, first_rows = np.unique(
+            annotation_index_of_row[rows_above_horizon], return_index=True
+        )
+
+        issues = []
+        for annotation_index, row in zip(
+            annotation_indices.tolist(), rows_above_horizon[first_rows].tolist(), strict=True
+        ):
+            point = self.points[annotation_index][row - first_point_offsets[annotation_index]]
+            horizon_y = self.horizon_line(point.x)
+            issues.append(
+                (
+                    self.positions[annotation_index],
+                    Issue(
+                        IssueType.HORIZON_CROSSED,
+                        self.identifiers[annotation_index],
+                        f"The point {point} is above the expected"
+                        f" horizon line ({point.y} < {horizon_y}).",
+                    ),
                 )
             )
 
-    return issues
+        return issues
+
 
+def _get_horizon_line(camera: Camera) -> _LineFunction:
+    """Return the horizon line of the camera, which is only calculated once per calibration."""
+    calibration = _get_calibration_key(camera)
 
-def _validate_annotation_for_horizon(
-    annotation: Poly2d, camera: Camera, identifiers: IssueIdentifiers
-) -> list[Issue]:
-    horizon_calculator = _HorizonCalculator(camera)
+    with _HORIZON_LINE_CACHE_LOCK:
+        horizon_line = _HORIZON_LINE_CACHE.get(calibration)
+    if horizon_line is not None:
+        return horizon_line
 
     # Calculate the horizon from two points 10000m in front and then 1000m to each side
     # with an assumed inclination of 1m per 100m distance (0.01 = 1%)
-    horizon_line_function = horizon_calculator.calculate_horizon(10000.0, 1000.0, 0.01)
-
-    for point in annotation.points:
-        horizon_y = horizon_line_function(point.x)
-        if point.y < horizon_y:
-            return [
-                Issue(
-                    IssueType.HORIZON_CROSSED,
-                    identifiers,
-                    f"The point {point} is above the expected"
-                    f" horizon line ({point.y} < {horizon_y}).",
-                )
-            ]
-
-    return []
+    horizon_line = _HorizonCalculator(camera).calculate_horizon(10000.0, 1000.0, 0.01)
+
+    with _HORIZON_LINE_CACHE_LOCK:
+        if (
+            calibration not in _HORIZON_LINE_CACHE
+            and len(_HORIZON_LINE_CACHE) >= _HORIZON_LINE_CACHE_SIZE
+        ):
+            del _HORIZON_LINE_CACHE[next(iter(_HORIZON_LINE_CACHE))]
+        _HORIZON_LINE_CACHE[calibration] = horizon_line
+
+    return horizon_line
+
+
+def _get_calibration_key(camera: Camera) -> tuple:
+    """Return the calibration values the horizon depends on as a hashable tuple."""
+    extrinsics = None
+    if camera.extrinsics is not None:
+        extrinsics = (
+            camera.extrinsics.pos.x,
+            camera.extrinsics.pos.y,
+            camera.extrinsics.pos.z,
+            camera.extrinsics.quat.x,
+            camera.extrinsics.quat.y,
+            camera.extrinsics.quat.z,
+            camera.extrinsics.quat.w,
+        )
+
+    camera_matrix = None
+    if isinstance(camera.intrinsics, IntrinsicsPinhole):
+        camera_matrix = tuple(camera.intrinsics.camera_matrix)
+
+    return (extrinsics, camera_matrix)
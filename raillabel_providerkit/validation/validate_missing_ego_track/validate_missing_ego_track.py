@@ -16,6 +16,11 @@ from raillabel.format import (
 )
 
 from raillabel_providerkit.validation import Issue, IssueIdentifiers, IssueType
+from raillabel_providerkit.validation._scene_traversal import (
+    _FrameIndex,
+    _SceneVisitor,
+    traverse_scene,
+)
 
 
 def validate_missing_ego_track(scene: raillabel.Scene) -> list[Issue]:
@@ -32,13 +37,40 @@ def validate_missing_ego_track(scene: raillabel.Scene) -> list[Issue]:
         List of all missing ego track errors in the scene. If an empty list is returned, then there
         are no errors present.
     """
-    issues = []
+    visitor = _MissingEgoTrackVisitor(scene)
+    traverse_scene(scene, [visitor])
+    return visitor.issues
+
+
+class _MissingEgoTrackVisitor(_SceneVisitor):
+    def __init__(self, scene: raillabel.Scene) -> None:
+        super().__init__(scene)
+        self.sensors_that_require_ego_track = _filter_out_sensors_that_do_not_require_ego_track(
+            scene.sensors
+        )
 
-    sensors_that_require_ego_track = _filter_out_sensors_that_do_not_require_ego_track(scene.sensors)
-    for frame_id, frame in scene.frames.items():
-        issues.extend(_validate_for_frame(frame_id, frame, sensors_that_require_ego_track))
+    def visit_frame_index(self, frame_id: int, frame_index: _FrameIndex) -> None:
+        for sensor_id in self.sensors_that_require_ego_track:
+            if _sensor_has_ego_track(frame_index.annotations_per_sensor.get(sensor_id, [])):
+                continue
 
-    return issues
+            self.issues.append(
+                Issue(
+                    type=IssueType.MISSING_EGO_TRACK,
+                    identifiers=IssueIdentifiers(
+                        frame=frame_id,
+                        sensor=sensor_id,
+                    ),
+                )
+            )
+
+
+def _sensor_has_ego_track(annotations: list[Bbox | Cuboid | Poly2d | Poly3d | Seg3d]) -> bool:
+    return any(
+        _annotation_is_ego_track_osdar23(annotation)
+        or _annotation_is_ego_track_open_data(annotation)
+        for annotation in annotations
+    )
 
 
 def _filter_out_sensors_that_do_not_require_ego_track(
@@ -55,43 +87,6 @@ def _filter_out_sensors_that_do_not_require_ego_track(
     return sensor_ids_that_require_ego_track
 
 
-def _validate_for_frame(
-    frame_id: int, frame: raillabel.format.Frame, sensors_that_require_ego_track: list[str]
-) -> list[Issue]:
-    issues = []
-    for sensor_id in sensors_that_require_ego_track:
-        issues.extend(_validate_for_sensor_frame(sensor_id, frame, frame_id))
-    return issues
-
-
-def _validate_for_sensor_frame(
-    sensor_id: str, frame: raillabel.format.Frame, frame_id: int
-) -> list[Issue]:
-    ego_track_is_in_sensor_frame = False
-    for annotation in frame.annotations.values():
-        if annotation.sensor_id != sensor_id:
-            continue
-
-        if _annotation_is_ego_track_osdar23(annotation) or _annotation_is_ego_track_open_data(
-            annotation
-        ):
-            ego_track_is_in_sensor_frame = True
-            break
-
-    if ego_track_is_in_sensor_frame:
-        return []
-
-    return [
-        Issue(
-            type=IssueType.MISSING_EGO_TRACK,
-            identifiers=IssueIdentifiers(
-                frame=frame_id,
-                sensor=sensor_id,
-            ),
-        )
-    ]
-
-
 def _annotation_is_ego_track_osdar23(annotation: Bbox | Cuboid | Poly2d | Poly3d | Seg3d) -> bool:
     return "trackID" in annotation.attributes and annotation.attributes["trackID"] == 0
 
@@ -3,9 +3,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import typing as t
+from dataclasses import dataclass, field
+from types import MappingProxyType
 
-from raillabel_providerkit.validation import Issue, IssueType
+from raillabel_providerkit.validation import Issue, IssueIdentifiers, IssueType
 from raillabel_providerkit.validation.validate_ontology._ontology_classes._sensor_type import (
     _SensorType,
 )
@@ -14,9 +16,53 @@ from ._annotation_with_metadata import _AnnotationWithMetadata
 from ._attributes._attribute_abc import _Attribute, attribute_classes
 
 
+@dataclass(frozen=True)
+class _AttributeTable:
+    """The attributes of an object class, which apply to annotations of a single sensor type.
+
+    Parameters
+    ----------
+    attributes: MappingProxyType[str, _Attribute]
+        All applicable attributes in the order of the ontology.
+    required_attribute_names: frozenset[str]
+        The names of all applicable attributes that are not optional.
+    validators: MappingProxyType[str, t.Callable]
+        The type and value check of every applicable attribute.
+    """
+
+    attributes: MappingProxyType[str, _Attribute]
+    required_attribute_names: frozenset[str]
+    validators: MappingProxyType[
+        str, t.Callable[[str, bool | float | str | list, IssueIdentifiers], list[Issue]]
+    ]
+
+    @classmethod
+    def fromattributes(cls, attributes: dict[str, _Attribute]) -> _AttributeTable:
+        return _AttributeTable(
+            attributes=MappingProxyType(attributes),
+            required_attribute_names=frozenset(
+                attr_name for attr_name, attr in attributes.items() if not attr.optional
+            ),
+            validators=MappingProxyType(
+                {attr_name: attr.check_type_and_value for attr_name, attr in attributes.items()}
+            ),
+        )
+
+
 @dataclass
 class _ObjectClass:
     attributes: dict[str, _Attribute]
+    attribute_tables: dict[_SensorType | None, _AttributeTable] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self.attribute_tables = {
+            sensor_type: _AttributeTable.fromattributes(
+                self._compile_applicable_attributes(sensor_type)
+            )
+            for sensor_type in [*_SensorType, None]
+        }
 
     @classmethod
     def fromdict(cls, data: dict) -> _ObjectClass:
@@ -27,9 +73,24 @@ class _ObjectClass:
     def check(self, annotation_metadata: _AnnotationWithMetadata) -> list[Issue]:
         errors = []
 
-        errors.extend(self._check_undefined_attributes(annotation_metadata))
-        errors.extend(self._check_missing_attributes(annotation_metadata))
-        errors.extend(self._check_false_attribute_type(annotation_metadata))
+        attribute_table = self.attribute_tables[annotation_metadata.sensor_type]
+        annotation_attributes = annotation_metadata.annotation.attributes
+
+        errors.extend(
+            self._check_undefined_attributes(
+                annotation_metadata, annotation_attributes, attribute_table
+            )
+        )
+        errors.extend(
+            self._check_missing_attributes(
+                annotation_metadata, annotation_attributes, attribute_table
+            )
+        )
+        errors.extend(
+            self._check_false_attribute_type(
+                annotation_metadata, annotation_attributes, attribute_table
+            )
+        )
         return errors
 
     @classmethod
@@ -41,41 +102,56 @@ class _ObjectClass:
         raise ValueError
 
     def _check_undefined_attributes(
-        self, annotation_metadata: _AnnotationWithMetadata
+        self,
+        annotation_metadata: _AnnotationWithMetadata,
+        annotation_attributes: dict,
+        attribute_table: _AttributeTable,
     ) -> list[Issue]:
         return [
             Issue(
                 type=IssueType.ATTRIBUTE_UNDEFINED,
                 identifiers=annotation_metadata.to_identifiers(attr_name),
             )
-            for attr_name in annotation_metadata.annotation.attributes
-            if attr_name not in self._compile_applicable_attributes(annotation_metadata.sensor_type)
+            for attr_name in annotation_attributes
+            if attr_name not in attribute_table.attributes
         ]
 
-    def _check_missing_attributes(self, annotation_metadata: _AnnotationWithMetadata) -> list[Issue]:
+    def _check_missing_attributes(
+        self,
+        annotation_metadata: _AnnotationWithMetadata,
+        annotation_attributes: dict,
+        attribute_table: _AttributeTable,
+    ) -> list[Issue]:
+        missing_attribute_names = attribute_table.required_attribute_names.difference(
+            annotation_attributes
+        )
+        if len(missing_attribute_names) == 0:
+            return []
+
         return [
             Issue(
                 type=IssueType.ATTRIBUTE_MISSING,
                 identifiers=annotation_metadata.to_identifiers(attr_name),
             )
-            for attr_name, attr in self._compile_applicable_attributes(
-                annotation_metadata.sensor_type
-            ).items()
-            if attr_name not in annotation_metadata.annotation.attributes and not attr.optional
+            for attr_name in attribute_table.attributes
+            if attr_name in missing_attribute_names
         ]
 
     def _check_false_attribute_type(
-        self, annotation_metadata: _AnnotationWithMetadata
+        self,
+        annotation_metadata: _AnnotationWithMetadata,
+        annotation_attributes: dict,
+        attribute_table: _AttributeTable,
     ) -> list[Issue]:
         errors = []
 
-        applicable_attributes = self._compile_applicable_attributes(annotation_metadata.sensor_type)
-        for attr_name, attr_value in annotation_metadata.annotation.attributes.items():
-            if attr_name not in applicable_attributes:
+        for attr_name, attr_value in annotation_attributes.items():
+            validator = attribute_table.validators.get(attr_name)
+            if validator is None:
                 continue
 
             errors.extend(
-                applicable_attributes[attr_name].check_type_and_value(
+                validator(
                     attr_name,
                     attr_value,
                     annotation_metadata.to_identifiers(attr_name),
@@ -86,10 +162,10 @@ class _ObjectClass:
 
     def _compile_applicable_attributes(
         self,
-        sensor_type: _SensorType,
+        sensor_type: _SensorType | None,
     ) -> dict[str, _Attribute]:
         return {
             attr_name: attr
             for attr_name, attr in self.attributes.items()
-            if sensor_type in [_SensorType(sensor_type_str) for sensor_type_str in attr.sensor_types]
+            if sensor_type is not None and sensor_type.value in attr.sensor_types
         }
@@ -4,112 +4,206 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from uuid import UUID
 
 import raillabel
+from raillabel.format import Bbox, Cuboid, Poly2d, Poly3d, Seg3d
 
 from raillabel_providerkit.validation import Issue, IssueIdentifiers, IssueType
+from raillabel_providerkit.validation._scene_traversal import _SceneVisitor, traverse_scene
+from raillabel_providerkit.validation.issue import _identifiers_from_verified
 
 from ._annotation_with_metadata import _AnnotationWithMetadata
+from ._attributes._attribute_abc import _Attribute
 from ._object_classes import _ObjectClass
+from ._scope import _Scope
 
 
 @dataclass
 class _Ontology:
+    """A compiled ontology.
+
+    The ontology is shared by all scenes validated against it (load_ontology() even shares it
+    across calls), so it must not hold any state of a single scene.
+    """
+
     classes: dict[str, _ObjectClass]
-    errors: list[Issue]
+    fingerprint: str | None = None
 
     @classmethod
     def fromdict(cls, data: dict) -> _Ontology:
         return _Ontology(
-            {class_id: _ObjectClass.fromdict(class_) for class_id, class_ in data.items()}, []
+            {class_id: _ObjectClass.fromdict(class_) for class_id, class_ in data.items()}
         )
 
     def check(self, scene: raillabel.Scene) -> list[Issue]:
-        self.errors = []
-
-        self._check_class_validity(scene)
-        annotations = _Ontology._compile_annotations(scene)
-        for annotation_metadata in annotations:
-            if annotation_metadata.object_type not in self.classes:
-                continue
-
-            self.errors.extend(
-                self.classes[annotation_metadata.object_type].check(annotation_metadata)
-            )
-
-        self.errors.extend(self._check_attribute_scopes(annotations))
-
-        return self.errors
+        visitor = _OntologyVisitor(scene, self)
+        traverse_scene(scene, [visitor])
+        return visitor.issues
 
-    def _check_class_validity(self, scene: raillabel.Scene) -> None:
+    def _check_class_validity(self, scene: raillabel.Scene) -> list[Issue]:
+        errors = []
         for obj_uid, obj in scene.objects.items():
             object_class = obj.type
             if object_class not in self.classes:
-                self.errors.append(
+                errors.append(
                     Issue(
                         type=IssueType.OBJECT_TYPE_UNDEFINED,
                         identifiers=IssueIdentifiers(object=obj_uid, object_type=object_class),
                     )
                 )
+        return errors
+
 
-    def _check_attribute_scopes(
-        self, annotations_with_metadata: list[_AnnotationWithMetadata]
-    ) -> list[Issue]:
-        errors: list[Issue] = []
-        checked_attributes_by_object_type: dict[str, list[str]] = {}
+class _AttributeScopeChecker:
+    """Check that attributes with frame or object scope are consistent.
 
-        for annotation_with_metadata in annotations_with_metadata:
-            object_type_name = annotation_with_metadata.object_type
+    The annotations are grouped by object and attribute (and frame for the frame scope). The
+    first annotation of every group provides the canonical value and all annotations deviating
+    from it are reported. Annotations without the attribute are not part of any group.
 
-            if object_type_name not in self.classes:
-                # NOTE: This is an UNEXPECTED_CLASS issue and handled elsewhere.
+    Annotations are added one at a time and only the canonical value of every group is kept, so
+    the annotations themselves do not need to be available anymore after they have been added.
+    If recorded_values is a list, the attribute values of the added annotations are appended to
+    it, so that they can be added again with add_recorded() without the annotations.
+    """
+
+    def __init__(self, ontology: _Ontology) -> None:
+        self.classes = ontology.classes
+        self.errors: list[Issue] = []
+        self.recorded_values: list[tuple[bool | float | str | list, IssueIdentifiers]] | None = None
+        self._object_scope_groups: dict[tuple[UUID, str], _CanonicalValue] = {}
+        self._frame_scope_groups: dict[tuple[UUID, str, int], _CanonicalValue] = {}
+
+    def add(self, annotation_with_metadata: _AnnotationWithMetadata) -> None:
+        object_type_name = annotation_with_metadata.object_type
+
+        if object_type_name not in self.classes:
+            # NOTE: This is an UNEXPECTED_CLASS issue and handled elsewhere.
+            return
+        object_class = self.classes[object_type_name]
+
+        annotation = annotation_with_metadata.annotation
+        for attribute_name, attribute_value in annotation.attributes.items():
+            attribute = object_class.attributes.get(attribute_name)
+            if attribute is None or attribute.scope == _Scope.ANNOTATION:
                 continue
-            object_class = self.classes[object_type_name]
 
-            if object_type_name not in checked_attributes_by_object_type:
-                checked_attributes_by_object_type[object_type_name] = []
+            identifiers = annotation_with_metadata.to_identifiers(attribute_name)
+            if self.recorded_values is not None:
+                self.recorded_values.append((attribute_value, identifiers))
+            self._add_value(attribute_name, attribute, attribute_value, identifiers)
+
+    def add_recorded(
+        self, attribute_value: bool | float | str | list, identifiers: IssueIdentifiers
+    ) -> None:
+        """Add an attribute value that has been recorded while adding an annotation before."""
+        if identifiers.object_type is None or identifiers.attribute is None:
+            return
+
+        attribute = self.classes[identifiers.object_type].attributes[identifiers.attribute]
+        self._add_value(identifiers.attribute, attribute, attribute_value, identifiers)
+
+    def _add_value(
+        self,
+        attribute_name: str,
+        attribute: _Attribute,
+        attribute_value: bool | float | str | list,
+        identifiers: IssueIdentifiers,
+    ) -> None:
+        groups: dict = self._object_scope_groups
+        group_key: tuple = (identifiers.object, attribute_name)
+        if attribute.scope == _Scope.FRAME:
+            groups = self._frame_scope_groups
+            group_key = (*group_key, identifiers.frame)
+
+        if group_key not in groups:
+            groups[group_key] = _CanonicalValue(
+                attribute_value,
+                IssueIdentifiers(
+                    annotation=identifiers.annotation,
+                    frame=identifiers.frame,
+                    object=identifiers.object,
+                ),
+            )
+            return
+
+        canonical = groups[group_key]
+        if attribute_value == canonical.value:
+            return
 
-            for (
+        self.errors.extend(
+            attribute.check_scope_for_two_annotations(
                 attribute_name,
+                canonical.value,
                 attribute_value,
-            ) in annotation_with_metadata.annotation.attributes.items():
-                attribute = object_class.attributes.get(attribute_name)
-                if attribute is None:
-                    continue
-
-                if attribute_name in checked_attributes_by_object_type[object_type_name]:
-                    continue
-                checked_attributes_by_object_type[object_type_name].append(attribute_name)
-
-                for other_annotation_with_metadata in annotations_with_metadata:
-                    if (
-                        other_annotation_with_metadata is annotations_with_metadata
-                        or other_annotation_with_metadata.object_type != object_type_name
-                    ):
-                        continue
-
-                    if attribute_name not in other_annotation_with_metadata.annotation.attributes:
-                        return []
-                    other_attribute_value = other_annotation_with_metadata.annotation.attributes[
-                        attribute_name
-                    ]
-
-                    errors.extend(
-                        attribute.check_scope_for_two_annotations(
-                            attribute_name,
-                            attribute_value,
-                            other_attribute_value,
-                            annotation_with_metadata.to_identifiers(attribute_name),
-                            other_annotation_with_metadata.to_identifiers(attribute_name),
-                        )
-                    )
+                canonical.identifiers,
+                identifiers,
+            )
+        )
 
-        return errors
+    def forget_frame_scope_groups(self) -> None:
+        """Drop the groups of frame scope attributes once all annotations of a frame were added."""
+        self._frame_scope_groups = {}
 
-    @classmethod
-    def _compile_annotations(cls, scene: raillabel.Scene) -> list[_AnnotationWithMetadata]:
+
+@dataclass
+class _CanonicalValue:
+    value: bool | float | str | list
+    identifiers: IssueIdentifiers
+
+
+class _OntologyVisitor(_SceneVisitor):
+    def __init__(self, scene: raillabel.Scene, ontology: _Ontology) -> None:
+        super().__init__(scene)
+        self.ontology = ontology
+        self._scope_checker = _AttributeScopeChecker(ontology)
+
+        self.issues.extend(ontology._check_class_validity(scene))  # noqa: SLF001
+
+    def visit_annotation(
+        self,
+        frame_id: int,
+        annotation_id: UUID,
+        annotation: Bbox | Cuboid | Poly2d | Poly3d | Seg3d,  # noqa: ARG002
+    ) -> None:
+        annotation_metadata = _AnnotationWithMetadata(annotation_id, frame_id, self.scene)
+        self._scope_checker.add(annotation_metadata)
+
+        if annotation_metadata.object_type not in self.ontology.classes:
+            return
+
+        self.issues.extend(
+            self.ontology.classes[annotation_metadata.object_type].check(annotation_metadata)
+        )
+
+    def leave_frame(self, frame_id: int, frame: raillabel.format.Frame) -> None:  # noqa: ARG002
+        self._scope_checker.forget_frame_scope_groups()
+
+    def finish(self) -> None:
+        self.issues.extend(self._scope_checker.errors)
+
+    def start_recording_frame_states(self) -> None:
+        super().start_recording_frame_states()
+        self._scope_checker.recorded_values = []
+
+    def save_frame_state(self, frame_id: int) -> object:  # noqa: ARG002
+        recorded_values, self._scope_checker.recorded_values = (
+            self._scope_checker.recorded_values,
+            [],
+        )
         return [
-            _AnnotationWithMetadata(annotation_id, frame_id, scene)
-            for frame_id, frame in scene.frames.items()
-            for annotation_id in frame.annotations
+            [attribute_value, identifiers.serialize()]
+            for attribute_value, identifiers in recorded_values or []
         ]
+
+    def replay_frame(self, frame_id: int, issues: list[Issue], state: object) -> None:
+        super().replay_frame(frame_id, issues, state)
+        if not isinstance(state, list):
+            return
+
+        for attribute_value, serialized_identifiers in state:
+            self._scope_checker.add_recorded(
+                attribute_value, _identifiers_from_verified(serialized_identifiers)
+            )
+        self._scope_checker.forget_frame_scope_groups()
@@ -3,6 +3,9 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+from functools import lru_cache
 from pathlib import Path
 
 import jsonschema
@@ -14,18 +17,22 @@ from raillabel_providerkit.validation import Issue
 
 from ._ontology_classes import _Ontology
 
+_ONTOLOGY_CACHE: dict[Path, tuple[int, _Ontology]] = {}
 
-def validate_ontology(scene: raillabel.Scene, ontology_input: dict | Path) -> list[Issue]:
+
+def validate_ontology(
+    scene: raillabel.Scene, ontology_input: dict | Path | _Ontology
+) -> list[Issue]:
     """Validate a scene based on the classes and attributes.
 
     Parameters
     ----------
     scene : raillabel.Scene
         The scene containing the annotations.
-    ontology_input : dict or Path
+    ontology_input : dict or Path or compiled ontology
         Ontology YAML-data or file containing a information about all classes and their
         attributes. The ontology must adhere to the ontology_schema. If a path is provided, the
-        file is loaded as a YAML.
+        file is loaded as a YAML. An ontology returned by load_ontology() is used as it is.
 
     Returns
     -------
@@ -34,14 +41,62 @@ def validate_ontology(scene: raillabel.Scene, ontology_input: dict | Path) -> li
         errors present.
 
     """
-    if isinstance(ontology_input, Path):
-        ontology_input = _load_ontology(Path(ontology_input))
+    return _build_ontology(ontology_input).check(scene)
+
+
+def load_ontology(ontology_input: dict | Path) -> _Ontology:
+    """Load, validate and compile an ontology, so that it can be reused for many scenes.
+
+    Ontology files are only loaded once per process as long as they are not modified.
+
+    Parameters
+    ----------
+    ontology_input : dict or Path
+        Ontology YAML-data or file containing a information about all classes and their
+        attributes. The ontology must adhere to the ontology_schema. If a path is provided, the
+        file is loaded as a YAML.
+
+    Returns
+    -------
+    compiled ontology
+        The ontology, which can be passed to validate() and validate_ontology().
+
+    Raises
+    ------
+    OntologySchemaError
+        If the ontology does not adhere to the ontology_schema.
+    """
+    if not isinstance(ontology_input, Path):
+        return _compile_ontology(ontology_input)
+
+    path = ontology_input.resolve()
+    modification_time = path.stat().st_mtime_ns
 
-    _validate_ontology_schema(ontology_input)
+    if path in _ONTOLOGY_CACHE and _ONTOLOGY_CACHE[path][0] == modification_time:
+        return _ONTOLOGY_CACHE[path][1]
 
-    ontology = _Ontology.fromdict(ontology_input)
+    ontology = _compile_ontology(_load_ontology(path))
+    _ONTOLOGY_CACHE[path] = (modification_time, ontology)
+    return ontology
 
-    return ontology.check(scene)
+
+def _build_ontology(ontology_input: dict | Path | _Ontology) -> _Ontology:
+    if isinstance(ontology_input, _Ontology):
+        return ontology_input
+
+    return load_ontology(ontology_input)
+
+
+def _compile_ontology(ontology_dict: dict) -> _Ontology:
+    _validate_ontology_schema(ontology_dict)
+    ontology = _Ontology.fromdict(ontology_dict)
+
+    # Identifies the content of the ontology, for example to detect whether stored results are
+    # still valid
+    ontology.fingerprint = hashlib.sha256(
+        json.dumps(ontology_dict, sort_keys=True, default=str).encode()
+    ).hexdigest()
+    return ontology
 
 
 def _load_ontology(path: Path) -> dict:
@@ -50,15 +105,8 @@ def _load_ontology(path: Path) -> dict:
 
 
 def _validate_ontology_schema(ontology: dict) -> None:
-    schema_path = Path(__file__).parent / "ontology_schema_v2.yaml"
-
-    with schema_path.open() as f:
-        ontology_schema = yaml.safe_load(f)
-
-    validator = jsonschema.Draft7Validator(schema=ontology_schema)
-
     schema_errors = ""
-    for error in validator.iter_errors(ontology):
+    for error in _get_ontology_schema_validator().iter_errors(ontology):
         schema_errors += f"${error.json_path[1:]}: {error.message}\n"
 
     if schema_errors != "":
@@ -66,3 +114,13 @@ def _validate_ontology_schema(ontology: dict) -> None:
             "The provided ontology is not valid. The following errors have been found:\n"
             + schema_errors
         )
+
+
+@lru_cache(maxsize=1)
+def _get_ontology_schema_validator() -> jsonschema.Draft7Validator:
+    schema_path = Path(__file__).parent / "ontology_schema_v2.yaml"
+
+    with schema_path.open() as f:
+        ontology_schema = yaml.safe_load(f)
+
+    return jsonschema.Draft7Validator(schema=ontology_schema)
@@ -3,18 +3,20 @@
 
 from __future__ import annotations
 
+import heapq
 from uuid import UUID
 
 import numpy as np
 import raillabel
-from raillabel.filter import (
-    IncludeAnnotationTypeFilter,
-    IncludeObjectTypeFilter,
-    IncludeSensorIdFilter,
-    IncludeSensorTypeFilter,
-)
+from raillabel.format import Camera, Poly2d
 
 from raillabel_providerkit.validation import Issue, IssueIdentifiers, IssueType
+from raillabel_providerkit.validation._scene_traversal import (
+    _FrameIndex,
+    _SceneVisitor,
+    traverse_scene,
+)
+from raillabel_providerkit.validation.issue import _issue_from_verified
 
 
 def validate_rail_side(scene: raillabel.Scene) -> list[Issue]:
@@ -32,41 +34,101 @@ def validate_rail_side(scene: raillabel.Scene) -> list[Issue]:
         errors present.
 
     """
-    errors = []
+    visitor = _RailSideVisitor(scene)
+    traverse_scene(scene, [visitor])
+    return visitor.issues
+
+
+class _RailSideVisitor(_SceneVisitor):
+    def __init__(self, scene: raillabel.Scene) -> None:
+        super().__init__(scene)
+        self._issues_per_camera: dict[str, list[Issue]] = {}
+        self._frame_state: dict[str, list[dict]] = {}
+
+    def visit_frame_index(self, frame_id: int, frame_index: _FrameIndex) -> None:
+        frame_issues_per_camera: dict[str, list[Issue]] = {}
+        for sensor_id in frame_index.annotations_per_sensor:
+            if not isinstance(self.scene.sensors[sensor_id], Camera):
+                continue
+
+            frame_issues_per_camera[sensor_id] = []
+            if sensor_id not in frame_index.rails:
+                continue
 
-    camera_uids = list(scene.filter([IncludeSensorTypeFilter(["camera"])]).sensors.keys())
+            frame_issues_per_camera[sensor_id] = _validate_rails_in_camera_frame(
+                frame_id, sensor_id, self._filter_for_tracks(frame_index.rails[sensor_id])
+            )
 
-    for camera_uid in camera_uids:
-        filtered_scene = scene.filter(
-            [
-                IncludeObjectTypeFilter(["track"]),
-                IncludeSensorIdFilter([camera_uid]),
-                IncludeAnnotationTypeFilter(["poly2d"]),
-            ]
+        self._add_frame_issues(frame_issues_per_camera)
+        if self.records_frame_states:
+            self._frame_state = {
+                sensor_id: [issue.serialize() for issue in issues]
+                for sensor_id, issues in frame_issues_per_camera.items()
+            }
+
+    def save_frame_state(self, frame_id: int) -> object:  # noqa: ARG002
+        frame_state, self._frame_state = self._frame_state, {}
+        return frame_state
+
+    def replay_frame(self, frame_id: int, issues: list[Issue], state: object) -> None:
+        super().replay_frame(frame_id, issues, state)
+        if not isinstance(state, dict):
+            return
+
+        self._add_frame_issues(
+            {
+                sensor_id: [_issue_from_verified(issue) for issue in serialized_issues]
+                for sensor_id, serialized_issues in state.items()
+            }
         )
 
-        for frame_uid, frame in filtered_scene.frames.items():
-            counts_per_track = _count_rails_per_track_in_frame(frame)
+    def finish(self) -> None:
+        for camera_issues in self._issues_per_camera.values():
+            self.issues.extend(camera_issues)
+
+    def _add_frame_issues(self, frame_issues_per_camera: dict[str, list[Issue]]) -> None:
+        # Issues are grouped by camera in the order in which the cameras are first used
+        for sensor_id, issues in frame_issues_per_camera.items():
+            if sensor_id not in self._issues_per_camera:
+                self._issues_per_camera[sensor_id] = []
+            self._issues_per_camera[sensor_id].extend(issues)
+
+    def _filter_for_tracks(
+        self, rails_of_camera: dict[UUID, dict[str | None, list[Poly2d]]]
+    ) -> dict[UUID, dict[str | None, list[Poly2d]]]:
+        return {
+            object_uid: rails_of_object
+            for object_uid, rails_of_object in rails_of_camera.items()
+            if self.scene.objects[object_uid].type == "track"
+        }
+
+
+def _validate_rails_in_camera_frame(
+    frame_uid: int, camera_uid: str, rails_of_camera: dict[UUID, dict[str | None, list[Poly2d]]]
+) -> list[Issue]:
+    errors = []
 
-            for object_uid, (left_count, right_count) in counts_per_track.items():
-                context = IssueIdentifiers(
-                    frame=frame_uid,
-                    sensor=camera_uid,
-                    object=object_uid,
-                )
+    counts_per_track = _count_rails_per_track_in_frame(rails_of_camera)
 
-                count_errors = _check_rail_counts(context, left_count, right_count)
-                exactly_one_left_and_right_rail_exist = count_errors != []
-                if exactly_one_left_and_right_rail_exist:
-                    errors.extend(count_errors)
-                    continue
+    for object_uid, (left_count, right_count) in counts_per_track.items():
+        context = IssueIdentifiers(
+            frame=frame_uid,
+            sensor=camera_uid,
+            object=object_uid,
+        )
 
-                left_rail = _get_track_from_frame(frame, object_uid, "leftRail")
-                right_rail = _get_track_from_frame(frame, object_uid, "rightRail")
-                if left_rail is None or right_rail is None:
-                    continue
+        count_errors = _check_rail_counts(context, left_count, right_count)
+        exactly_one_left_and_right_rail_exist = count_errors != []
+        if exactly_one_left_and_right_rail_exist:
+            errors.extend(count_errors)
+            continue
+
+        if left_count == 0 or right_count == 0:
+            continue
 
-                errors.extend(_check_rails_for_swap_or_intersection(left_rail, right_rail, context))
+        left_rail = rails_of_camera[object_uid]["leftRail"][0]
+        right_rail = rails_of_camera[object_uid]["rightRail"][0]
+        errors.extend(_check_rails_for_swap_or_intersection(left_rail, right_rail, context))
 
     return errors
 
@@ -130,74 +192,47 @@ def _check_rails_for_swap_or_intersection(
     return []
 
 
-def _count_rails_per_track_in_frame(frame: raillabel.format.Frame) -> dict[UUID, tuple[int, int]]:
-    """For each track, count the left and right rails."""
-    counts: dict[UUID, list[int]] = {}
-
-    unfiltered_annotations = list(frame.annotations.values())
-    poly2ds: list[raillabel.format.Poly2d] = _filter_for_poly2ds(unfiltered_annotations)
-
-    for poly2d in poly2ds:
-        object_id = poly2d.object_id
-        if object_id not in counts:
-            counts[object_id] = [0, 0]
-
-        rail_side = poly2d.attributes["railSide"]
-        if rail_side == "leftRail":
-            counts[object_id][0] += 1
-        elif rail_side == "rightRail":
-            counts[object_id][1] += 1
-        else:
-            # NOTE: This is ignored because it is covered by validate_ontology
-            continue
+def _count_rails_per_track_in_frame(
+    rails_of_camera: dict[UUID, dict[str | None, list[Poly2d]]],
+) -> dict[UUID, tuple[int, int]]:
+    """For each track, count the left and right rails.
 
+    Rails with other railSide values are ignored, because they are covered by validate_ontology.
+    """
     return {
-        object_id: (object_counts[0], object_counts[1])
-        for object_id, object_counts in counts.items()
+        object_id: (
+            len(rails_of_object.get("leftRail", [])),
+            len(rails_of_object.get("rightRail", [])),
+        )
+        for object_id, rails_of_object in rails_of_camera.items()
     }
 
 
-def _filter_for_poly2ds(
-    unfiltered_annotations: list,
-) -> list[raillabel.format.Poly2d]:
-    return [
-        annotation
-        for annotation in unfiltered_annotations
-        if isinstance(annotation, raillabel.format.Poly2d)
-    ]
-
-
 def _polylines_are_intersecting(
     line1: raillabel.format.Poly2d, line2: raillabel.format.Poly2d
 ) -> bool:
-    """If the two polylines intersect anywhere, return the y interval where they intersect."""
-    y_values_with_points_in_either_polyline: list[float] = sorted(
-        _get_y_of_all_points_of_poly2d(line1).union(_get_y_of_all_points_of_poly2d(line2))
-    )
-
-    order: bool | None = None
-    last_y: float | None = None
-    for y in y_values_with_points_in_either_polyline:
-        x1 = _find_x_by_y(y, line1)
-        x2 = _find_x_by_y(y, line2)
-
-        if x1 is None or x2 is None:
-            order = None
-            continue
-
-        if x1 == x2:
-            return True
+    """Check whether the two polylines touch or cross at any y value of their points.
 
-        new_order = x1 < x2
+    Both polylines are evaluated at the sorted union of their y values in a single sweep. The
+    polylines intersect if they have the same x at one of these y values or if their x order
+    flips between two neighbouring y values that both polylines pass through.
+    """
+    points1 = _get_points_as_array(line1)
+    points2 = _get_points_as_array(line2)
+    y_values_with_points_in_either_polyline = np.unique(
+        np.concatenate((points1[:, 1], points2[:, 1]))
+    )
 
-        order_has_flipped = order is not None and new_order != order and last_y is not None
-        if order_has_flipped:
-            return True
+    x1, passes_through1 = _find_x_by_y_vectorized(y_values_with_points_in_either_polyline, points1)
+    x2, passes_through2 = _find_x_by_y_vectorized(y_values_with_points_in_either_polyline, points2)
+    both_pass_through = passes_through1 & passes_through2
 
-        order = new_order
-        last_y = y
+    if np.any(both_pass_through & (x1 == x2)):
+        return True
 
-    return False
+    order = x1 < x2
+    order_has_flipped = both_pass_through[1:] & both_pass_through[:-1] & (order[1:] != order[:-1])
+    return bool(np.any(order_has_flipped))
 
 
 def _find_max_y(poly2d: raillabel.format.Poly2d) -> float:
@@ -273,30 +308,119 @@ def _find_x_by_y(y: float, poly2d: raillabel.format.Poly2d) -> float | None:
     return (y - n) / m
 
 
-def _get_track_from_frame(
-    frame: raillabel.format.Frame, object_uid: UUID, rail_side: str
-) -> raillabel.format.Poly2d | None:
-    for annotation in frame.annotations.values():
-        if not isinstance(annotation, raillabel.format.Poly2d):
-            continue
+def _find_x_by_y_vectorized(
+    y_values: np.ndarray, points: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Find the x values where the polyline first passes through each of the sorted y values.
 
-        if annotation.object_id != object_uid:
-            continue
+    This is the vectorized equivalent of _find_x_by_y().
 
-        if "railSide" not in annotation.attributes:
-            continue
+    Parameters
+    ----------
+    y_values : np.ndarray
+        The y values to check in ascending order.
+    points : np.ndarray
+        The (N, 2) array with the points of the polyline.
 
-        if annotation.attributes["railSide"] == rail_side:
-            return annotation
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        The x values and a boolean mask, that is False wherever the polyline does not pass
+        through the y value (the x value is meaningless there).
+    """
+    segment_count = len(points) - 1
+    if segment_count < 1:
+        return np.zeros(len(y_values)), np.zeros(len(y_values), dtype=bool)
 
-    return None
+    first_segments, passes_through = _find_first_segments_containing_y(y_values, points[:, 1])
+
+    p1 = points[first_segments]
+    p2 = points[first_segments + 1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        m = (p2[:, 1] - p1[:, 1]) / (p2[:, 0] - p1[:, 0])
+        n = p1[:, 1] - (m * p1[:, 0])
+        x_values = (y_values - n) / m
 
+    # Vertical and horizontal segments return the x of their first point like _find_x_by_y()
+    x_values = np.where((p1[:, 0] == p2[:, 0]) | (m == 0), p1[:, 0], x_values)
 
-def _get_y_of_all_points_of_poly2d(poly2d: raillabel.format.Poly2d) -> set[float]:
-    y_values: set[float] = set()
-    for point in poly2d.points:
-        y_values.add(point.y)
-    return y_values
+    return x_values, passes_through
+
+
+def _find_first_segments_containing_y(
+    y_values: np.ndarray, point_ys: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    segment_count = len(point_ys) - 1
+    y_deltas = np.diff(point_ys)
+
+    if np.all(y_deltas >= 0):
+        # The polyline only goes down in the image, so the segments are sorted by y
+        first_segments = np.minimum(
+            np.searchsorted(point_ys[1:], y_values, side="left"), segment_count - 1
+        )
+        passes_through = (point_ys[first_segments] <= y_values) & (
+            y_values <= point_ys[first_segments + 1]
+        )
+        return first_segments, passes_through
+
+    if np.all(y_deltas <= 0):
+        # The polyline only goes up in the image, so the segments are sorted by descending y
+        first_segments = np.minimum(
+            np.searchsorted(-point_ys[1:], -y_values, side="left"), segment_count - 1
+        )
+        passes_through = (point_ys[first_segments + 1] <= y_values) & (
+            y_values <= point_ys[first_segments]
+        )
+        return first_segments, passes_through
+
+    # Polylines that change their direction are swept along the sorted y values instead, while the
+    # segments containing the current y value are kept in a heap ordered by their index
+    lower = np.minimum(point_ys[:-1], point_ys[1:])
+    upper = np.maximum(point_ys[:-1], point_ys[1:])
+    return _sweep_first_segments_containing_y(y_values, lower, upper)
+
+
+def _sweep_first_segments_containing_y(
+    y_values: np.ndarray, lower: np.ndarray, upper: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Find the first segment whose y range contains each of the sorted y values.
+
+    The segments are added to the heap once the sweep reaches their lower bound and removed once
+    it passes their upper bound, so every segment is pushed and popped at most once.
+    """
+    segments_by_lower = np.argsort(lower, kind="stable").tolist()
+    lower_bounds = lower.tolist()
+    upper_bounds = upper.tolist()
+
+    first_segments = np.zeros(len(y_values), dtype=np.intp)
+    passes_through = np.zeros(len(y_values), dtype=bool)
+    active_segments: list[int] = []
+    next_segment = 0
+    for i, y in enumerate(y_values.tolist()):
+        while (
+            next_segment < len(segments_by_lower)
+            and lower_bounds[segments_by_lower[next_segment]] <= y
+        ):
+            heapq.heappush(active_segments, segments_by_lower[next_segment])
+            next_segment += 1
+
+        # The y values only increase, so a segment below the current y never contains one again
+        while len(active_segments) > 0 and upper_bounds[active_segments[0]] < y:
+            heapq.heappop(active_segments)
+
+        if len(active_segments) > 0:
+            first_segments[i] = active_segments[0]
+            passes_through[i] = True
+
+    return first_segments, passes_through
+
+
+def _get_points_as_array(poly2d: raillabel.format.Poly2d) -> np.ndarray:
+    return np.fromiter(
+        (coordinate for point in poly2d.points for coordinate in (point.x, point.y)),
+        dtype=np.float64,
+        count=2 * len(poly2d.points),
+    ).reshape(-1, 2)
 
 
 def _y_in_poly2d(y: float, poly2d: raillabel.format.Poly2d) -> bool:
@@ -4,12 +4,16 @@
 from __future__ import annotations
 
 import json
+import typing as t
 
+from pydantic import BaseModel
 from pydantic_core import ValidationError
 from raillabel.json_format import JSONScene
 
 from raillabel_providerkit.validation import Issue, IssueType
 
+_ModelT = t.TypeVar("_ModelT", bound=BaseModel)
+
 
 def validate_schema(data: dict) -> list[Issue]:
     """Validate a scene for adherence to the raillabel schema.
@@ -25,17 +29,74 @@ def validate_schema(data: dict) -> list[Issue]:
         List of all schema errors in the scene. If an empty list is returned, then there
         are no errors present
     """
+    return _parse_scene(data)[1]
+
+
+def _parse_scene(data: dict) -> tuple[JSONScene | None, list[Issue]]:
+    """Parse the scene and return it together with all schema errors.
+
+    The parsed scene is None if there are schema errors, so that it is only parsed once if it is
+    further processed after the schema validation.
+    """
+    try:
+        json_scene = JSONScene(**data)
+    except ValidationError as errors:
+        return None, _make_errors_readable(errors)
+    else:
+        return json_scene, []
+
+
+def _parse_json(
+    json_data: bytes, model: type[_ModelT], location_prefix: tuple[str, ...] = ()
+) -> tuple[_ModelT | None, list[Issue]]:
+    """Parse raw JSON into the model and return it with all schema errors.
+
+    The JSON is parsed by pydantic-core without creating an intermediate dict, which is faster and
+    needs less memory than loading it with the json module first. Data that is not valid JSON
+    raises a json.JSONDecodeError like json.loads would.
+
+    The location_prefix is prepended to the location of all schema errors, which is needed if only
+    a part of a scene (like a single frame) is parsed.
+    """
     try:
-        JSONScene(**data)
+        parsed_model = model.model_validate_json(json_data)
     except ValidationError as errors:
-        return _make_errors_readable(errors)
+        if any(error["type"] == "json_invalid" for error in errors.errors()):
+            json.loads(json_data)  # raises the same error as json.load
+
+        return None, _parse_invalid_json(json_data, model, location_prefix, errors)
     else:
-        return []
+        return parsed_model, []
 
 
-def _make_errors_readable(errors: ValidationError) -> list[Issue]:  # noqa: C901
+def _parse_invalid_json(
+    json_data: bytes,
+    model: type[_ModelT],
+    location_prefix: tuple[str, ...],
+    json_errors: ValidationError,
+) -> list[Issue]:
+    """Return the schema errors of data that did not adhere to the schema.
+
+    When validating JSON, pydantic words some errors differently (like "valid array" instead of
+    "valid list") and reports the errors of unions in a different order. The data is therefore
+    validated again like a dict, so that the issues are the same as the ones of _parse_scene().
+    This is only done for invalid data, so valid data is still only parsed once.
+    """
+    try:
+        model.model_validate(json.loads(json_data))
+    except ValidationError as errors:
+        return _make_errors_readable(errors, location_prefix)
+    else:
+        return _make_errors_readable(json_errors, location_prefix)
+
+
+def _make_errors_readable(  # noqa: C901
+    errors: ValidationError, location_prefix: tuple[str, ...] = ()
+) -> list[Issue]:
     readable_errors = []
     for error in json.loads(errors.json()):
+        error["loc"] = [*location_prefix, *error["loc"]]
+
         match error["type"]:
             case "missing":
                 readable_errors.append(_convert_missing_error_to_issue(error))
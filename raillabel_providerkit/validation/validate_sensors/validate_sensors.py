@@ -5,6 +5,7 @@ import raillabel
 
 from raillabel_providerkit._util import SENSOR_METADATA
 from raillabel_providerkit.validation import Issue, IssueIdentifiers, IssueType
+from raillabel_providerkit.validation._scene_traversal import _SceneVisitor, traverse_scene
 
 
 def validate_sensors(scene: raillabel.Scene) -> list[Issue]:
@@ -21,9 +22,15 @@ def validate_sensors(scene: raillabel.Scene) -> list[Issue]:
         List of all sensor name errors in the scene. If an empty list is returned, then there
         are no errors present.
     """
-    issues = _validate_sensor_ids(scene)
-    issues.extend(_validate_sensor_types(scene))
-    return issues
+    visitor = _SensorsVisitor(scene)
+    traverse_scene(scene, [visitor])
+    return visitor.issues
+
+
+class _SensorsVisitor(_SceneVisitor):
+    def finish(self) -> None:
+        self.issues.extend(_validate_sensor_ids(self.scene))
+        self.issues.extend(_validate_sensor_types(self.scene))
 
 
 def _validate_sensor_ids(scene: raillabel.Scene) -> list[Issue]:
@@ -2,8 +2,10 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from raillabel import Scene
+from raillabel.format import Frame
 
 from raillabel_providerkit.validation import Issue, IssueIdentifiers, IssueType
+from raillabel_providerkit.validation._scene_traversal import _SceneVisitor, traverse_scene
 
 
 def validate_uris(scene: Scene) -> list[Issue]:
@@ -20,12 +22,17 @@ def validate_uris(scene: Scene) -> list[Issue]:
         List of all uri format errors in the scene. If an empty list is returned, then there
         are no errors present.
     """
-    issues = []
-    for frame_id, frame in scene.frames.items():
+    visitor = _UrisVisitor(scene)
+    traverse_scene(scene, [visitor])
+    return visitor.issues
+
+
+class _UrisVisitor(_SceneVisitor):
+    def visit_frame(self, frame_id: int, frame: Frame) -> None:
         for sensor_id, sensor_reference in frame.sensors.items():
             if _reference_uri_is_valid(sensor_id, sensor_reference.uri):
                 continue
-            issues.append(
+            self.issues.append(
                 Issue(
                     type=IssueType.URI_FORMAT,
                     identifiers=IssueIdentifiers(frame=frame_id, sensor=sensor_id),
@@ -36,8 +43,6 @@ def validate_uris(scene: Scene) -> list[Issue]:
                 )
             )
 
-    return issues
-
 
 def _reference_uri_is_valid(sensor_id: str, uri: str) -> bool:
     return uri.startswith(f"/{sensor_id}/")
@@ -0,0 +1,107 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+
+import pytest
+
+from raillabel_providerkit._util._result_cache import ResultCache
+from raillabel_providerkit.validation import Issue, IssueIdentifiers, IssueType
+
+ISSUES = [
+    Issue(IssueType.EMPTY_FRAMES, IssueIdentifiers(frame=1)),
+    Issue(IssueType.SCHEMA, ["openlabel", "frames"], "Found unexpected field 'a'."),
+]
+
+
+@pytest.fixture
+def scene_path(tmp_path):
+    path = tmp_path / "scene.json"
+    path.write_text('{"openlabel": {}}')
+    return path
+
+
+def test_get__miss(tmp_path, scene_path):
+    cache = ResultCache(tmp_path / "cache", None, {})
+    assert cache.get(cache.key(scene_path)) is None
+
+
+def test_put_and_get(tmp_path, scene_path):
+    cache = ResultCache(tmp_path / "cache", None, {})
+
+    cache.put(cache.key(scene_path), ISSUES)
+
+    assert cache.get(cache.key(scene_path)) == ISSUES
+
+
+def test_put_while_iterating(tmp_path, scene_path):
+    cache = ResultCache(tmp_path / "cache", None, {})
+
+    issues = cache.put_while_iterating(cache.key(scene_path), iter(ISSUES))
+
+    assert next(issues) == ISSUES[0]
+    assert cache.get(cache.key(scene_path)) is None
+    assert list(issues) == ISSUES[1:]
+    assert cache.get(cache.key(scene_path)) == ISSUES
+
+
+def test_put_while_iterating__stopped_early(tmp_path, scene_path):
+    cache = ResultCache(tmp_path / "cache", None, {})
+
+    issues = cache.put_while_iterating(cache.key(scene_path), iter(ISSUES))
+    next(issues)
+    issues.close()
+
+    assert cache.get(cache.key(scene_path)) is None
+    assert list((tmp_path / "cache").iterdir()) == []
+
+
+@pytest.mark.parametrize(
+    "entry", ["{}", "[1]", '[{"identifiers": {}}]', '[{"type": "unknown", "identifiers": []}]', "["]
+)
+def test_get__corrupted_entry_is_a_miss(tmp_path, scene_path, entry):
+    cache = ResultCache(tmp_path / "cache", None, {})
+    cache.put(cache.key(scene_path), ISSUES)
+    (tmp_path / "cache" / f"{cache.key(scene_path)}.json").write_text(entry)
+
+    assert cache.get(cache.key(scene_path)) is None
+
+
+def test_key__changes_with_scene(tmp_path, scene_path):
+    cache = ResultCache(tmp_path / "cache", None, {})
+    key = cache.key(scene_path)
+
+    scene_path.write_text('{"openlabel": {"frames": {}}}')
+
+    assert cache.key(scene_path) != key
+
+
+def test_key__changes_with_ontology_and_options(tmp_path, scene_path):
+    ontology_path = tmp_path / "ontology.yaml"
+    ontology_path.write_text("classes: {}")
+
+    keys = {
+        ResultCache(tmp_path, None, {}).key(scene_path),
+        ResultCache(tmp_path, ontology_path, {}).key(scene_path),
+        ResultCache(tmp_path, None, {"stream_frames": True}).key(scene_path),
+        ResultCache(tmp_path, None, {"version": "1.0.0"}).key(scene_path),
+    }
+
+    assert len(keys) == 4
+
+
+def test_evict__least_recently_used(tmp_path):
+    cache = ResultCache(tmp_path / "cache", None, {})
+    for i, key in enumerate(["a", "b", "c"]):
+        cache.put(key, ISSUES)
+        os.utime(cache.directory / f"{key}.json", ns=(i * 10**9, i * 10**9))
+    cache.get("a")  # marks "a" as the most recently used entry
+    entry_size = (cache.directory / "a.json").stat().st_size
+
+    cache.evict(2 * entry_size)
+
+    assert sorted(path.name for path in cache.directory.iterdir()) == ["a.json", "c.json"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "--disable-pytest-warnings", "--cache-clear", "-v"])
@@ -0,0 +1,416 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import gzip
+import json
+from pathlib import Path
+
+import click
+import pytest
+from click.testing import CliRunner
+from raillabel.scene_builder import SceneBuilder
+
+from raillabel_providerkit.__main__ import (
+    _verify_issues,
+    issues_to_arrow_table,
+    run_raillabel_providerkit,
+    store_issues_to_csv,
+    store_issues_to_json,
+    store_issues_to_jsonl,
+)
+from raillabel_providerkit.validation import Issue, IssueIdentifiers, IssueType
+
+ISSUES = [
+    Issue(IssueType.EMPTY_FRAMES, IssueIdentifiers(frame=1)),
+    Issue(IssueType.SCHEMA, ["openlabel", "frames"], "Found unexpected field 'a'."),
+]
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch) -> Path:
+    cache_home = tmp_path / "cache_home"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    return cache_home
+
+
+def write_scene(path: Path, scene) -> None:
+    path.write_text(scene.to_json().model_dump_json())
+
+
+@pytest.fixture
+def annotations_folder(tmp_path) -> Path:
+    folder = tmp_path / "annotations"
+    folder.mkdir()
+    write_scene(folder / "scene_1.json", SceneBuilder.empty().add_frame().result)
+    write_scene(folder / "scene_2.json", SceneBuilder.empty().add_frame().add_frame().result)
+    return folder
+
+
+@pytest.mark.parametrize("issues", [[], ISSUES[:1], ISSUES])
+def test_store_issues_to_json__same_as_json_dumps(issues, tmp_path):
+    path = tmp_path / "issues.json"
+
+    store_issues_to_json((issue for issue in issues), path)
+
+    assert path.read_text() == json.dumps([issue.serialize() for issue in issues], indent=2)
+
+
+def test_store_issues_to_csv__generator(tmp_path):
+    list_path = tmp_path / "list.csv"
+    generator_path = tmp_path / "generator.csv"
+
+    store_issues_to_csv(ISSUES, list_path)
+    store_issues_to_csv((issue for issue in ISSUES), generator_path)
+
+    assert generator_path.read_text() == list_path.read_text()
+
+
+def test_store_issues_to_jsonl(tmp_path):
+    path = tmp_path / "issues.jsonl"
+
+    store_issues_to_jsonl((issue for issue in ISSUES), path)
+
+    assert path.read_text().splitlines() == [
+        json.dumps(issue.serialize(), separators=(",", ":")) for issue in ISSUES
+    ]
+
+
+def test_store_issues_to_jsonl__gzip(tmp_path):
+    path = tmp_path / "issues.jsonl"
+    compressed_path = tmp_path / "issues.jsonl.gz"
+
+    store_issues_to_jsonl(ISSUES, path)
+    store_issues_to_jsonl(ISSUES, compressed_path, "gzip")
+
+    assert gzip.decompress(compressed_path.read_bytes()) == path.read_bytes()
+
+
+def test_issues_to_arrow_table():
+    pa = pytest.importorskip("pyarrow")
+
+    table = issues_to_arrow_table((issue for issue in ISSUES), "folder/scene.json")
+
+    assert table.column_names == [
+        "type",
+        "frame",
+        "sensor",
+        "object",
+        "object_type",
+        "annotation",
+        "attribute",
+        "schema_path",
+        "reason",
+        "scene",
+    ]
+    assert pa.types.is_dictionary(table.schema.field("type").type)
+    assert pa.types.is_dictionary(table.schema.field("scene").type)
+    assert table.column("type").to_pylist() == ["EmptyFramesIssue", "SchemaIssue"]
+    assert table.column("frame").to_pylist() == [1, None]
+    assert table.column("schema_path").to_pylist() == [None, "['openlabel', 'frames']"]
+    assert table.column("reason").to_pylist() == [None, "Found unexpected field 'a'."]
+    assert table.column("scene").to_pylist() == ["folder/scene.json", "folder/scene.json"]
+
+
+def test_use_parquet(annotations_folder, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    output_folder = tmp_path / "output"
+
+    result = CliRunner().invoke(
+        run_raillabel_providerkit,
+        [str(annotations_folder), str(output_folder), "-q", "--no-json", "--use-parquet"],
+    )
+
+    assert result.exit_code == 0
+    table = pq.read_table(output_folder / "scene_2.issues.parquet")
+    assert table.column("frame").to_pylist() == [1, 2]
+    assert table.column("scene").to_pylist() == ["scene_2.json", "scene_2.json"]
+
+
+def test_sequential(annotations_folder, tmp_path):
+    output_folder = tmp_path / "output"
+
+    result = CliRunner().invoke(
+        run_raillabel_providerkit, [str(annotations_folder), str(output_folder), "-q"]
+    )
+
+    assert result.exit_code == 0
+    assert len(json.loads((output_folder / "scene_1.issues.json").read_text())) == 1
+    assert len(json.loads((output_folder / "scene_2.issues.json").read_text())) == 2
+
+
+def test_stream_frames__same_output(annotations_folder, tmp_path):
+    output_folder = tmp_path / "output"
+    streamed_folder = tmp_path / "streamed"
+
+    CliRunner().invoke(
+        run_raillabel_providerkit, [str(annotations_folder), str(output_folder), "-q"]
+    )
+    result = CliRunner().invoke(
+        run_raillabel_providerkit,
+        [str(annotations_folder), str(streamed_folder), "-q", "--stream-frames"],
+    )
+
+    assert result.exit_code == 0
+    for output_file in output_folder.iterdir():
+        assert (streamed_folder / output_file.name).read_text() == output_file.read_text()
+
+
+def test_verify_output__same_output(annotations_folder, tmp_path):
+    output_folder = tmp_path / "output"
+    verified_folder = tmp_path / "verified"
+
+    CliRunner().invoke(
+        run_raillabel_providerkit,
+        [str(annotations_folder), str(output_folder), "-q", "--use-csv"],
+    )
+    result = CliRunner().invoke(
+        run_raillabel_providerkit,
+        [str(annotations_folder), str(verified_folder), "-q", "--use-csv", "--verify-output"],
+    )
+
+    assert result.exit_code == 0
+    for output_file in output_folder.iterdir():
+        assert (verified_folder / output_file.name).read_text() == output_file.read_text()
+
+
+def test_verify_issues__invalid_issue():
+    invalid_issue = Issue(IssueType.EMPTY_FRAMES, IssueIdentifiers(frame=1), reason=5)
+
+    with pytest.raises(click.ClickException, match=r"\$\.reason"):
+        list(_verify_issues([*ISSUES, invalid_issue], Path("scene.json")))
+
+
+def test_use_jsonl(annotations_folder, tmp_path):
+    output_folder = tmp_path / "output"
+
+    result = CliRunner().invoke(
+        run_raillabel_providerkit,
+        [str(annotations_folder), str(output_folder), "-q", "--no-json", "--use-jsonl"],
+    )
+
+    assert result.exit_code == 0
+    assert sorted(path.name for path in output_folder.iterdir()) == [
+        "scene_1.issues.jsonl",
+        "scene_2.issues.jsonl",
+    ]
+    assert len((output_folder / "scene_2.issues.jsonl").read_text().splitlines()) == 2
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_single_output(annotations_folder, tmp_path, jobs):
+    output_folder = tmp_path / "output"
+    (annotations_folder / "subfolder").mkdir()
+    write_scene(
+        annotations_folder / "subfolder" / "scene_3.json", SceneBuilder.empty().add_frame().result
+    )
+
+    result = CliRunner().invoke(
+        run_raillabel_providerkit,
+        [
+            str(annotations_folder),
+            str(output_folder),
+            "-q",
+            "--no-json",
+            "--use-jsonl",
+            "--single-output",
+            "--compression",
+            "gzip",
+            "--jobs",
+            jobs,
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert [path.name for path in output_folder.iterdir()] == ["issues.jsonl.gz"]
+    issues = [
+        json.loads(line)
+        for line in gzip.decompress((output_folder / "issues.jsonl.gz").read_bytes()).splitlines()
+    ]
+    assert sorted(issue["scene"] for issue in issues) == [
+        "scene_1.json",
+        "scene_2.json",
+        "scene_2.json",
+        "subfolder/scene_3.json",
+    ]
+
+
+def test_single_output__requires_jsonl(annotations_folder, tmp_path):
+    result = CliRunner().invoke(
+        run_raillabel_providerkit,
+        [str(annotations_folder), str(tmp_path / "output"), "-q", "--single-output"],
+    )
+
+    assert result.exit_code != 0
+    assert "--use-jsonl" in result.output
+
+
+def test_cache__hit_does_not_validate_again(annotations_folder, tmp_path, cache_home, monkeypatch):
+    output_folder = tmp_path / "output"
+    cached_folder = tmp_path / "cached"
+    CliRunner().invoke(
+        run_raillabel_providerkit, [str(annotations_folder), str(output_folder), "-q"]
+    )
+
+    def fail(*args, **kwargs):
+        raise AssertionError
+
+    monkeypatch.setattr("raillabel_providerkit.__main__.iter_issues", fail)
+    result = CliRunner().invoke(
+        run_raillabel_providerkit, [str(annotations_folder), str(cached_folder), "-q"]
+    )
+
+    assert result.exit_code == 0
+    assert len(list((cache_home / "raillabel_providerkit").iterdir())) == 2
+    for output_file in output_folder.iterdir():
+        assert (cached_folder / output_file.name).read_text() == output_file.read_text()
+
+
+def test_no_cache(annotations_folder, tmp_path, cache_home):
+    result = CliRunner().invoke(
+        run_raillabel_providerkit,
+        [str(annotations_folder), str(tmp_path / "output"), "-q", "--no-cache"],
+    )
+
+    assert result.exit_code == 0
+    assert not cache_home.exists()
+
+
+def test_skip(annotations_folder, tmp_path):
+    output_folder = tmp_path / "output"
+    skipped_folder = tmp_path / "skipped"
+    CliRunner().invoke(
+        run_raillabel_providerkit, [str(annotations_folder), str(output_folder), "-q"]
+    )
+
+    result = CliRunner().invoke(
+        run_raillabel_providerkit,
+        [str(annotations_folder), str(skipped_folder), "-q", "--skip", "empty_frames"],
+    )
+
+    assert result.exit_code == 0
+    assert len(json.loads((output_folder / "scene_2.issues.json").read_text())) == 2
+    assert json.loads((skipped_folder / "scene_2.issues.json").read_text()) == []
+
+
+def test_only(annotations_folder, tmp_path):
+    output_folder = tmp_path / "output"
+
+    result = CliRunner().invoke(
+        run_raillabel_providerkit,
+        [
+            str(annotations_folder),
+            str(output_folder),
+            "-q",
+            "--only",
+            "sensors",
+            "--only",
+            "empty_frames",
+        ],
+    )
+
+    assert result.exit_code == 0
+    issues = json.loads((output_folder / "scene_2.issues.json").read_text())
+    assert [issue["type"] for issue in issues] == ["EmptyFramesIssue", "EmptyFramesIssue"]
+
+
+def test_only__unknown_check(annotations_folder, tmp_path):
+    result = CliRunner().invoke(
+        run_raillabel_providerkit,
+        [str(annotations_folder), str(tmp_path / "output"), "-q", "--only", "unknown"],
+    )
+
+    assert result.exit_code != 0
+    assert "empty_frames" in result.output
+
+
+def test_only__ontology_requires_ontology(annotations_folder, tmp_path):
+    result = CliRunner().invoke(
+        run_raillabel_providerkit,
+        [str(annotations_folder), str(tmp_path / "output"), "-q", "--only", "ontology"],
+    )
+
+    assert result.exit_code != 0
+    assert "--ontology" in result.output
+
+
+def test_jobs__same_output_as_sequential(annotations_folder, tmp_path):
+    sequential_folder = tmp_path / "sequential"
+    parallel_folder = tmp_path / "parallel"
+
+    CliRunner().invoke(
+        run_raillabel_providerkit,
+        [str(annotations_folder), str(sequential_folder), "-q", "--use-csv"],
+    )
+    result = CliRunner().invoke(
+        run_raillabel_providerkit,
+        [str(annotations_folder), str(parallel_folder), "-q", "--use-csv", "--jobs", "2"],
+    )
+
+    assert result.exit_code == 0
+    for sequential_file in sequential_folder.iterdir():
+        parallel_file = parallel_folder / sequential_file.name
+        assert parallel_file.read_text() == sequential_file.read_text()
+
+
+def test_jobs__broken_scene_does_not_stop_run(annotations_folder, tmp_path):
+    output_folder = tmp_path / "output"
+    (annotations_folder / "broken.json").write_text("{ this is not json")
+
+    result = CliRunner().invoke(
+        run_raillabel_providerkit, [str(annotations_folder), str(output_folder), "-q", "-j", "2"]
+    )
+
+    assert result.exit_code != 0
+    assert "broken.json" in result.output
+    assert (output_folder / "scene_1.issues.json").exists()
+    assert (output_folder / "scene_2.issues.json").exists()
+    assert not (output_folder / "broken.issues.json").exists()
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_metrics(annotations_folder, tmp_path, jobs):
+    metrics_path = tmp_path / "metrics.jsonl"
+
+    result = CliRunner().invoke(
+        run_raillabel_providerkit,
+        [
+            str(annotations_folder),
+            str(tmp_path / "output"),
+            "-q",
+            "--jobs",
+            jobs,
+            "--metrics",
+            str(metrics_path),
+        ],
+    )
+
+    assert result.exit_code == 0
+    metrics = sorted(
+        (json.loads(line) for line in metrics_path.read_text().splitlines()),
+        key=lambda scene_metrics: scene_metrics["scene"],
+    )
+    assert [scene_metrics["scene"] for scene_metrics in metrics] == ["scene_1.json", "scene_2.json"]
+    assert [scene_metrics["frame_count"] for scene_metrics in metrics] == [1, 2]
+    assert metrics[1]["issues_per_type"] == {"EmptyFramesIssue": 2}
+    assert {"read_file", "schema", "serialization"} <= set(metrics[1]["stages"])
+
+
+def test_metrics__cache_hit(annotations_folder, tmp_path):
+    metrics_path = tmp_path / "metrics.jsonl"
+    CliRunner().invoke(
+        run_raillabel_providerkit, [str(annotations_folder), str(tmp_path / "output"), "-q"]
+    )
+
+    result = CliRunner().invoke(
+        run_raillabel_providerkit,
+        [str(annotations_folder), str(tmp_path / "cached"), "-q", "--metrics", str(metrics_path)],
+    )
+
+    assert result.exit_code == 0
+    scene_metrics = json.loads(metrics_path.read_text().splitlines()[1])
+    assert scene_metrics["issues_per_type"] == {"EmptyFramesIssue": 2}
+    assert set(scene_metrics["stages"]) == {"read_cache", "serialization"}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "--disable-pytest-warnings", "--cache-clear", "-v"])
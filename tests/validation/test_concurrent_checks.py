@@ -0,0 +1,75 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+from pathlib import Path
+from uuid import UUID
+
+import pytest
+
+from raillabel_providerkit import validate
+from raillabel_providerkit.validation import Issue, IssueIdentifiers, IssueType
+from raillabel_providerkit.validation import _concurrent_checks
+from raillabel_providerkit.validation._concurrent_checks import _issue_from_tuple, _issue_to_tuple
+
+ASSETS = Path(__file__).parent.parent / "__assets__"
+
+
+@pytest.fixture
+def multiple_cpus(monkeypatch):
+    monkeypatch.setattr(_concurrent_checks, "_available_cpu_count", lambda: 4)
+
+
+def test_concurrent_checks__same_issues_as_sequential(multiple_cpus):
+    scene_path = ASSETS / "openlabel_v1_short.json"
+    ontology_path = ASSETS / "osdar23_ontology.yaml"
+
+    issues = validate(scene_path, ontology_path, concurrent_checks=True)
+
+    assert len({issue.type for issue in issues}) > 1
+    assert issues == validate(scene_path, ontology_path)
+
+
+def test_concurrent_checks__schema_errors(multiple_cpus):
+    scene_dict = {"openlabel": {}}
+    assert validate(scene_dict, concurrent_checks=True) == validate(scene_dict)
+
+
+def test_concurrent_checks__single_cpu_does_not_fork(monkeypatch):
+    monkeypatch.setattr(_concurrent_checks, "_available_cpu_count", lambda: 1)
+
+    def fail(*args, **kwargs):
+        raise AssertionError
+
+    monkeypatch.setattr(_concurrent_checks, "_fork_process_pool", fail)
+    scene_path = ASSETS / "openlabel_v1_short.json"
+
+    assert validate(scene_path, concurrent_checks=True) == validate(scene_path)
+
+
+def test_concurrent_checks__stream_frames_not_supported():
+    with pytest.raises(ValueError, match="stream_frames"):
+        validate(ASSETS / "openlabel_v1_short.json", concurrent_checks=True, stream_frames=True)
+
+
+@pytest.mark.parametrize(
+    "issue",
+    [
+        Issue(
+            IssueType.ATTRIBUTE_MISSING,
+            IssueIdentifiers(
+                annotation=UUID(int=1),
+                annotation_type="Bbox",
+                attribute="occlusion",
+                frame=0,
+                object=UUID(int=2),
+                object_type="person",
+                sensor="rgb_center",
+            ),
+            "reason",
+        ),
+        Issue(IssueType.EMPTY_FRAMES, IssueIdentifiers(frame=1)),
+        Issue(IssueType.SCHEMA, ["openlabel", "frames", 1], "Found unexpected field 'a'."),
+    ],
+)
+def test_issue_tuple__round_trip(issue):
+    assert _issue_from_tuple(_issue_to_tuple(issue)) == issue
@@ -1,13 +1,17 @@
 # Copyright DB InfraGO AG and contributors
 # SPDX-License-Identifier: Apache-2.0
 
+import gzip
+import json
+
 import jsonschema.exceptions
 import pytest
 from uuid import UUID
 
 import jsonschema
 
-from raillabel_providerkit.validation import Issue, IssueIdentifiers, IssueType
+from raillabel_providerkit.__main__ import store_issues_to_jsonl
+from raillabel_providerkit.validation import Issue, IssueIdentifiers, IssueType, load_issues
 
 
 def test_issue_identifiers_serialize__empty():
@@ -36,6 +40,27 @@ def test_issue_identifiers_serialize__filled():
     }
 
 
+def test_issue_identifiers_serialize__keep_none_string_and_zero():
+    identifiers = IssueIdentifiers(attribute="None", frame=0)
+    assert identifiers.serialize() == {"attribute": "None", "frame": 0}
+
+
+def test_issue_identifiers__strings_are_interned():
+    sensor_id = "".join(["rgb_", "center"])
+    identifiers_1 = IssueIdentifiers(attribute="".join(["likes_", "trains"]), sensor=sensor_id)
+    identifiers_2 = IssueIdentifiers(attribute="".join(["likes_", "trains"]), sensor="rgb_center")
+
+    assert identifiers_1.sensor is identifiers_2.sensor
+    assert identifiers_1.attribute is identifiers_2.attribute
+
+
+def test_issue__no_instance_dict():
+    issue = Issue(IssueType.EMPTY_FRAMES, IssueIdentifiers(frame=1))
+
+    assert not hasattr(issue, "__dict__")
+    assert not hasattr(issue.identifiers, "__dict__")
+
+
 def test_issue_identifiers_deserialize__empty():
     identifiers = IssueIdentifiers.deserialize({})
     assert identifiers == IssueIdentifiers(
@@ -258,5 +283,67 @@ def test_issue_deserialize__invalid_identifiers_type():
         )
 
 
+ISSUES = [
+    Issue(
+        IssueType.ATTRIBUTE_MISSING,
+        IssueIdentifiers(
+            annotation=UUID("f9b8aa82-e42b-43df-85fb-99ab51145732"),
+            attribute="likes_trains",
+            frame=42,
+            object=UUID("6caf0a36-3872-4368-8d88-801593c7bc24"),
+        ),
+    ),
+    Issue(IssueType.SCHEMA, ["openlabel", "frames"], "Found unexpected field 'a'."),
+]
+
+
+def test_load_issues__json(tmp_path):
+    path = tmp_path / "scene.issues.json"
+    path.write_text(json.dumps([issue.serialize() for issue in ISSUES], indent=2))
+
+    assert load_issues(path) == ISSUES
+
+
+def test_load_issues__jsonl_with_scene(tmp_path):
+    path = tmp_path / "issues.jsonl"
+    path.write_text(
+        "".join(json.dumps({**issue.serialize(), "scene": "scene.json"}) + "\n" for issue in ISSUES)
+    )
+
+    assert load_issues(path) == ISSUES
+
+
+@pytest.mark.parametrize("compression", ["gzip", "zstd"])
+def test_load_issues__compressed_jsonl(tmp_path, compression):
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+    path = tmp_path / ("issues.jsonl" + {"gzip": ".gz", "zstd": ".zst"}[compression])
+    store_issues_to_jsonl(ISSUES, path, compression)
+
+    assert load_issues(path) == ISSUES
+
+
+def test_load_issues__compressed_json(tmp_path):
+    path = tmp_path / "scene.issues.json.gz"
+    path.write_bytes(gzip.compress(json.dumps([issue.serialize() for issue in ISSUES]).encode()))
+
+    assert load_issues(path) == ISSUES
+
+
+def test_load_issues__invalid(tmp_path):
+    path = tmp_path / "scene.issues.json"
+    path.write_text(json.dumps([{"type": "SchemaIssue", "identifiers": "forbidden"}]))
+
+    with pytest.raises(jsonschema.exceptions.ValidationError):
+        load_issues(path)
+
+
+def test_load_issues__trusted_skips_validation(tmp_path):
+    path = tmp_path / "scene.issues.json"
+    path.write_text(json.dumps([{"type": "SchemaIssue", "identifiers": "unchecked"}]))
+
+    assert load_issues(path, trusted=True) == [Issue(IssueType.SCHEMA, "unchecked")]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-vv"])
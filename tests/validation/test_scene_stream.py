@@ -0,0 +1,148 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+
+import pytest
+from raillabel.format import Point2d
+from raillabel.scene_builder import SceneBuilder
+
+from raillabel_providerkit import iter_issues, validate, validate_incremental
+from raillabel_providerkit.validation._scene_stream import _find_frames, _open_scene_stream
+
+
+@pytest.fixture
+def scene_path(tmp_path):
+    scene = (
+        SceneBuilder.empty()
+        .add_frame(frame_id=2)
+        .add_poly2d(
+            frame_id=1,
+            points=[Point2d(0, 0), Point2d(0, 1)],
+            attributes={"railSide": "rightRail", "trackID": 0},
+            object_name="track_0001",
+            sensor_id="rgb_center",
+        )
+        .add_poly2d(
+            frame_id=1,
+            points=[Point2d(1, 0), Point2d(1, 1)],
+            attributes={"railSide": "leftRail", "trackID": 0},
+            object_name="track_0001",
+            sensor_id="rgb_center",
+        )
+        .result
+    )
+    path = tmp_path / "scene.json"
+    path.write_text(scene.to_json().model_dump_json(exclude_none=True))
+    return path
+
+
+def test_find_frames():
+    data = b'{"openlabel": {"objects": {"a": {"name": "}"}}, "frames": {"1": {"x": [1]}, "2": {}}}}'
+
+    frames_span, frame_spans = _find_frames(data)
+
+    assert data[frames_span[0] : frames_span[1]] == b'{"1": {"x": [1]}, "2": {}}'
+    assert [
+        (frame_span.key, data[frame_span.start : frame_span.end]) for frame_span in frame_spans
+    ] == [("1", b'{"x": [1]}'), ("2", b"{}")]
+
+
+def test_find_frames__nested_frames_keys_are_ignored():
+    data = b'{"openlabel": {"objects": {"frames": {"1": {}}}}}'
+
+    frames_span, frame_spans = _find_frames(data)
+
+    assert frames_span is None
+    assert frame_spans == []
+
+
+def test_scene_stream__only_one_frame_at_a_time(scene_path):
+    with _open_scene_stream(scene_path) as scene_stream:
+        assert len(scene_stream.scene.frames) == 0
+        assert len(scene_stream.scene.objects) == 1
+
+        for frame_id, frame in scene_stream.iter_frames():
+            assert scene_stream.scene.frames == {frame_id: frame}
+
+        assert len(scene_stream.scene.frames) == 0
+
+
+def test_validate__same_issues_as_without_streaming(scene_path):
+    issues = validate(scene_path, validate_for_horizon=False)
+
+    assert len(issues) > 0
+    assert validate(scene_path, validate_for_horizon=False, stream_frames=True) == issues
+
+
+def test_validate__schema_errors_in_frames(scene_path):
+    scene_dict = json.loads(scene_path.read_text())
+    scene_dict["openlabel"]["frames"]["1"]["unexpected_field"] = 42
+    scene_dict["openlabel"]["frames"]["2"] = 5
+    scene_path.write_text(json.dumps(scene_dict))
+
+    issues = validate(scene_path, validate_for_horizon=False, stream_frames=True)
+
+    assert len(issues) == 2
+    assert sorted(issues, key=str) == sorted(validate(scene_path), key=str)
+
+
+def test_validate__schema_errors_inside_and_outside_of_frames(scene_path):
+    scene_dict = json.loads(scene_path.read_text())
+    scene_dict["openlabel"]["unexpected_field"] = 42
+    scene_dict["openlabel"]["frames"]["1"]["unexpected_field"] = 42
+    scene_dict["openlabel"]["frames"]["2"] = 5
+    scene_path.write_text(json.dumps(scene_dict))
+
+    issues = validate(scene_path, validate_for_horizon=False, stream_frames=True)
+
+    assert len(issues) == 3
+    assert sorted(issues, key=str) == sorted(validate(scene_path), key=str)
+    assert sorted(
+        iter_issues(scene_path, validate_for_horizon=False, stream_frames=True), key=str
+    ) == sorted(issues, key=str)
+
+
+def test_validate_incremental__schema_errors_inside_and_outside_of_frames(scene_path, tmp_path):
+    scene_dict = json.loads(scene_path.read_text())
+    scene_dict["openlabel"]["unexpected_field"] = 42
+    scene_dict["openlabel"]["frames"]["2"] = 5
+    scene_path.write_text(json.dumps(scene_dict))
+
+    issues = validate_incremental(scene_path, tmp_path / "scene.state", validate_for_horizon=False)
+
+    assert sorted(issues, key=str) == sorted(validate(scene_path), key=str)
+    assert len(issues) == 2
+
+
+def test_scene_stream__frames_are_checked_if_scene_is_invalid(scene_path):
+    scene_dict = json.loads(scene_path.read_text())
+    scene_dict["openlabel"]["unexpected_field"] = 42
+    scene_dict["openlabel"]["frames"]["2"] = 5
+    scene_path.write_text(json.dumps(scene_dict))
+
+    with _open_scene_stream(scene_path) as scene_stream:
+        assert list(scene_stream.iter_frames()) == []
+        assert len(scene_stream.schema_errors) == 2
+
+
+@pytest.mark.parametrize("stream_frames", [False, True])
+def test_validate__schema_errors_in_frames_without_frame_checks(scene_path, stream_frames):
+    scene_dict = json.loads(scene_path.read_text())
+    scene_dict["openlabel"]["frames"]["2"] = 5
+    scene_path.write_text(json.dumps(scene_dict))
+
+    issues = validate(scene_path, stream_frames=stream_frames, only=["sensors"])
+
+    assert issues == validate(scene_path, validate_for_horizon=False, stream_frames=stream_frames)
+    assert len(issues) == 1
+
+
+def test_validate__invalid_frame_id(scene_path):
+    scene_dict = json.loads(scene_path.read_text())
+    scene_dict["openlabel"]["frames"]["not-a-number"] = {}
+    scene_path.write_text(json.dumps(scene_dict))
+
+    assert validate(scene_path, validate_for_horizon=False, stream_frames=True) == validate(
+        scene_dict
+    )
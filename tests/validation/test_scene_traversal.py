@@ -0,0 +1,152 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+from raillabel.format import Bbox
+from raillabel.scene_builder import SceneBuilder
+
+from raillabel_providerkit.validation._scene_traversal import (
+    _FrameIndex,
+    _SceneVisitor,
+    traverse_scene,
+)
+from raillabel_providerkit.validation._scene_views import _AnnotationFilter
+
+
+class RecordingVisitor(_SceneVisitor):
+    def __init__(self, scene):
+        super().__init__(scene)
+        self.calls = []
+
+    def visit_frame(self, frame_id, frame):
+        self.calls.append(("visit_frame", frame_id))
+
+    def visit_annotation(self, frame_id, annotation_id, annotation):
+        self.calls.append(("visit_annotation", frame_id, annotation_id))
+
+    def leave_frame(self, frame_id, frame):
+        self.calls.append(("leave_frame", frame_id))
+
+    def finish(self):
+        self.calls.append(("finish",))
+
+
+class FinishOnlyVisitor(_SceneVisitor):
+    def __init__(self, scene):
+        super().__init__(scene)
+        self.finished = False
+
+    def finish(self):
+        self.finished = True
+
+
+def test_traverse_scene__empty_scene(empty_scene):
+    visitor = RecordingVisitor(empty_scene)
+    traverse_scene(empty_scene, [visitor])
+    assert visitor.calls == [("finish",)]
+
+
+def test_traverse_scene__call_order():
+    scene = (
+        SceneBuilder.empty().add_bbox(frame_id=1).add_bbox(frame_id=1).add_frame(frame_id=2).result
+    )
+    annotation_ids = list(scene.frames[1].annotations.keys())
+
+    visitor = RecordingVisitor(scene)
+    traverse_scene(scene, [visitor])
+
+    assert visitor.calls == [
+        ("visit_frame", 1),
+        ("visit_annotation", 1, annotation_ids[0]),
+        ("visit_annotation", 1, annotation_ids[1]),
+        ("leave_frame", 1),
+        ("visit_frame", 2),
+        ("leave_frame", 2),
+        ("finish",),
+    ]
+
+
+def test_traverse_scene__all_visitors_called():
+    scene = SceneBuilder.empty().add_bbox(frame_id=1).result
+
+    visitors = [RecordingVisitor(scene), RecordingVisitor(scene), FinishOnlyVisitor(scene)]
+    traverse_scene(scene, visitors)
+
+    assert visitors[0].calls == visitors[1].calls
+    assert len(visitors[0].calls) == 4
+    assert visitors[2].finished
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "--disable-pytest-warnings", "--cache-clear", "-v"])
+
+
+def test_frame_index__groups_annotations_and_rails():
+    scene = (
+        SceneBuilder.empty()
+        .add_poly2d(
+            frame_id=1,
+            attributes={"railSide": "leftRail"},
+            object_name="track_0001",
+            sensor_id="rgb_center",
+        )
+        .add_poly2d(
+            frame_id=1,
+            attributes={"railSide": "rightRail"},
+            object_name="track_0001",
+            sensor_id="rgb_center",
+        )
+        .add_bbox(frame_id=1, object_name="person_0001", sensor_id="rgb_left")
+        .result
+    )
+    track_id = next(iter(scene.objects))
+
+    frame_index = _FrameIndex()
+    for annotation in scene.frames[1].annotations.values():
+        frame_index.add(annotation)
+
+    assert list(frame_index.annotations_per_sensor) == ["rgb_center", "rgb_left"]
+    assert len(frame_index.annotations_per_sensor["rgb_center"]) == 2
+    assert list(frame_index.rails) == ["rgb_center"]
+    assert list(frame_index.rails["rgb_center"][track_id]) == ["leftRail", "rightRail"]
+
+
+def test_frame_index__rails_added_after_first_access():
+    scene = (
+        SceneBuilder.empty()
+        .add_poly2d(frame_id=1, attributes={"railSide": "leftRail"}, object_name="track_0001")
+        .add_poly2d(frame_id=1, attributes={"railSide": "rightRail"}, object_name="track_0001")
+        .result
+    )
+    track_id = next(iter(scene.objects))
+    left_rail, right_rail = scene.frames[1].annotations.values()
+
+    frame_index = _FrameIndex()
+    frame_index.add(left_rail)
+    assert list(frame_index.rails["rgb_center"][track_id]) == ["leftRail"]
+    frame_index.add(right_rail)
+
+    assert list(frame_index.rails["rgb_center"][track_id]) == ["leftRail", "rightRail"]
+
+
+def test_annotation_filter__only_matching_annotations_are_visited():
+    class BboxVisitor(RecordingVisitor):
+        annotation_filter = _AnnotationFilter(annotation_types=(Bbox,))
+
+    scene = (
+        SceneBuilder.empty()
+        .add_poly2d(frame_id=1, object_name="track_0001", sensor_id="rgb_center")
+        .add_bbox(frame_id=1, object_name="person_0001", sensor_id="rgb_center")
+        .result
+    )
+    bbox_id = next(
+        annotation_id
+        for annotation_id, annotation in scene.frames[1].annotations.items()
+        if isinstance(annotation, Bbox)
+    )
+    visitor = BboxVisitor(scene)
+
+    traverse_scene(scene, [visitor])
+
+    assert ("visit_annotation", 1, bbox_id) in visitor.calls
+    assert len([call for call in visitor.calls if call[0] == "visit_annotation"]) == 1
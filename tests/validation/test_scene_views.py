@@ -0,0 +1,64 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+from raillabel.format import Bbox, Camera, Poly2d
+from raillabel.scene_builder import SceneBuilder
+
+from raillabel_providerkit.validation._scene_views import _AnnotationFilter
+
+
+@pytest.fixture
+def scene():
+    return (
+        SceneBuilder.empty()
+        .add_poly2d(frame_id=1, object_name="track_0001", sensor_id="rgb_center")
+        .add_bbox(frame_id=1, object_name="person_0001", sensor_id="rgb_center")
+        .add_poly2d(frame_id=2, object_name="track_0001", sensor_id="lidar")
+        .add_poly2d(frame_id=2, object_name="person_0001", sensor_id="rgb_left")
+        .result
+    )
+
+
+def matching_annotations(scene, annotation_filter):
+    return [
+        (frame_id, annotation)
+        for frame_id, frame in scene.frames.items()
+        for annotation in frame.annotations.values()
+        if annotation_filter.matches(scene, annotation)
+    ]
+
+
+def test_annotation_filter__no_predicates(scene):
+    actual = matching_annotations(scene, _AnnotationFilter())
+    assert [frame_id for frame_id, _ in actual] == [1, 1, 2, 2]
+
+
+def test_annotation_filter__annotation_type(scene):
+    actual = matching_annotations(scene, _AnnotationFilter(annotation_types=(Bbox,)))
+    assert len(actual) == 1
+    assert isinstance(actual[0][1], Bbox)
+
+
+def test_annotation_filter__sensor_type(scene):
+    actual = matching_annotations(scene, _AnnotationFilter(sensor_types=(Camera,)))
+    assert [annotation.sensor_id for _, annotation in actual] == [
+        "rgb_center",
+        "rgb_center",
+        "rgb_left",
+    ]
+
+
+def test_annotation_filter__all_predicates(scene):
+    annotation_filter = _AnnotationFilter(
+        annotation_types=(Poly2d,),
+        sensor_types=(Camera,),
+        object_types=frozenset({"track"}),
+    )
+
+    actual = matching_annotations(scene, annotation_filter)
+
+    assert len(actual) == 1
+    frame_id, annotation = actual[0]
+    assert frame_id == 1
+    assert isinstance(annotation, Poly2d)
@@ -9,7 +9,9 @@ import pytest
 from raillabel.scene_builder import SceneBuilder
 from raillabel.format import Point2d, SensorReference, Scene, Size3d
 
-from raillabel_providerkit import validate
+from raillabel_providerkit.validation import IssueType, ValidationMetrics
+from raillabel_providerkit import iter_issues, validate, validate_incremental
+from raillabel_providerkit.validation._scene_stream import _SceneStream
 
 
 def write_to_json(content: dict, path: Path):
@@ -127,5 +129,306 @@ def test_validate_dimensions_included():
     assert len(validate(scene_dict, validate_for_dimensions=True)) == 1
 
 
+def test_validate__only():
+    scene_dict = scene_to_dict(SceneBuilder.empty().add_frame().add_sensor("unknown_sensor").result)
+
+    issues = validate(scene_dict, only=["empty_frames"])
+
+    assert [issue.type for issue in issues] == [IssueType.EMPTY_FRAMES]
+
+
+def test_validate__skip():
+    scene_dict = scene_to_dict(SceneBuilder.empty().add_frame().add_sensor("unknown_sensor").result)
+
+    issues = validate(scene_dict, skip=["empty_frames", "horizon"])
+
+    assert IssueType.EMPTY_FRAMES not in {issue.type for issue in issues}
+    assert len(issues) > 0
+
+
+def test_validate__unknown_check():
+    with pytest.raises(ValueError, match="empty_frames"):
+        validate({"openlabel": {"metadata": {"schema_version": "1.0.0"}}}, only=["unknown"])
+
+
+def test_validate__skipped_ontology_is_not_loaded():
+    scene_dict = {"openlabel": {"metadata": {"schema_version": "1.0.0"}}}
+    invalid_ontology = {"banana": {"is_peelable": {"attribute_type": "not-a-type"}}}
+
+    assert validate(scene_dict, invalid_ontology, skip=["ontology"]) == []
+
+
+def test_iter_issues__same_issues_as_validate():
+    scene = (
+        SceneBuilder.empty()
+        .add_frame(frame_id=1)
+        .add_frame(frame_id=2)
+        .add_sensor("unknown_sensor")
+        .result
+    )
+    scene_dict = scene_to_dict(scene)
+
+    issues = list(iter_issues(scene_dict, validate_for_horizon=False))
+
+    assert len(issues) == 3
+    assert sorted(issues, key=str) == sorted(
+        validate(scene_dict, validate_for_horizon=False), key=str
+    )
+
+
+def test_iter_issues__issues_are_yielded_per_frame():
+    scene_dict = scene_to_dict(SceneBuilder.empty().add_frame(frame_id=1).add_frame(2).result)
+
+    issues = iter_issues(scene_dict)
+
+    assert next(issues).identifiers.frame == 1
+    assert next(issues).identifiers.frame == 2
+
+
+def test_iter_issues__schema_errors():
+    assert list(iter_issues({"openlabel": {}})) == validate({"openlabel": {}})
+
+
+@pytest.fixture
+def incremental_scene_dict() -> dict:
+    scene = (
+        SceneBuilder.empty()
+        .add_bbox(frame_id=1, object_name="banana_0001", attributes={"is_peelable": True})
+        .add_bbox(frame_id=2, object_name="banana_0001", attributes={"is_peelable": False})
+        .add_frame(frame_id=3)
+        .add_poly2d(
+            points=[Point2d(0, 0), Point2d(0, 1)],
+            attributes={"railSide": "rightRail", "trackID": 0},
+            frame_id=4,
+            object_name="track_0001",
+            sensor_id="rgb_center",
+        )
+        .add_poly2d(
+            points=[Point2d(1, 0), Point2d(1, 1)],
+            attributes={"railSide": "leftRail", "trackID": 0},
+            frame_id=4,
+            object_name="track_0001",
+            sensor_id="rgb_center",
+        )
+        .result
+    )
+    return scene_to_dict(scene)
+
+
+@pytest.fixture
+def incremental_ontology() -> dict:
+    return {
+        "banana": {"is_peelable": {"attribute_type": "boolean", "scope": "object"}},
+        "track": {
+            "railSide": {
+                "attribute_type": {"type": "single-select", "options": ["leftRail", "rightRail"]},
+                "scope": "annotation",
+            },
+            "trackID": {"attribute_type": "integer", "scope": "annotation"},
+        },
+    }
+
+
+@pytest.fixture
+def parsed_frames(monkeypatch) -> list[str]:
+    parsed_frames = []
+    parse_frame = _SceneStream.parse_frame
+
+    def counting_parse_frame(self, frame_span):
+        parsed_frames.append(frame_span.key)
+        return parse_frame(self, frame_span)
+
+    monkeypatch.setattr(_SceneStream, "parse_frame", counting_parse_frame)
+    return parsed_frames
+
+
+def test_validate_incremental__same_issues_as_validate(
+    tmp_path, incremental_scene_dict, incremental_ontology
+):
+    scene_path = tmp_path / "scene.json"
+    state_path = tmp_path / "scene.state"
+    write_to_json(incremental_scene_dict, scene_path)
+    expected_issues = validate(
+        scene_path, incremental_ontology, stream_frames=True, validate_for_horizon=False
+    )
+
+    first_issues = validate_incremental(
+        scene_path, state_path, incremental_ontology, validate_for_horizon=False
+    )
+    second_issues = validate_incremental(
+        scene_path, state_path, incremental_ontology, validate_for_horizon=False
+    )
+
+    assert {issue.type for issue in expected_issues} >= {
+        IssueType.ATTRIBUTE_SCOPE,
+        IssueType.EMPTY_FRAMES,
+        IssueType.RAIL_SIDE,
+    }
+    assert first_issues == expected_issues
+    assert second_issues == expected_issues
+
+
+def test_validate_incremental__only_changed_frames_are_parsed(
+    tmp_path, incremental_scene_dict, incremental_ontology, parsed_frames
+):
+    scene_path = tmp_path / "scene.json"
+    state_path = tmp_path / "scene.state"
+    write_to_json(incremental_scene_dict, scene_path)
+    validate_incremental(scene_path, state_path, incremental_ontology, validate_for_horizon=False)
+    parsed_frames.clear()
+
+    validate_incremental(scene_path, state_path, incremental_ontology, validate_for_horizon=False)
+    assert parsed_frames == []
+
+    frame_2 = incremental_scene_dict["openlabel"]["frames"]["2"]
+    next(iter(frame_2["objects"].values()))["object_data"]["bbox"][0]["attributes"]["boolean"][0][
+        "val"
+    ] = True
+    write_to_json(incremental_scene_dict, scene_path)
+    issues = validate_incremental(
+        scene_path, state_path, incremental_ontology, validate_for_horizon=False
+    )
+
+    assert parsed_frames == ["2"]
+    assert issues == validate(scene_path, incremental_ontology, validate_for_horizon=False)
+    assert IssueType.ATTRIBUTE_SCOPE not in {issue.type for issue in issues}
+
+
+def test_validate_incremental__changed_ontology_checks_all_frames(
+    tmp_path, incremental_scene_dict, incremental_ontology, parsed_frames
+):
+    scene_path = tmp_path / "scene.json"
+    state_path = tmp_path / "scene.state"
+    write_to_json(incremental_scene_dict, scene_path)
+    validate_incremental(scene_path, state_path, incremental_ontology, validate_for_horizon=False)
+    parsed_frames.clear()
+
+    incremental_ontology["banana"]["is_peelable"]["scope"] = "annotation"
+    issues = validate_incremental(
+        scene_path, state_path, incremental_ontology, validate_for_horizon=False
+    )
+
+    assert parsed_frames == ["1", "2", "3", "4"]
+    assert issues == validate(scene_path, incremental_ontology, validate_for_horizon=False)
+
+
+def test_validate_incremental__changed_checks_check_all_frames(
+    tmp_path, incremental_scene_dict, parsed_frames
+):
+    scene_path = tmp_path / "scene.json"
+    state_path = tmp_path / "scene.state"
+    write_to_json(incremental_scene_dict, scene_path)
+    validate_incremental(scene_path, state_path, validate_for_horizon=False)
+    parsed_frames.clear()
+
+    issues = validate_incremental(
+        scene_path, state_path, validate_for_empty_frames=False, validate_for_horizon=False
+    )
+
+    assert parsed_frames == ["1", "2", "3", "4"]
+    assert issues == validate(
+        scene_path, validate_for_empty_frames=False, validate_for_horizon=False
+    )
+
+
+@pytest.mark.parametrize(
+    "frames",
+    [None, [], {"1": 42}, {"1": ["fingerprint"]}],
+    ids=["missing", "list", "not_a_list", "wrong_length"],
+)
+def test_validate_incremental__malformed_state_checks_all_frames(
+    tmp_path, incremental_scene_dict, parsed_frames, frames
+):
+    scene_path = tmp_path / "scene.json"
+    state_path = tmp_path / "scene.state"
+    write_to_json(incremental_scene_dict, scene_path)
+    validate_incremental(scene_path, state_path, validate_for_horizon=False)
+    state = json.loads(state_path.read_text())
+    if frames is None:
+        del state["frames"]
+    else:
+        state["frames"] = frames
+    state_path.write_text(json.dumps(state))
+    parsed_frames.clear()
+
+    issues = validate_incremental(scene_path, state_path, validate_for_horizon=False)
+
+    assert parsed_frames == ["1", "2", "3", "4"]
+    assert issues == validate(scene_path, validate_for_horizon=False)
+
+
+def test_validate_incremental__schema_errors(tmp_path, incremental_scene_dict):
+    scene_path = tmp_path / "scene.json"
+    state_path = tmp_path / "scene.state"
+    incremental_scene_dict["openlabel"]["frames"]["3"]["frame_properties"] = "invalid"
+    write_to_json(incremental_scene_dict, scene_path)
+
+    issues = validate_incremental(scene_path, state_path, validate_for_horizon=False)
+
+    assert issues == validate(scene_path, validate_for_horizon=False)
+    assert {issue.type for issue in issues} == {IssueType.SCHEMA}
+    assert not state_path.exists()
+
+
+@pytest.fixture
+def metrics_scene_dict() -> dict:
+    scene = (
+        SceneBuilder.empty()
+        .add_bbox(frame_id=1)
+        .add_bbox(frame_id=1)
+        .add_frame(frame_id=2)
+        .add_sensor("unknown_sensor")
+        .result
+    )
+    return scene_to_dict(scene)
+
+
+@pytest.mark.parametrize("stream_frames", [False, True])
+def test_validate__metrics(tmp_path, metrics_scene_dict, stream_frames):
+    scene_path = tmp_path / "scene.json"
+    write_to_json(metrics_scene_dict, scene_path)
+    metrics = ValidationMetrics()
+
+    issues = validate(
+        scene_path, validate_for_horizon=False, stream_frames=stream_frames, metrics=metrics
+    )
+
+    assert metrics.frame_count == 2
+    assert metrics.annotation_count == 2
+    assert sum(metrics.issues_per_type.values()) == len(issues)
+    assert metrics.issues_per_type["EmptyFramesIssue"] == 1
+    assert {"check:empty_frames", "check:sensors"} <= set(metrics.stages)
+    assert "check:horizon" not in metrics.stages
+    assert all(stage.wall_time >= 0 for stage in metrics.stages.values())
+    if stream_frames:
+        assert {"open_scene_stream", "parse_frames"} <= set(metrics.stages)
+    else:
+        assert {"read_file", "schema", "scene_from_json"} <= set(metrics.stages)
+
+
+def test_validate__metrics_without_frames(metrics_scene_dict):
+    metrics = ValidationMetrics()
+
+    validate(metrics_scene_dict, only=["sensors"], metrics=metrics)
+
+    assert metrics.frame_count == 2
+    assert metrics.annotation_count is None
+    assert set(metrics.stages) == {"schema", "scene_from_json", "check:sensors"}
+
+
+def test_iter_issues__metrics(metrics_scene_dict):
+    metrics = ValidationMetrics()
+
+    issues = list(iter_issues(metrics_scene_dict, validate_for_horizon=False, metrics=metrics))
+
+    assert sum(metrics.issues_per_type.values()) == len(issues)
+    assert metrics.annotation_count == 2
+
+
+def test_validate__metrics_with_concurrent_checks():
+    with pytest.raises(ValueError, match="metrics"):
+        validate({}, concurrent_checks=True, metrics=ValidationMetrics())
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "--disable-pytest-warnings", "--cache-clear", "-v"])
@@ -0,0 +1,192 @@
+# Copyright DB InfraGO AG and contributors
+# SPDX-License-Identifier: Apache-2.0
+
+import copy
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from raillabel.format import Camera, IntrinsicsPinhole, Point2d, Point3d, Quaternion, Transform
+from raillabel.scene_builder import SceneBuilder
+
+from raillabel_providerkit.validation import IssueType, validate_horizon
+from raillabel_providerkit.validation._scene_traversal import iter_traversal_steps
+from raillabel_providerkit.validation.validate_horizon import validate_horizon as horizon_module
+
+
+@pytest.fixture
+def calibrated_camera() -> Camera:
+    # The horizon of this camera is the line y = 755.38
+    return Camera(
+        intrinsics=IntrinsicsPinhole(
+            camera_matrix=(4600.0, 0.0, 1200.0, 0.0, 0.0, 4600.0, 800.0, 0.0, 0.0, 0.0, 1.0, 0.0),
+            distortion=(0.0, 0.0, 0.0, 0.0, 0.0),
+            width_px=2400,
+            height_px=1600,
+        ),
+        extrinsics=Transform(pos=Point3d(0.0, 0.0, 3.0), quat=Quaternion(0.0, 0.0, 0.0, 1.0)),
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_horizon_cache():
+    horizon_module._HORIZON_LINE_CACHE.clear()
+
+
+def build_scene(camera, *points_per_annotation, object_name="track_0001"):
+    builder = SceneBuilder.empty()
+    for frame_id, points in enumerate(points_per_annotation, start=1):
+        builder = builder.add_poly2d(
+            frame_id=frame_id, points=points, object_name=object_name, sensor_id="rgb_center"
+        )
+    scene = builder.result
+    scene.sensors["rgb_center"] = camera
+    return scene
+
+
+def test_validate_horizon__no_issues(calibrated_camera):
+    scene = build_scene(calibrated_camera, [Point2d(0, 1600), Point2d(100, 800)])
+    assert validate_horizon(scene) == []
+
+
+def test_validate_horizon__point_above_horizon(calibrated_camera):
+    scene = build_scene(calibrated_camera, [Point2d(0, 1600), Point2d(100, 700)])
+
+    issues = validate_horizon(scene)
+
+    assert len(issues) == 1
+    assert issues[0].type == IssueType.HORIZON_CROSSED
+    assert issues[0].identifiers.frame == 1
+    assert issues[0].identifiers.sensor == "rgb_center"
+
+
+def test_validate_horizon__only_first_point_above_horizon_reported(calibrated_camera):
+    scene = build_scene(calibrated_camera, [Point2d(0, 1600), Point2d(50, 700), Point2d(100, 600)])
+
+    issues = validate_horizon(scene)
+
+    assert len(issues) == 1
+    assert "x=50" in issues[0].reason
+
+
+def test_validate_horizon__issue_order_across_cameras(calibrated_camera):
+    scene = (
+        SceneBuilder.empty()
+        .add_poly2d(
+            frame_id=1, points=[Point2d(0, 700)], object_name="track_0001", sensor_id="rgb_left"
+        )
+        .add_poly2d(
+            frame_id=1, points=[Point2d(0, 700)], object_name="track_0001", sensor_id="rgb_right"
+        )
+        .add_poly2d(
+            frame_id=2, points=[Point2d(0, 700)], object_name="track_0001", sensor_id="rgb_left"
+        )
+        .result
+    )
+    scene.sensors["rgb_left"] = calibrated_camera
+    scene.sensors["rgb_right"] = calibrated_camera
+
+    issues = validate_horizon(scene)
+
+    assert [(issue.identifiers.frame, issue.identifiers.sensor) for issue in issues] == [
+        (1, "rgb_left"),
+        (1, "rgb_right"),
+        (2, "rgb_left"),
+    ]
+
+
+def test_validate_horizon__points_of_all_frames_checked_at_once(calibrated_camera, monkeypatch):
+    checked_point_counts = []
+
+    class CountingHorizonBatch(horizon_module._HorizonBatch):
+        def check(self):
+            checked_point_counts.append(sum(len(points) for points in self.points))
+            return super().check()
+
+    monkeypatch.setattr(horizon_module, "_HorizonBatch", CountingHorizonBatch)
+
+    scene = build_scene(
+        calibrated_camera,
+        [Point2d(0, 1600), Point2d(100, 700)],
+        [Point2d(0, 1600), Point2d(100, 800)],
+        [Point2d(0, 1600), Point2d(100, 600)],
+    )
+
+    issues = validate_horizon(scene)
+
+    assert [issue.identifiers.frame for issue in issues] == [1, 3]
+    assert checked_point_counts == [6]
+
+
+def test_validate_horizon__checked_per_frame_when_recording_frame_states(
+    calibrated_camera, monkeypatch
+):
+    checked_point_counts = []
+
+    class CountingHorizonBatch(horizon_module._HorizonBatch):
+        def check(self):
+            checked_point_counts.append(sum(len(points) for points in self.points))
+            return super().check()
+
+    monkeypatch.setattr(horizon_module, "_HorizonBatch", CountingHorizonBatch)
+
+    scene = build_scene(
+        calibrated_camera,
+        [Point2d(0, 1600), Point2d(100, 700)],
+        [Point2d(0, 1600), Point2d(100, 800)],
+        [Point2d(0, 1600), Point2d(100, 600)],
+    )
+    visitor = horizon_module._HorizonVisitor(scene)
+    visitor.start_recording_frame_states()
+    issue_counts = []
+    for _ in iter_traversal_steps(scene.frames.items(), [visitor]):
+        issue_counts.append(len(visitor.issues))
+
+    assert issue_counts == [1, 1, 2, 2]
+    assert checked_point_counts == [2, 2, 2]
+
+
+def test_validate_horizon__ignore_other_object_types(calibrated_camera):
+    scene = build_scene(
+        calibrated_camera, [Point2d(0, 1600), Point2d(100, 700)], object_name="person_0001"
+    )
+    assert validate_horizon(scene) == []
+
+
+def test_validate_horizon__horizon_calculated_once_per_calibration(calibrated_camera, monkeypatch):
+    calculated_horizons = []
+
+    class CountingHorizonCalculator(horizon_module._HorizonCalculator):
+        def calculate_horizon(self, *args, **kwargs):
+            calculated_horizons.append(args)
+            return super().calculate_horizon(*args, **kwargs)
+
+    monkeypatch.setattr(horizon_module, "_HorizonCalculator", CountingHorizonCalculator)
+
+    scene = build_scene(
+        calibrated_camera,
+        [Point2d(0, 1600), Point2d(100, 700)],
+        [Point2d(0, 1600), Point2d(100, 800)],
+        [Point2d(0, 1600), Point2d(100, 600)],
+    )
+
+    assert len(validate_horizon(scene)) == 2
+    assert len(validate_horizon(scene)) == 2
+    assert len(calculated_horizons) == 1
+
+
+def test_validate_horizon__cache_shared_by_threads(calibrated_camera, monkeypatch):
+    monkeypatch.setattr(horizon_module, "_HORIZON_LINE_CACHE_SIZE", 1)
+    scenes = []
+    for height in range(8):
+        camera = copy.deepcopy(calibrated_camera)
+        camera.extrinsics.pos.z = 3.0 + height
+        scenes.append(build_scene(camera, [Point2d(0, 1600), Point2d(100, 700)]))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(validate_horizon, scenes * 20))
+
+    assert results == [validate_horizon(scene) for scene in scenes] * 20
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "--disable-pytest-warnings", "--cache-clear", "-v"])
@@ -186,5 +186,27 @@ def test_compile_applicable_attributes__matching(example_boolean_attribute_dict)
     assert "test_attribute" in object_class._compile_applicable_attributes(_SensorType.CAMERA)
 
 
+def test_attribute_tables__compiled_per_sensor_type(example_boolean_attribute_dict):
+    optional_attribute_dict = dict(example_boolean_attribute_dict, optional=True)
+    example_boolean_attribute_dict["sensor_types"] = ["camera"]
+    object_class = _ObjectClass.fromdict(
+        {
+            "camera_attribute": example_boolean_attribute_dict,
+            "optional_attribute": optional_attribute_dict,
+        }
+    )
+
+    camera_table = object_class.attribute_tables[_SensorType.CAMERA]
+    assert list(camera_table.attributes) == ["camera_attribute", "optional_attribute"]
+    assert camera_table.required_attribute_names == {"camera_attribute"}
+    assert set(camera_table.validators) == {"camera_attribute", "optional_attribute"}
+
+    lidar_table = object_class.attribute_tables[_SensorType.LIDAR]
+    assert list(lidar_table.attributes) == ["optional_attribute"]
+    assert lidar_table.required_attribute_names == frozenset()
+
+    assert len(object_class.attribute_tables[None].attributes) == 0
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-vv"])
@@ -10,13 +10,16 @@ from raillabel_providerkit.validation.validate_ontology._ontology_classes import
     _AnnotationWithMetadata,
 )
 from raillabel_providerkit.validation import IssueType, IssueIdentifiers, Issue
+from raillabel_providerkit.validation.validate_ontology._ontology_classes._ontology import (
+    _AttributeScopeChecker,
+    _OntologyVisitor,
+)
 from raillabel.scene_builder import SceneBuilder
 
 
 def test_fromdict__empty():
     ontology = _Ontology.fromdict({})
     assert len(ontology.classes) == 0
-    assert len(ontology.errors) == 0
 
 
 def test_fromdict__simple():
@@ -25,7 +28,6 @@ def test_fromdict__simple():
     )
     assert len(ontology.classes) == 1
     assert "banana" in ontology.classes
-    assert len(ontology.errors) == 0
 
 
 def test_check__empty_scene():
@@ -169,8 +171,7 @@ def test_check__scope_inconsistency():
 def test_check_class_validity__empty_scene():
     ontology = _Ontology.fromdict({})
     scene = SceneBuilder.empty().result
-    ontology._check_class_validity(scene)
-    assert ontology.errors == []
+    assert ontology._check_class_validity(scene) == []
 
 
 def test_check_class_validity__correct():
@@ -178,8 +179,7 @@ def test_check_class_validity__correct():
         {"banana": {"is_peelable": {"attribute_type": "boolean", "scope": "annotation"}}}
     )
     scene = SceneBuilder.empty().add_object(object_type="banana").result
-    ontology._check_class_validity(scene)
-    assert ontology.errors == []
+    assert ontology._check_class_validity(scene) == []
 
 
 def test_check_class_validity__incorrect():
@@ -194,17 +194,40 @@ def test_check_class_validity__incorrect():
         )
         .result
     )
-    ontology._check_class_validity(scene)
-    assert len(ontology.errors) == 1
-    assert ontology.errors[0].type == IssueType.OBJECT_TYPE_UNDEFINED
-    assert ontology.errors[0].identifiers == IssueIdentifiers(
+    errors = ontology._check_class_validity(scene)
+    assert len(errors) == 1
+    assert errors[0].type == IssueType.OBJECT_TYPE_UNDEFINED
+    assert errors[0].identifiers == IssueIdentifiers(
         object=UUID("ba73e75d-b996-4f6e-bdad-39c465420a33"), object_type="apple"
     )
 
 
+def test_check_class_validity__shared_ontology_keeps_no_scene_state():
+    ontology = _Ontology.fromdict(
+        {"banana": {"is_peelable": {"attribute_type": "boolean", "scope": "annotation"}}}
+    )
+    invalid_scene = SceneBuilder.empty().add_object(object_name="apple_0000").result
+    valid_scene = SceneBuilder.empty().add_object(object_type="banana").result
+
+    invalid_visitor = _OntologyVisitor(invalid_scene, ontology)
+    valid_visitor = _OntologyVisitor(valid_scene, ontology)
+
+    assert len(invalid_visitor.issues) == 1
+    assert valid_visitor.issues == []
+
+
+def check_attribute_scopes(
+    ontology: _Ontology, annotations_with_metadata: list[_AnnotationWithMetadata]
+) -> list[Issue]:
+    scope_checker = _AttributeScopeChecker(ontology)
+    for annotation_with_metadata in annotations_with_metadata:
+        scope_checker.add(annotation_with_metadata)
+    return scope_checker.errors
+
+
 def test_check_attribute_scopes__empty():
     ontology = _Ontology.fromdict({})
-    assert ontology._check_attribute_scopes([]) == []
+    assert check_attribute_scopes(ontology, []) == []
 
 
 def test_check_attribute_scopes__annotation(sample_uuid_1, sample_uuid_2, sample_uuid_3):
@@ -238,12 +261,13 @@ def test_check_attribute_scopes__annotation(sample_uuid_1, sample_uuid_2, sample
         .result
     )
     assert (
-        ontology._check_attribute_scopes(
+        check_attribute_scopes(
+            ontology,
             [
                 _AnnotationWithMetadata(sample_uuid_1, 0, scene),
                 _AnnotationWithMetadata(sample_uuid_2, 0, scene),
                 _AnnotationWithMetadata(sample_uuid_3, 0, scene),
-            ]
+            ],
         )
         == []
     )
@@ -290,13 +314,14 @@ def test_check_attribute_scopes__frame_correct(
         .result
     )
     assert (
-        ontology._check_attribute_scopes(
+        check_attribute_scopes(
+            ontology,
             [
                 _AnnotationWithMetadata(sample_uuid_1, 0, scene),
                 _AnnotationWithMetadata(sample_uuid_2, 0, scene),
                 _AnnotationWithMetadata(sample_uuid_3, 1, scene),
                 _AnnotationWithMetadata(sample_uuid_4, 0, scene),
-            ]
+            ],
         )
         == []
     )
@@ -348,14 +373,15 @@ def test_check_attribute_scopes__frame_incorrect(
         )
         .result
     )
-    errors = ontology._check_attribute_scopes(
+    errors = check_attribute_scopes(
+        ontology,
         [
             _AnnotationWithMetadata(sample_uuid_1, 0, scene),
             _AnnotationWithMetadata(sample_uuid_2, 0, scene),
             _AnnotationWithMetadata(sample_uuid_3, 0, scene),
             _AnnotationWithMetadata(sample_uuid_4, 0, scene),
             _AnnotationWithMetadata(sample_uuid_5, 1, scene),
-        ]
+        ],
     )
     assert len(errors) == 2
     for error in errors:
@@ -410,14 +436,15 @@ def test_check_attribute_scopes__object_correct(
         .result
     )
     assert (
-        ontology._check_attribute_scopes(
+        check_attribute_scopes(
+            ontology,
             [
                 _AnnotationWithMetadata(sample_uuid_1, 0, scene),
                 _AnnotationWithMetadata(sample_uuid_2, 20, scene),
                 _AnnotationWithMetadata(sample_uuid_3, 0, scene),
                 _AnnotationWithMetadata(sample_uuid_4, 42, scene),
                 _AnnotationWithMetadata(sample_uuid_5, 1, scene),
-            ]
+            ],
         )
         == []
     )
@@ -470,14 +497,15 @@ def test_check_attribute_scopes__object_incorrect(
         )
         .result
     )
-    errors = ontology._check_attribute_scopes(
+    errors = check_attribute_scopes(
+        ontology,
         [
             _AnnotationWithMetadata(sample_uuid_1, 0, scene),
             _AnnotationWithMetadata(sample_uuid_2, 20, scene),
             _AnnotationWithMetadata(sample_uuid_3, 0, scene),
             _AnnotationWithMetadata(sample_uuid_4, 42, scene),
             _AnnotationWithMetadata(sample_uuid_5, 1, scene),
-        ]
+        ],
     )
     assert len(errors) == 3
     for error in errors:
@@ -508,11 +536,12 @@ def test_check_attribute_scopes__ignore_unknown_attribute(sample_uuid_1, sample_
         .result
     )
     assert (
-        ontology._check_attribute_scopes(
+        check_attribute_scopes(
+            ontology,
             [
                 _AnnotationWithMetadata(sample_uuid_1, 0, scene),
                 _AnnotationWithMetadata(sample_uuid_2, 20, scene),
-            ]
+            ],
         )
         == []
     )
@@ -542,41 +571,114 @@ def test_check_attribute_scopes__ignore_missing_attribute_from_one(sample_uuid_1
         .result
     )
     assert (
-        ontology._check_attribute_scopes(
+        check_attribute_scopes(
+            ontology,
             [
                 _AnnotationWithMetadata(sample_uuid_1, 0, scene),
                 _AnnotationWithMetadata(sample_uuid_2, 20, scene),
-            ]
+            ],
         )
         == []
     )
 
 
-def test_compile_annotations__empty_scene():
-    scene = SceneBuilder.empty().result
-    annotations = _Ontology._compile_annotations(scene)
-    assert len(annotations) == 0
+def test_check_attribute_scopes__missing_attribute_does_not_hide_errors(
+    sample_uuid_1, sample_uuid_2, sample_uuid_3
+):
+    ontology = _Ontology.fromdict(
+        {"person": {"greeting": {"attribute_type": "string", "scope": "object"}}}
+    )
+    scene = (
+        SceneBuilder.empty()
+        .add_object(object_name="person_0001")
+        .add_bbox(
+            uid=sample_uuid_1,
+            frame_id=0,
+            object_name="person_0001",
+            attributes={"greeting": "hello"},
+            sensor_id="rgb_center",
+        )
+        .add_bbox(
+            uid=sample_uuid_2,
+            frame_id=1,
+            object_name="person_0001",
+            attributes={},
+            sensor_id="rgb_center",
+        )
+        .add_bbox(
+            uid=sample_uuid_3,
+            frame_id=2,
+            object_name="person_0001",
+            attributes={"greeting": "hi"},
+            sensor_id="rgb_center",
+        )
+        .result
+    )
+    errors = check_attribute_scopes(
+        ontology,
+        [
+            _AnnotationWithMetadata(sample_uuid_1, 0, scene),
+            _AnnotationWithMetadata(sample_uuid_2, 1, scene),
+            _AnnotationWithMetadata(sample_uuid_3, 2, scene),
+        ],
+    )
+    assert len(errors) == 1
+    assert errors[0].type == IssueType.ATTRIBUTE_SCOPE
+    assert errors[0].identifiers.annotation == sample_uuid_3
 
 
-def test_compile_annotations__three_annotations_in_two_frames():
+def test_check_attribute_scopes__every_object_is_checked(
+    sample_uuid_1, sample_uuid_2, sample_uuid_3, sample_uuid_4
+):
+    ontology = _Ontology.fromdict(
+        {"person": {"greeting": {"attribute_type": "string", "scope": "object"}}}
+    )
     scene = (
         SceneBuilder.empty()
+        .add_object(object_name="person_0001")
+        .add_object(object_name="person_0002")
         .add_bbox(
+            uid=sample_uuid_1,
             frame_id=0,
-            object_name="box_0001",
+            object_name="person_0001",
+            attributes={"greeting": "hello"},
+            sensor_id="rgb_center",
         )
         .add_bbox(
+            uid=sample_uuid_2,
             frame_id=0,
-            object_name="box_0002",
+            object_name="person_0002",
+            attributes={"greeting": "hey"},
+            sensor_id="rgb_center",
+        )
+        .add_bbox(
+            uid=sample_uuid_3,
+            frame_id=1,
+            object_name="person_0001",
+            attributes={"greeting": "hello"},
+            sensor_id="rgb_center",
         )
         .add_bbox(
+            uid=sample_uuid_4,
             frame_id=1,
-            object_name="box_0003",
+            object_name="person_0002",
+            attributes={"greeting": "hi"},
+            sensor_id="rgb_center",
         )
         .result
     )
-    annotations = _Ontology._compile_annotations(scene)
-    assert len(annotations) == 3
+    errors = check_attribute_scopes(
+        ontology,
+        [
+            _AnnotationWithMetadata(sample_uuid_1, 0, scene),
+            _AnnotationWithMetadata(sample_uuid_2, 0, scene),
+            _AnnotationWithMetadata(sample_uuid_3, 1, scene),
+            _AnnotationWithMetadata(sample_uuid_4, 1, scene),
+        ],
+    )
+    assert len(errors) == 1
+    assert errors[0].identifiers.annotation == sample_uuid_4
+    assert str(sample_uuid_2) in errors[0].reason
 
 
 if __name__ == "__main__":
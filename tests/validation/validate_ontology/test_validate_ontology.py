@@ -1,11 +1,14 @@
 # Copyright DB InfraGO AG and contributors
 # SPDX-License-Identifier: Apache-2.0
 
+import os
 import pytest
 from pathlib import Path
 from uuid import UUID
 
+from raillabel_providerkit.exceptions import OntologySchemaError
 from raillabel_providerkit.validation.validate_ontology.validate_ontology import (
+    load_ontology,
     validate_ontology,
     _load_ontology,
 )
@@ -85,6 +88,40 @@ def test_load_ontology__osdar23():
     assert isinstance(ontology_dict, dict)
 
 
+def test_load_ontology__compiled_ontology_is_accepted(example_ontology_dict):
+    scene = (
+        SceneBuilder.empty()
+        .add_object(object_type="banana", object_name="banana_0001")
+        .add_bbox(object_name="banana_0001", attributes={"is_peelable": "yes"})
+        .result
+    )
+    ontology = load_ontology(example_ontology_dict)
+
+    assert validate_ontology(scene, ontology) == validate_ontology(scene, example_ontology_dict)
+
+
+def test_load_ontology__invalid_ontology():
+    with pytest.raises(OntologySchemaError):
+        load_ontology({"banana": {"is_peelable": {"attribute_type": "no-type"}}})
+
+
+def test_load_ontology__file_is_loaded_once():
+    assert load_ontology(ONTOLOGY_PATH) is load_ontology(ONTOLOGY_PATH)
+
+
+def test_load_ontology__modified_file_is_reloaded(tmp_path):
+    ontology_path = tmp_path / "ontology.yaml"
+    ontology_path.write_text("banana: {}\n")
+    first_ontology = load_ontology(ontology_path)
+
+    ontology_path.write_text("apple: {}\n")
+    os.utime(ontology_path, ns=(0, ontology_path.stat().st_mtime_ns + 1))
+    second_ontology = load_ontology(ontology_path)
+
+    assert list(first_ontology.classes) == ["banana"]
+    assert list(second_ontology.classes) == ["apple"]
+
+
 def test_unexpected_class(example_ontology_dict):
     scene = SceneBuilder.empty().add_bbox(object_name="apple_0001").result
 
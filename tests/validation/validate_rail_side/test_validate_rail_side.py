@@ -3,15 +3,21 @@
 
 from uuid import UUID
 
+import numpy as np
 import pytest
-from raillabel.format import Point2d, Scene
+from raillabel.format import Point2d, Poly2d, Scene
 from raillabel.scene_builder import SceneBuilder
 
 from raillabel_providerkit.validation.validate_rail_side.validate_rail_side import (
     validate_rail_side,
     _count_rails_per_track_in_frame,
+    _find_x_by_y,
+    _find_x_by_y_vectorized,
+    _get_points_as_array,
+    _polylines_are_intersecting,
 )
 from raillabel_providerkit.validation import Issue, IssueIdentifiers, IssueType
+from raillabel_providerkit.validation._scene_traversal import _FrameIndex
 
 
 def add_left_rails(
@@ -58,9 +64,16 @@ def get_object_id_from_object_name(scene: Scene, object_name: str) -> UUID:
     raise KeyError
 
 
+def _build_frame_index(frame) -> _FrameIndex:
+    frame_index = _FrameIndex()
+    for annotation in frame.annotations.values():
+        frame_index.add(annotation)
+    return frame_index
+
+
 def test_count_rails_per_track_in_frame__empty(empty_frame):
     frame = empty_frame
-    results = _count_rails_per_track_in_frame(frame)
+    results = _count_rails_per_track_in_frame(_build_frame_index(frame).rails.get("rgb_center", {}))
     assert len(results) == 0
 
 
@@ -70,7 +83,7 @@ def test_count_rails_per_track_in_frame__many_rails_for_one_track():
     builder = add_right_rails(builder, 42, "track_0001")
     scene = builder.result
 
-    actual = _count_rails_per_track_in_frame(scene.frames[1])
+    actual = _count_rails_per_track_in_frame(_build_frame_index(scene.frames[1]).rails["rgb_center"])
     assert actual == {get_object_id_from_object_name(scene, "track_0001"): (32, 42)}
 
 
@@ -85,13 +98,41 @@ def test_count_rails_per_track_in_frame__many_rails_for_two_tracks():
 
     scene = builder.result
 
-    actual = _count_rails_per_track_in_frame(scene.frames[1])
+    actual = _count_rails_per_track_in_frame(_build_frame_index(scene.frames[1]).rails["rgb_center"])
     assert actual == {
         get_object_id_from_object_name(scene, "track_0001"): (32, 42),
         get_object_id_from_object_name(scene, "track_0002"): (12, 22),
     }
 
 
+def test_count_rails_per_track_in_frame__other_rail_sides_are_ignored():
+    scene = (
+        SceneBuilder.empty()
+        .add_poly2d(
+            frame_id=1,
+            attributes={"railSide": "leftRail"},
+            object_name="track_0001",
+            sensor_id="rgb_center",
+        )
+        .add_poly2d(
+            frame_id=1,
+            attributes={"railSide": "middleRail"},
+            object_name="track_0001",
+            sensor_id="rgb_center",
+        )
+        .add_poly2d(
+            frame_id=1,
+            attributes={},
+            object_name="track_0001",
+            sensor_id="rgb_center",
+        )
+        .result
+    )
+
+    actual = _count_rails_per_track_in_frame(_build_frame_index(scene.frames[1]).rails["rgb_center"])
+    assert actual == {get_object_id_from_object_name(scene, "track_0001"): (1, 0)}
+
+
 def test_validate_rail_side__no_errors():
     builder = SceneBuilder.empty()
     builder = add_left_rails(builder, n=1)
@@ -274,5 +315,96 @@ def test_validate_rail_side__two_sensors_with_one_right_rail_each():
     assert len(actual) == 0
 
 
+@pytest.mark.parametrize(
+    "points",
+    [
+        [],
+        [Point2d(0, 0)],
+        [Point2d(0, 0), Point2d(10, 100), Point2d(10, 100), Point2d(15, 150), Point2d(30, 150)],
+        [Point2d(50, 200), Point2d(40, 150), Point2d(45, 150), Point2d(30, 20)],
+        [Point2d(0, 0), Point2d(10, 100), Point2d(20, 50), Point2d(20, 120), Point2d(0, 10)],
+    ],
+)
+def test_find_x_by_y_vectorized__same_as_find_x_by_y(points):
+    poly2d = Poly2d(
+        object_id=UUID("7df959d7-0ec2-4722-8b62-bb2e529de2ec"),
+        sensor_id="rgb_center",
+        points=points,
+        closed=False,
+        attributes={},
+    )
+    y_values = np.array([-1.0, 0.0, 10.0, 20.0, 50.0, 75.0, 100.0, 120.0, 150.0, 170.0, 200.0])
+
+    x_values, passes_through = _find_x_by_y_vectorized(y_values, _get_points_as_array(poly2d))
+
+    for y, x, passes in zip(y_values, x_values, passes_through):
+        expected = _find_x_by_y(y, poly2d)
+        assert passes == (expected is not None)
+        if passes:
+            assert x == expected
+
+
+def test_find_x_by_y_vectorized__wiggly_polyline_same_as_find_x_by_y():
+    random = np.random.default_rng(42)
+    points = [
+        Point2d(float(x), float(y))
+        for x, y in zip(
+            random.integers(0, 100, size=200), random.integers(0, 50, size=200), strict=True
+        )
+    ]
+    poly2d = Poly2d(
+        object_id=UUID("7df959d7-0ec2-4722-8b62-bb2e529de2ec"),
+        sensor_id="rgb_center",
+        points=points,
+        closed=False,
+        attributes={},
+    )
+    y_values = np.arange(-1.0, 52.0, 0.5)
+
+    x_values, passes_through = _find_x_by_y_vectorized(y_values, _get_points_as_array(poly2d))
+
+    for y, x, passes in zip(y_values, x_values, passes_through):
+        expected = _find_x_by_y(y, poly2d)
+        assert passes == (expected is not None)
+        if passes:
+            assert x == expected
+
+
+def test_polylines_are_intersecting__crossing():
+    line1 = Poly2d(
+        object_id=UUID("7df959d7-0ec2-4722-8b62-bb2e529de2ec"),
+        sensor_id="rgb_center",
+        points=[Point2d(0, 0), Point2d(10, 50), Point2d(20, 100)],
+        closed=False,
+        attributes={},
+    )
+    line2 = Poly2d(
+        object_id=UUID("7df959d7-0ec2-4722-8b62-bb2e529de2ec"),
+        sensor_id="rgb_center",
+        points=[Point2d(20, 0), Point2d(0, 100)],
+        closed=False,
+        attributes={},
+    )
+    assert _polylines_are_intersecting(line1, line2)
+
+
+def test_polylines_are_intersecting__parallel():
+    line1 = Poly2d(
+        object_id=UUID("7df959d7-0ec2-4722-8b62-bb2e529de2ec"),
+        sensor_id="rgb_center",
+        points=[Point2d(0, 0), Point2d(10, 50), Point2d(20, 100)],
+        closed=False,
+        attributes={},
+    )
+    line2 = Poly2d(
+        object_id=UUID("7df959d7-0ec2-4722-8b62-bb2e529de2ec"),
+        sensor_id="rgb_center",
+        points=[Point2d(30, 0), Point2d(40, 50), Point2d(50, 100)],
+        closed=False,
+        attributes={},
+    )
+    assert not _polylines_are_intersecting(line1, line2)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-vv"])
@@ -1,9 +1,17 @@
 # Copyright DB InfraGO AG and contributors
 # SPDX-License-Identifier: Apache-2.0
 
+import json
+
 import pytest
 
+from raillabel.json_format import JSONScene
+
 from raillabel_providerkit.validation import validate_schema, Issue, IssueType
+from raillabel_providerkit.validation.validate_schema.validate_schema import (
+    _parse_json,
+    _parse_scene,
+)
 
 
 def test_no_errors__empty():
@@ -224,5 +232,95 @@ def test_tuple_too_long():
     ]
 
 
+def test_parse_scene__valid():
+    data = {"openlabel": {"metadata": {"schema_version": "1.0.0"}}}
+
+    json_scene, errors = _parse_scene(data)
+    assert isinstance(json_scene, JSONScene)
+    assert errors == []
+
+
+def test_parse_scene__invalid():
+    data: dict = {"openlabel": {"metadata": {}}}
+
+    json_scene, errors = _parse_scene(data)
+    assert json_scene is None
+    assert errors == validate_schema(data)
+
+
+def test_parse_json__valid():
+    data = {"openlabel": {"metadata": {"schema_version": "1.0.0"}}}
+
+    json_scene, errors = _parse_json(json.dumps(data).encode(), JSONScene)
+    assert isinstance(json_scene, JSONScene)
+    assert errors == []
+
+
+def test_parse_json__same_errors_as_dict():
+    data = {
+        "openlabel": {
+            "metadata": {"schema_version": "1.0.0"},
+            "UNSUPPORTED_FIELD": {},
+            "objects": {"not-a-uuid": {"name": "banana_0001", "type": 42}},
+        }
+    }
+
+    json_scene, errors = _parse_json(json.dumps(data).encode(), JSONScene)
+    assert json_scene is None
+    assert len(errors) == 3
+    assert errors == validate_schema(data)
+
+
+@pytest.mark.parametrize(
+    ("field", "value", "expected_message"),
+    [
+        ("coordinate_systems", {"base": {"type": "local", "parent": "", "children": 5}}, "list"),
+        ("objects", 5, "dictionary"),
+        ("metadata", 5, "dictionary or instance of JSONMetadata"),
+        (
+            "coordinate_systems",
+            {"base": {"type": "local", "parent": "", "pose_wrt_parent": {"translation": 5}}},
+            "tuple",
+        ),
+    ],
+)
+def test_parse_json__same_messages_as_dict(field, value, expected_message):
+    data = {"openlabel": {"metadata": {"schema_version": "1.0.0"}, field: value}}
+
+    _, errors = _parse_json(json.dumps(data).encode(), JSONScene)
+    assert errors == validate_schema(data)
+    assert any(f"valid {expected_message}" in error.reason for error in errors)
+
+
+def test_parse_json__stream_and_sensor_unions_in_same_order_as_dict():
+    data = {
+        "openlabel": {
+            "metadata": {"schema_version": "1.0.0"},
+            "streams": {
+                "rgb_center": {
+                    "type": "camera",
+                    "uri": "/uri",
+                    "stream_properties": {"intrinsics_radar": {}},
+                }
+            },
+        }
+    }
+
+    _, errors = _parse_json(json.dumps(data).encode(), JSONScene)
+    assert len(errors) > 1
+    assert errors == validate_schema(data)
+
+
+def test_parse_json__location_prefix():
+    _, errors = _parse_json(b"5", JSONScene, ("openlabel", "frames", "1"))
+    assert errors[0].reason.startswith("{'type': 'model_type', 'loc': ['openlabel', 'frames', '1']")
+    assert "valid dictionary" in errors[0].reason
+
+
+def test_parse_json__invalid_json():
+    with pytest.raises(json.JSONDecodeError):
+        _parse_json(b'{"openlabel": ', JSONScene)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-vv"])